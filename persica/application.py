@@ -1,9 +1,12 @@
 import asyncio
+import inspect
 import platform
 import signal
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
 
+from persica.metrics.container import ContainerMetrics
 from persica.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -11,8 +14,10 @@ if TYPE_CHECKING:
     from logging import Logger
 
     from persica.context.application import ApplicationContext
+    from persica.context.reclaim import ReclaimReport
     from persica.factory.abstract import AbstractAutowireCapableFactory
     from persica.factory.registry import DefinitionRegistry
+    from persica.metrics.registry import MetricsRegistry
     from persica.scanner.path import ClassPathScanner
 
 _LOGGER = get_logger(__name__, "DefinitionRegistry")
@@ -28,14 +33,62 @@ class Application:
         registry: "DefinitionRegistry",
         context_class: type["ApplicationContext"],
         loop: "AbstractEventLoop | None" = None,
+        shutdown_timeout: float | None = None,
+        component_shutdown_timeout: float | None = None,
+        reclaim_after_startup: bool = False,
+        freeze_after_startup: bool = False,
+        metrics: "MetricsRegistry | None" = None,
+        background_task_concurrency: int | None = None,
+        background_task_stop_timeout: float = 5.0,
+        event_drain_timeout: float = 5.0,
     ) -> None:
         self.loop = loop or asyncio.get_event_loop()
         self.factory = factory
         self.class_scanner = class_scanner
         self.registry = registry
-        self.context = context_class(factory=self.factory, class_scanner=self.class_scanner, registry=self.registry)
+        self.context = context_class(
+            factory=self.factory,
+            class_scanner=self.class_scanner,
+            registry=self.registry,
+            shutdown_timeout=shutdown_timeout,
+            component_shutdown_timeout=component_shutdown_timeout,
+            background_task_concurrency=background_task_concurrency,
+            background_task_stop_timeout=background_task_stop_timeout,
+            event_drain_timeout=event_drain_timeout,
+        )
         self.factory.add_external_object(self.context)
         self.factory.add_external_object(self)
+        # 启用指标时，容器和应用上下文记录运行时指标，组件可以注入 MetricsRegistry 注册自己的指标
+        self.metrics = metrics
+        self.container_metrics: ContainerMetrics | None = None
+        if metrics is not None:
+            self.container_metrics = ContainerMetrics(metrics, self.factory)
+            self.factory.metrics = self.container_metrics
+            self.context.set_metrics(self.container_metrics)
+            self.factory.add_external_object(metrics)
+        # CRITICAL 层级的组件初始化完成后置位，后台组件可能仍在初始化
+        self._ready = asyncio.Event()
+        self._ready_callbacks: list[Callable[[], Any]] = []
+        # 就绪后添加的回调任务，保存引用避免任务在完成前被回收
+        self._ready_tasks: set[asyncio.Task] = set()
+        self.reclaim_after_startup = reclaim_after_startup
+        self.freeze_after_startup = freeze_after_startup
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait_ready(self) -> None:
+        await self._ready.wait()
+
+    def add_ready_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        添加应用就绪时的回调，支持同步函数和协程函数。应用已经就绪时回调会被立即调度到事件循环上执行。
+        """
+        if not self.is_ready:
+            self._ready_callbacks.append(callback)
+            return
+        self.loop.call_soon_threadsafe(self._schedule_ready_callback, callback)
 
     def run(self) -> None:
         self._logger.info("Application Run")
@@ -62,8 +115,38 @@ class Application:
     def _raise_system_exit() -> None:
         raise SystemExit
 
+    def complete_startup(self, keep_summary: bool = True, freeze: bool = False) -> "ReclaimReport":
+        return self.context.complete_startup(keep_summary=keep_summary, freeze=freeze)
+
     async def initialize(self) -> None:
+        start = time.perf_counter()
         await self.context.initialize()
+        if self.container_metrics is not None:
+            self.container_metrics.startup.set(time.perf_counter() - start)
+        self._mark_ready()
+        if self.reclaim_after_startup:
+            self.complete_startup(freeze=self.freeze_after_startup)
+
+    def _mark_ready(self) -> None:
+        self._ready.set()
+        self._logger.info("Application Ready")
+        # 与就绪后添加的回调一样调度到事件循环上执行，耗时的回调不会阻塞 initialize
+        for callback in self._ready_callbacks:
+            self._schedule_ready_callback(callback)
+        self._ready_callbacks.clear()
+
+    def _schedule_ready_callback(self, callback: Callable[[], Any]) -> None:
+        task = self.loop.create_task(self._run_ready_callback(callback))
+        self._ready_tasks.add(task)
+        task.add_done_callback(self._ready_tasks.discard)
+
+    async def _run_ready_callback(self, callback: Callable[[], Any]) -> None:
+        try:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self._logger.exception("Ready callback error", exc_info=e)
 
     async def shutdown(self) -> None:
         await self.context.shutdown()
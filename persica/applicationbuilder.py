@@ -4,6 +4,7 @@ from persica.application import Application
 from persica.context.application import ApplicationContext
 from persica.factory.abstract import AbstractAutowireCapableFactory
 from persica.factory.registry import DefinitionRegistry
+from persica.metrics.registry import MetricsRegistry
 from persica.scanner.path import ClassPathScanner
 
 if TYPE_CHECKING:
@@ -20,6 +21,16 @@ class ApplicationBuilder:
     def __init__(self):
         self._loop: AbstractEventLoop | None = None
         self._scanner_packages: list[str] = []
+        self._shutdown_timeout: float | None = None
+        self._component_shutdown_timeout: float | None = None
+        self._reclaim_after_startup: bool = False
+        self._profiles: list[str] | None = None
+        self._lazy_import: bool = False
+        self._freeze_after_startup: bool = False
+        self._metrics: MetricsRegistry | None = None
+        self._background_task_concurrency: int | None = None
+        self._background_task_stop_timeout: float = 5.0
+        self._event_drain_timeout: float = 5.0
 
     def set_application_context_class(self, _cls: type["ApplicationContext"]) -> Self:
         self._application_context_class = _cls
@@ -37,18 +48,75 @@ class ApplicationBuilder:
         self._scanner_packages.extend(packages)
         return self
 
+    def set_profiles(self, profiles: list[str]) -> Self:
+        self._profiles = profiles
+        return self
+
+    def set_lazy_import(self, lazy: bool = True) -> Self:
+        self._lazy_import = lazy
+        return self
+
+    def set_shutdown_timeout(self, timeout: float) -> Self:
+        self._shutdown_timeout = timeout
+        return self
+
+    def set_component_shutdown_timeout(self, timeout: float) -> Self:
+        self._component_shutdown_timeout = timeout
+        return self
+
+    def set_reclaim_after_startup(self, freeze: bool = False) -> Self:
+        self._reclaim_after_startup = True
+        self._freeze_after_startup = freeze
+        return self
+
+    def set_metrics(self, metrics: MetricsRegistry | None = None) -> Self:
+        """
+        启用运行时指标，未传入 MetricsRegistry 时创建一个新的注册表。
+        """
+        self._metrics = metrics or MetricsRegistry()
+        return self
+
+    def set_background_task_concurrency(self, limit: int) -> Self:
+        """
+        限制同时运行的后台任务数量。
+        """
+        self._background_task_concurrency = limit
+        return self
+
+    def set_background_task_stop_timeout(self, timeout: float) -> Self:
+        """
+        关闭时等待后台任务响应取消的时间（秒），同样受 shutdown_timeout 限制。
+        """
+        self._background_task_stop_timeout = timeout
+        return self
+
+    def set_event_drain_timeout(self, timeout: float) -> Self:
+        """
+        关闭时等待事件总线处理完队列中剩余事件的时间（秒），同样受 shutdown_timeout 限制。
+        """
+        self._event_drain_timeout = timeout
+        return self
+
     def build(self):
         if len(self._scanner_packages) == 0:
             raise RuntimeError("No scanner packages specified")
 
         factory = self._abstract_autowire_capable_factory_class()
         class_scanner = self._class_path_scanner_class(self._scanner_packages)
-        registry = self._definition_registry(factory, class_scanner)
+        registry = self._definition_registry(factory, class_scanner, profiles=self._profiles, lazy=self._lazy_import)
         application: Application = self._application_class(
             factory=factory,
             class_scanner=class_scanner,
             registry=registry,
             context_class=self._application_context_class,
             loop=self._loop,
+            shutdown_timeout=self._shutdown_timeout,
+            component_shutdown_timeout=self._component_shutdown_timeout,
+            reclaim_after_startup=self._reclaim_after_startup,
+            freeze_after_startup=self._freeze_after_startup,
+            metrics=self._metrics,
+            background_task_concurrency=self._background_task_concurrency,
+            background_task_stop_timeout=self._background_task_stop_timeout,
+            event_drain_timeout=self._event_drain_timeout,
         )
         return application
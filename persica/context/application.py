@@ -1,20 +1,32 @@
 import asyncio
+import contextvars
+import time
 from collections import defaultdict
 from collections.abc import Callable, Coroutine
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
-from persica.factory.component import AsyncInitializingComponent
+from persica.context.bus import EventBus, get_subscriptions
+from persica.context.reclaim import StartupReclaimer
+from persica.context.shutdown import ShutdownEngine
+from persica.context.supervisor import TaskSupervisor, get_background_tasks
+from persica.factory.component import DEFAULT_ORDER, AsyncInitializingComponent, StartupTier
 from persica.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from logging import Logger
 
+    from persica.context.reclaim import ReclaimReport
+    from persica.context.shutdown import ShutdownReport
     from persica.factory.abstract import AbstractAutowireCapableFactory
     from persica.factory.registry import DefinitionRegistry
+    from persica.metrics.container import ContainerMetrics
     from persica.scanner.path import ClassPathScanner
 
 _LOGGER = get_logger(__name__, "DefinitionRegistry")
 
+# 当前任务所属的组件处理链，在组件 initialize 中创建的对象，其处理任务会继承该链
+_ACTIVATING: contextvars.ContextVar[tuple[type[object], ...]] = contextvars.ContextVar("persica_activating", default=())
+
 
 class ApplicationContext:
     _logger: "Logger" = _LOGGER
@@ -24,10 +36,39 @@ class ApplicationContext:
         factory: "AbstractAutowireCapableFactory",
         class_scanner: "ClassPathScanner",
         registry: "DefinitionRegistry",
+        shutdown_timeout: float | None = None,
+        component_shutdown_timeout: float | None = None,
+        background_task_concurrency: int | None = None,
+        background_task_stop_timeout: float = 5.0,
+        event_drain_timeout: float = 5.0,
     ):
         self.class_scanner = class_scanner
         self.factory = factory
         self.registry = registry
+        self.shutdown_timeout = shutdown_timeout
+        self.component_shutdown_timeout = component_shutdown_timeout
+        # 后台初始化任务，由 BACKGROUND 层级的组件组成
+        self.background_task: asyncio.Task | None = None
+        # 启动完成后保留的扫描结果摘要
+        self.startup_summary: dict[str, Any] | None = None
+        # 运行时指标，未启用时为 None
+        self.metrics: ContainerMetrics | None = None
+        # 组件声明的后台任务在组件初始化完成后由监督器启动
+        self.supervisor = TaskSupervisor(
+            max_concurrency=background_task_concurrency, stop_timeout=background_task_stop_timeout
+        )
+        # 组件之间的事件总线，作为外部对象注入到发布方
+        self.bus = EventBus(drain_timeout=event_drain_timeout)
+        self.factory.add_external_object(self.bus)
+        # 启动完成后新创建的单例（例如延迟导入的组件）的处理任务，key 为对象的类，完成后移除
+        self.activation_tasks: dict[type[object], asyncio.Task] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def set_metrics(self, metrics: "ContainerMetrics | None"):
+        self.metrics = metrics
+        self.supervisor.metrics = metrics
+        if metrics is not None:
+            metrics.add_event_bus(self.bus)
 
     def run(self):
         self.__run()
@@ -37,28 +78,167 @@ class ApplicationContext:
         self.registry.flash()
         self.factory.instantiate_all_objects()
 
+    def complete_startup(self, keep_summary: bool = True, freeze: bool = False) -> "ReclaimReport":
+        """
+        标记启动完成，释放扫描期数据并执行垃圾回收，freeze 为 True 时冻结当前存活的对象。
+        """
+        reclaimer = StartupReclaimer(factory=self.factory, class_scanner=self.class_scanner, registry=self.registry)
+        report = reclaimer.reclaim(keep_summary=keep_summary, freeze=freeze)
+        self.startup_summary = report.summary
+        return report
+
     async def initialize(self):
-        await self._process_components("initialize")
+        """
+        初始化组件。CRITICAL 层级的组件及其依赖在返回前完成初始化，
+        BACKGROUND 层级的组件在后台任务中继续初始化。
+        """
+        # 先在事件循环上完成需要异步构造的对象，再初始化组件
+        await self.factory.instantiate_deferred_objects()
+        # 预热对象池
+        await asyncio.gather(*(pool.warm() for pool in self.factory.pools.values()))
+        # 没有 initialize 方法的单例创建后即可处理事件，其他组件在初始化成功后才订阅
+        self.bus.start()
+        components = [
+            obj for obj in self.factory.singleton_objects.values() if not isinstance(obj, AsyncInitializingComponent)
+        ]
+        self.bus.add_components(components)
+        critical, background = self._split_components_by_tier()
+        # 之后新创建的单例不在上面的快照中，由工厂在创建后通知上下文处理
+        self._loop = asyncio.get_running_loop()
+        self.factory.activation_hook = self._activate_later
+        await self._initialize_components(critical)
+        # 没有 initialize 方法的单例直接启动后台任务
+        for obj in components:
+            self.supervisor.start_component(obj)
+        if background:
+            self._logger.info("Initializing %s background components", len(background))
+            self.background_task = asyncio.create_task(self._initialize_components(background))
+            self.background_task.add_done_callback(self._on_background_done)
 
-    async def shutdown(self) -> None:
-        await self._process_components("shutdown")
+    async def wait_background(self):
+        """
+        等待后台初始化完成。
+        """
+        if self.background_task is not None:
+            await asyncio.shield(self.background_task)
 
-    async def _process_components(self, method_name: str):
-        components_by_order = defaultdict(list)
+    async def shutdown(self) -> "ShutdownReport":
+        # 整个关闭过程共用 shutdown_timeout，关闭组件只能使用前面步骤剩余的时间
+        loop = asyncio.get_running_loop()
+        deadline = None if self.shutdown_timeout is None else loop.time() + self.shutdown_timeout
 
-        for component_dict in [self.factory.singleton_factories, self.factory.singleton_objects]:
-            for value in component_dict.values():
-                if isinstance(value, AsyncInitializingComponent):
-                    method = getattr(value, method_name, None)
-                    if method:
-                        components_by_order[value.__order__].append(self._run_async(method))
+        def remaining() -> float | None:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        # 关闭前取消尚未完成的后台初始化和新建单例的处理
+        self.factory.activation_hook = None
+        pending = list(self.activation_tasks.values())
+        if self.background_task is not None and not self.background_task.done():
+            pending.append(self.background_task)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _, ignored = await asyncio.wait(pending, timeout=remaining())
+            if ignored:
+                self._logger.warning("%s initialization tasks did not respond to cancellation", len(ignored))
+        # 后台任务可能仍在使用组件，先于组件关闭
+        await self.supervisor.stop(remaining())
+        await self.bus.stop(remaining())
+        engine = ShutdownEngine(self.factory, timeout=remaining(), component_timeout=self.component_shutdown_timeout)
+        # 对象池由关闭引擎按依赖顺序关闭
+        report = await engine.run()
+        if self.metrics is not None:
+            self.metrics.observe_shutdown(report)
+        for record in report.stragglers:
+            self._logger.warning("Shutdown straggler: %s", record)
+        return report
+
+    def _split_components_by_tier(
+        self,
+    ) -> tuple[list[AsyncInitializingComponent], list[AsyncInitializingComponent]]:
+        """
+        按启动层级划分组件，被 CRITICAL 组件依赖的组件同样视为 CRITICAL。
+        """
+        components = self.factory.get_singletons_of_type(AsyncInitializingComponent)
+        critical_classes = {key for key, value in components.items() if value.__startup_tier__ is StartupTier.CRITICAL}
+        for key in list(critical_classes):
+            critical_classes.update(self.factory.get_all_dependencies(key) & components.keys())
+        critical = [value for key, value in components.items() if key in critical_classes]
+        background = [value for key, value in components.items() if key not in critical_classes]
+        return critical, background
+
+    async def _initialize_components(self, components: list[AsyncInitializingComponent]):
+        components_by_order = defaultdict(list)
+        for component in components:
+            components_by_order[component.__order__].append(component)
 
         for order in sorted(components_by_order.keys()):
-            tasks = components_by_order[order]
-            await asyncio.gather(*tasks)
+            await asyncio.gather(*(self._initialize_component(component) for component in components_by_order[order]))
+
+    async def _initialize_component(self, component: AsyncInitializingComponent):
+        start = time.perf_counter()
+        succeeded = await self._run_async(component.initialize)
+        if self.metrics is not None:
+            self.metrics.observe_initialize(component, time.perf_counter() - start, succeeded)
+        if succeeded:
+            self.bus.add_component(component)
+            self.supervisor.start_component(component)
+        elif get_background_tasks(type(component)) or get_subscriptions(type(component)):
+            self._logger.warning(
+                "Background tasks and subscriptions of %s not started because initialize failed",
+                type(component).__name__,
+            )
+
+    def _activate_later(self, cls: type[object], obj: object) -> "asyncio.Future[None] | None":
+        """
+        启动完成后新创建的单例与启动时一样完成初始化、事件订阅和后台任务启动。
+        在事件循环所在的线程中调用时返回处理任务，其他线程中调用时提交到事件循环并返回 None。
+        """
+        loop = cast("asyncio.AbstractEventLoop", self._loop)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            return self._schedule_activation(cls, obj)
+        loop.call_soon_threadsafe(self._schedule_activation, cls, obj)
+        return None
+
+    def _schedule_activation(self, cls: type[object], obj: object) -> asyncio.Task:
+        task = asyncio.ensure_future(self._activate_component(cls, obj), loop=self._loop)
+        self.activation_tasks[cls] = task
+        task.add_done_callback(lambda _: self.activation_tasks.pop(cls, None))
+        return task
+
+    async def _activate_component(self, cls: type[object], obj: object):
+        # 与启动时按加载顺序分批初始化一致，先等待加载顺序更小的组件。
+        # 处理链上的组件正在等待当前对象创建完成（例如在 initialize 中获取当前对象），不能等待它们
+        chain = _ACTIVATING.get()
+        _ACTIVATING.set((*chain, cls))
+        order = getattr(obj, "__order__", DEFAULT_ORDER)
+        earlier = [
+            task
+            for key, task in self.activation_tasks.items()
+            if key is not cls and key not in chain and getattr(key, "__order__", DEFAULT_ORDER) < order
+        ]
+        if earlier:
+            await asyncio.wait(earlier)
+        if isinstance(obj, AsyncInitializingComponent):
+            await self._initialize_component(obj)
+        else:
+            self.bus.add_component(obj)
+            self.supervisor.start_component(obj)
+
+    def _on_background_done(self, task: asyncio.Task):
+        if task.cancelled():
+            self._logger.warning("Background initialization cancelled")
+        else:
+            self._logger.info("Background initialization finished")
 
-    async def _run_async(self, func: Callable[..., Coroutine[Any, Any, Any]]):
+    async def _run_async(self, func: Callable[..., Coroutine[Any, Any, Any]]) -> bool:
         try:
             await func()
         except Exception as e:
             self._logger.exception("Run Error", exc_info=e)
+            return False
+        return True
@@ -0,0 +1,279 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+_LOGGER = get_logger(__name__, "EventBus")
+
+F = TypeVar("F", bound=Callable[..., Coroutine[Any, Any, Any]])
+
+# 订阅声明存放在方法上的属性名
+SUBSCRIPTION_ATTRIBUTE = "__persica_subscriptions__"
+
+
+class SubscriptionSpec:
+    """
+    处理方法声明的订阅。batch_size 大于 1 时处理方法接收事件列表，
+    队列中的事件会被立即合并，不足 batch_size 时最多等待 batch_timeout 秒。
+    """
+
+    def __init__(
+        self,
+        topic: Hashable,
+        batch_size: int = 1,
+        batch_timeout: float = 0.0,
+        queue_size: int | None = None,
+        concurrency: int = 1,
+    ):
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("batch_size and concurrency must be positive")
+        self.topic = topic
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        # 队列容量，None 表示使用 EventBus 的默认容量
+        self.queue_size = queue_size
+        # 同时处理事件的协程数量
+        self.concurrency = concurrency
+
+
+def subscribe(
+    topic: Hashable,
+    *,
+    batch_size: int = 1,
+    batch_timeout: float = 0.0,
+    queue_size: int | None = None,
+    concurrency: int = 1,
+) -> Callable[[F], F]:
+    """
+    将组件的协程方法声明为事件处理方法，同一个方法可以订阅多个主题：
+
+        class Audit(BaseComponent):
+            @subscribe("orders", batch_size=100, batch_timeout=0.5)
+            async def on_orders(self, events: list[Order]): ...
+    """
+    spec = SubscriptionSpec(
+        topic, batch_size=batch_size, batch_timeout=batch_timeout, queue_size=queue_size, concurrency=concurrency
+    )
+
+    def decorator(function: F) -> F:
+        specs = getattr(function, SUBSCRIPTION_ATTRIBUTE, ())
+        setattr(function, SUBSCRIPTION_ATTRIBUTE, (*specs, spec))
+        return function
+
+    return decorator
+
+
+def get_subscriptions(_class: type[object]) -> dict[str, tuple[SubscriptionSpec, ...]]:
+    """
+    获取类及其父类声明的事件处理方法，子类重写的方法覆盖父类的声明。
+    """
+    result: dict[str, tuple[SubscriptionSpec, ...]] = {}
+    seen: set[str] = set()
+    for klass in _class.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            specs = getattr(value, SUBSCRIPTION_ATTRIBUTE, None)
+            if specs:
+                result[name] = specs
+    return result
+
+
+class Subscription:
+    """
+    一个处理方法对一个主题的订阅，持有独立的有界队列和处理协程。
+    """
+
+    def __init__(
+        self, name: str, handler: Callable[[Any], Coroutine[Any, Any, Any]], spec: SubscriptionSpec, queue_size: int
+    ):
+        self.name = name
+        self.handler = handler
+        self.spec = spec
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.workers: list[asyncio.Task] = []
+        # 已处理的事件数量、处理失败的事件数量和调用处理方法的次数
+        self.handled: int = 0
+        self.failures: int = 0
+        self.batches: int = 0
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+
+class TopicStats:
+    def __init__(self):
+        self.published: int = 0
+
+
+class EventBus:
+    """
+    进程内的异步事件总线，由 ApplicationContext 创建并作为外部对象注入。
+
+    组件初始化成功后注册其声明的处理方法，发布事件时只需一次字典查找，
+    再将事件放入每个订阅的有界队列。队列已满时 publish 会等待，实现背压。
+    发布到没有订阅的主题的事件会被丢弃。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(self, queue_size: int = 1024, drain_timeout: float = 5.0):
+        # 订阅没有声明 queue_size 时的队列容量
+        self.queue_size = queue_size
+        # 关闭时等待队列中剩余事件处理完成的时间（秒）
+        self.drain_timeout = drain_timeout
+        self.subscriptions: list[Subscription] = []
+        # 只记录有订阅的主题，没有订阅的主题只累计到 unrouted，避免统计随主题数量无限增长
+        self.topics: dict[Hashable, TopicStats] = {}
+        # 发布到没有订阅的主题而被丢弃的事件数量
+        self.unrouted: int = 0
+        # 分发表，key 为主题，value 为该主题的所有订阅
+        self._routes: dict[Hashable, tuple[Subscription, ...]] = {}
+        self._started = False
+
+    def add_subscription(
+        self, name: str, handler: Callable[[Any], Coroutine[Any, Any, Any]], spec: SubscriptionSpec
+    ) -> Subscription:
+        subscription = Subscription(name, handler, spec, spec.queue_size or self.queue_size)
+        self.subscriptions.append(subscription)
+        self._routes[spec.topic] = (*self._routes.get(spec.topic, ()), subscription)
+        self.topics.setdefault(spec.topic, TopicStats())
+        if self._started:
+            self._start_workers(subscription)
+        return subscription
+
+    def add_component(self, component: object) -> list[Subscription]:
+        """
+        注册组件声明的所有处理方法，订阅名称为 `模块.类名.方法名`，与后台任务的命名一致。
+        """
+        cls = type(component)
+        return [
+            self.add_subscription(f"{cls.__module__}.{cls.__qualname__}.{name}", getattr(component, name), spec)
+            for name, specs in get_subscriptions(cls).items()
+            for spec in specs
+        ]
+
+    def add_components(self, components: Iterable[object]):
+        for component in components:
+            self.add_component(component)
+
+    async def publish(self, topic: Hashable, event: Any):
+        """
+        发布事件，事件进入所有订阅的队列后返回。队列已满时等待处理方法消费。
+        """
+        subscriptions = self._routes.get(topic)
+        if not subscriptions:
+            self.unrouted += 1
+            return
+        self.topics[topic].published += 1
+        blocked = []
+        for subscription in subscriptions:
+            if subscription.queue.full():
+                blocked.append(subscription.queue.put(event))
+            else:
+                subscription.queue.put_nowait(event)
+        if blocked:
+            await asyncio.gather(*blocked)
+
+    def publish_nowait(self, topic: Hashable, event: Any):
+        """
+        发布事件，任一订阅的队列已满时抛出 asyncio.QueueFull，此时事件不会进入任何队列。
+        """
+        subscriptions = self._routes.get(topic)
+        if not subscriptions:
+            self.unrouted += 1
+            return
+        if any(subscription.queue.full() for subscription in subscriptions):
+            raise asyncio.QueueFull
+        self.topics[topic].published += 1
+        for subscription in subscriptions:
+            subscription.queue.put_nowait(event)
+
+    def get_queue_depth(self, topic: Hashable) -> int:
+        return sum(subscription.depth for subscription in self._routes.get(topic, ()))
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        for subscription in self.subscriptions:
+            self._start_workers(subscription)
+
+    async def stop(self, timeout: float | None = None):
+        """
+        等待队列中剩余的事件处理完成，超过 drain_timeout 后取消处理协程。
+        timeout 为调用方剩余的关闭时间，排空时间不会超过它。
+        """
+        timeout = self.drain_timeout if timeout is None else min(timeout, self.drain_timeout)
+        if not self._started:
+            return
+        self._started = False
+        joins = [asyncio.ensure_future(subscription.queue.join()) for subscription in self.subscriptions]
+        if joins:
+            _, pending = await asyncio.wait(joins, timeout=timeout)
+            for join in pending:
+                join.cancel()
+            if pending:
+                self._logger.warning("%s subscriptions still had queued events after draining", len(pending))
+        workers = [worker for subscription in self.subscriptions for worker in subscription.workers]
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.wait(workers)
+        for subscription in self.subscriptions:
+            subscription.workers.clear()
+
+    def _start_workers(self, subscription: Subscription):
+        for index in range(subscription.spec.concurrency):
+            subscription.workers.append(
+                asyncio.create_task(self._work(subscription), name=f"{subscription.name}#{index}")
+            )
+
+    async def _work(self, subscription: Subscription):
+        queue = subscription.queue
+        batch_size = subscription.spec.batch_size
+        while True:
+            event = await queue.get()
+            if batch_size == 1:
+                await self._dispatch(subscription, event, 1)
+                queue.task_done()
+                continue
+            batch = await self._collect_batch(subscription, event)
+            await self._dispatch(subscription, batch, len(batch))
+            for _ in batch:
+                queue.task_done()
+
+    @staticmethod
+    async def _collect_batch(subscription: Subscription, first: Any) -> list[Any]:
+        queue = subscription.queue
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + subscription.spec.batch_timeout
+        while len(batch) < subscription.spec.batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch(self, subscription: Subscription, payload: Any, count: int):
+        subscription.batches += 1
+        try:
+            await subscription.handler(payload)
+        except Exception as exc:
+            subscription.failures += count
+            self._logger.exception("Event handler %s failed", subscription.name, exc_info=exc)
+        else:
+            subscription.handled += count
@@ -0,0 +1,106 @@
+import gc
+from typing import TYPE_CHECKING, Any
+
+from persica.utils.logging import get_logger
+from persica.utils.memory import get_rss
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from persica.factory.abstract import AbstractAutowireCapableFactory
+    from persica.factory.registry import DefinitionRegistry
+    from persica.scanner.path import ClassPathScanner
+
+_LOGGER = get_logger(__name__, "StartupReclaimer")
+
+
+class ReclaimReport:
+    """
+    启动完成后释放扫描期数据的结果。
+    """
+
+    def __init__(
+        self,
+        rss_before: int | None,
+        rss_after: int | None,
+        objects_before: int,
+        objects_after: int,
+        collected: int,
+        frozen: int | None = None,
+        summary: dict[str, Any] | None = None,
+    ):
+        self.rss_before = rss_before
+        self.rss_after = rss_after
+        self.objects_before = objects_before
+        self.objects_after = objects_after
+        # gc.collect 回收的不可达对象数量
+        self.collected = collected
+        # gc.freeze 后移入永久代的对象数量，未冻结时为 None
+        self.frozen = frozen
+        # 保留的扫描结果摘要，不保留时为 None
+        self.summary = summary
+
+    @property
+    def rss_delta(self) -> int | None:
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    @property
+    def objects_delta(self) -> int:
+        return self.objects_after - self.objects_before
+
+    def __str__(self):
+        rss = "unknown" if self.rss_delta is None else f"{self.rss_delta / 1024:+.1f} KiB"
+        result = f"Startup reclaim: rss {rss}, objects {self.objects_delta:+d}, collected {self.collected}"
+        if self.frozen is not None:
+            result += f", frozen {self.frozen}"
+        return result
+
+
+class StartupReclaimer:
+    """
+    在启动完成后释放扫描器、注册表和工厂中只在启动期间使用的数据，执行一次完整的垃圾回收，
+    并可选地调用 gc.freeze 将存活对象移出分代回收，减少之后的 GC 停顿。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(
+        self,
+        factory: "AbstractAutowireCapableFactory",
+        class_scanner: "ClassPathScanner",
+        registry: "DefinitionRegistry",
+    ):
+        self.factory = factory
+        self.class_scanner = class_scanner
+        self.registry = registry
+
+    def reclaim(self, keep_summary: bool = True, freeze: bool = False) -> ReclaimReport:
+        rss_before = get_rss()
+        objects_before = len(gc.get_objects())
+        summary = self.class_scanner.class_graph.summary() if keep_summary else None
+
+        self.class_scanner.release()
+        self.registry.release()
+        self.factory.release_startup_state()
+
+        collected = gc.collect()
+        # 冻结后的对象不再出现在 gc.get_objects 中，需要在冻结前统计
+        objects_after = len(gc.get_objects())
+        frozen = None
+        if freeze:
+            gc.freeze()
+            frozen = gc.get_freeze_count()
+
+        report = ReclaimReport(
+            rss_before=rss_before,
+            rss_after=get_rss(),
+            objects_before=objects_before,
+            objects_after=objects_after,
+            collected=collected,
+            frozen=frozen,
+            summary=summary,
+        )
+        self._logger.info("%s", report)
+        return report
@@ -0,0 +1,216 @@
+import asyncio
+from enum import Enum
+from typing import TYPE_CHECKING, cast
+
+import networkx as nx
+
+from persica.factory.component import DEFAULT_ORDER, AsyncInitializingComponent
+from persica.factory.pool import ObjectPool
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from persica.factory.abstract import AbstractAutowireCapableFactory
+
+_LOGGER = get_logger(__name__, "ShutdownEngine")
+
+
+class ShutdownStatus(Enum):
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
+
+
+class ShutdownRecord:
+    """
+    单个组件的关闭结果。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        status: ShutdownStatus,
+        elapsed: float,
+        timeout: float | None = None,
+        error: BaseException | None = None,
+    ):
+        self.name = name
+        self.status = status
+        # 从组件自身的 shutdown 开始计时，不包含等待其他组件关闭的时间
+        self.elapsed = elapsed
+        self.timeout = timeout
+        self.error = error
+
+    @property
+    def overrun(self) -> float:
+        """shutdown 运行时间超出组件自身预算的部分（秒），没有预算或未超出时为 0"""
+        if self.timeout is None:
+            return 0.0
+        return max(0.0, self.elapsed - self.timeout)
+
+    def __str__(self):
+        if self.status is ShutdownStatus.TIMEOUT:
+            return f"{self.name} exceeded its {self.timeout:.3f}s budget (cancelled after {self.elapsed:.3f}s)"
+        if self.status is ShutdownStatus.CANCELLED:
+            budget = "no budget" if self.timeout is None else f"{self.timeout:.3f}s budget"
+            return f"{self.name} cancelled by the global deadline after {self.elapsed:.3f}s ({budget})"
+        if self.status is ShutdownStatus.FAILED:
+            return f"{self.name} failed after {self.elapsed:.3f}s: {self.error!r}"
+        return f"{self.name} completed in {self.elapsed:.3f}s"
+
+
+class ShutdownReport:
+    """
+    一次关闭的汇总结果。
+    """
+
+    def __init__(self, records: list[ShutdownRecord], elapsed: float, timeout: float | None = None):
+        self.records = records
+        self.elapsed = elapsed
+        self.timeout = timeout
+
+    @property
+    def stragglers(self) -> list[ShutdownRecord]:
+        """超出单组件预算或被全局截止时间取消的组件"""
+        return [
+            record for record in self.records if record.status in (ShutdownStatus.TIMEOUT, ShutdownStatus.CANCELLED)
+        ]
+
+    @property
+    def failed(self) -> list[ShutdownRecord]:
+        return [record for record in self.records if record.status is ShutdownStatus.FAILED]
+
+    def __str__(self):
+        summary = f"Shutdown of {len(self.records)} components finished in {self.elapsed:.3f}s"
+        stragglers = self.stragglers
+        if stragglers:
+            summary += f", stragglers: {'; '.join(str(record) for record in stragglers)}"
+        return summary
+
+
+class ShutdownEngine:
+    """
+    按依赖关系的逆序并发关闭组件：依赖方先于被依赖方关闭，order 较大的组件先于 order 较小的组件关闭，
+    相互之间没有约束的组件同时关闭。对象池作为池化类的节点参与排序，关闭对象池时关闭其中的对象。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(
+        self,
+        factory: "AbstractAutowireCapableFactory",
+        timeout: float | None = None,
+        component_timeout: float | None = None,
+        cancel_grace: float = 1.0,
+    ):
+        self.factory = factory
+        # 全局截止时间（秒），超时后仍未完成的组件会被取消
+        self.timeout = timeout
+        # 组件未声明 shutdown_timeout 时使用的默认预算（秒）
+        self.component_timeout = component_timeout
+        # 取消后等待组件响应取消的时间，避免忽略取消的组件阻塞退出
+        self.cancel_grace = cancel_grace
+
+    def build_graph(self, components: dict[type[object], object]) -> nx.DiGraph:
+        """
+        构建关闭顺序图，边 A -> B 表示 A 需要先于 B 关闭。components 的 key 为组件或池化的类。
+        """
+        graph = nx.DiGraph()
+        graph.add_nodes_from(components)
+        # 依赖关系：经过非组件对象的间接依赖同样需要保证顺序
+        for cls in components:
+            for dependency in self._find_component_dependencies(cls, components):
+                graph.add_edge(cls, dependency)
+        # 加载顺序：order 较大的先关闭，与依赖关系矛盾时以依赖关系为准。
+        # 一次拓扑排序得到满足依赖关系且优先排列 order 较大组件的顺序，只添加与该顺序一致的边，不会产生环
+        position = {
+            cls: index
+            for index, cls in enumerate(nx.lexicographical_topological_sort(graph, key=lambda x: -self._get_order(x)))
+        }
+        ordered = sorted(components, key=self._get_order, reverse=True)
+        for index, higher in enumerate(ordered):
+            for lower in ordered[index + 1 :]:
+                if self._get_order(higher) != self._get_order(lower) and position[higher] < position[lower]:
+                    graph.add_edge(higher, lower)
+        return graph
+
+    @staticmethod
+    def _get_order(_class: type[object]) -> int:
+        return getattr(_class, "__order__", DEFAULT_ORDER)
+
+    def _find_component_dependencies(
+        self, cls: type[object], components: dict[type[object], object]
+    ) -> set[type[object]]:
+        return {dependency for dependency in self.factory.get_all_dependencies(cls) if dependency in components}
+
+    def get_component_timeout(self, _class: type[object]) -> float | None:
+        timeout = getattr(_class, "__shutdown_timeout__", None)
+        if timeout is not None:
+            return timeout
+        return self.component_timeout
+
+    @staticmethod
+    def _get_name(_class: type[object], target: object) -> str:
+        if isinstance(target, ObjectPool):
+            return f"ObjectPool[{_class.__name__}]"
+        return _class.__name__
+
+    async def run(self) -> ShutdownReport:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        components: dict[type[object], object] = {
+            **self.factory.get_singletons_of_type(AsyncInitializingComponent),
+            **self.factory.pools,
+        }
+        graph = self.build_graph(components)
+        finished = {cls: asyncio.Event() for cls in components}
+        records: dict[type[object], ShutdownRecord] = {}
+        # 每个组件 shutdown 开始的时间
+        started_at: dict[type[object], float] = {}
+
+        async def shutdown_component(cls: type[object]):
+            target = components[cls]
+            name = self._get_name(cls, target)
+            timeout = self.get_component_timeout(cls)
+            started: float | None = None
+            try:
+                for predecessor in graph.predecessors(cls):
+                    await finished[predecessor].wait()
+                started = started_at[cls] = loop.time()
+                if isinstance(target, ObjectPool):
+                    await asyncio.wait_for(target.close(), timeout)
+                else:
+                    await asyncio.wait_for(cast("AsyncInitializingComponent", target).shutdown(), timeout)
+                records[cls] = ShutdownRecord(name, ShutdownStatus.COMPLETED, loop.time() - started, timeout)
+            except asyncio.TimeoutError:
+                records[cls] = ShutdownRecord(name, ShutdownStatus.TIMEOUT, loop.time() - started, timeout)
+            except asyncio.CancelledError:
+                elapsed = 0.0 if started is None else loop.time() - started
+                records[cls] = ShutdownRecord(name, ShutdownStatus.CANCELLED, elapsed, timeout)
+                raise
+            except Exception as exc:
+                self._logger.exception("Shutdown Error", exc_info=exc)
+                records[cls] = ShutdownRecord(
+                    name, ShutdownStatus.FAILED, loop.time() - (started or start), timeout, exc
+                )
+            finally:
+                finished[cls].set()
+
+        tasks = [asyncio.create_task(shutdown_component(cls)) for cls in nx.topological_sort(graph)]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.timeout)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.wait(pending, timeout=self.cancel_grace)
+        for cls, target in components.items():
+            # 忽略取消请求的组件不会记录结果，按被取消处理，耗时从组件自身开始关闭时计算
+            if cls not in records:
+                timeout = self.get_component_timeout(cls)
+                elapsed = loop.time() - started_at[cls] if cls in started_at else 0.0
+                records[cls] = ShutdownRecord(self._get_name(cls, target), ShutdownStatus.CANCELLED, elapsed, timeout)
+        report = ShutdownReport([records[cls] for cls in components], loop.time() - start, self.timeout)
+        self._logger.info("%s", report)
+        return report
@@ -0,0 +1,324 @@
+import asyncio
+from collections.abc import Callable, Coroutine
+from enum import Enum
+from typing import TYPE_CHECKING, Any, TypeVar, overload
+
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from persica.metrics.container import ContainerMetrics
+
+_LOGGER = get_logger(__name__, "TaskSupervisor")
+
+F = TypeVar("F", bound=Callable[..., Coroutine[Any, Any, Any]])
+
+# 后台任务声明存放在方法上的属性名
+BACKGROUND_TASK_ATTRIBUTE = "__persica_background_task__"
+
+
+class RestartPolicy(Enum):
+    # 任务结束或失败后都不重启
+    NEVER = "never"
+    # 任务抛出异常时重启
+    ON_FAILURE = "on_failure"
+    # 任务正常结束或抛出异常时都重启
+    ALWAYS = "always"
+
+
+class TaskState(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    BACKING_OFF = "backing_off"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class Backoff:
+    """
+    指数退避：第 n 次连续失败后等待 initial * factor ** (n - 1) 秒，不超过 maximum。
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 30.0, factor: float = 2.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+
+    def get_delay(self, failures: int) -> float:
+        if failures <= 0:
+            return 0.0
+        return min(self.maximum, self.initial * self.factor ** (failures - 1))
+
+
+class BackgroundTaskSpec:
+    """
+    组件方法声明的后台任务。interval 为 None 时协程只运行一次，通常是长期运行的循环；
+    否则每隔 interval 秒调用一次协程，适合轮询。
+    """
+
+    def __init__(
+        self,
+        restart: RestartPolicy = RestartPolicy.ON_FAILURE,
+        max_restarts: int | None = None,
+        backoff: Backoff | None = None,
+        interval: float | None = None,
+    ):
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.backoff = backoff or Backoff()
+        self.interval = interval
+
+
+@overload
+def background_task(func: F) -> F: ...
+
+
+@overload
+def background_task(
+    func: None = None,
+    *,
+    restart: RestartPolicy | str = RestartPolicy.ON_FAILURE,
+    max_restarts: int | None = None,
+    backoff: Backoff | None = None,
+    interval: float | None = None,
+) -> Callable[[F], F]: ...
+
+
+def background_task(
+    func: F | None = None,
+    *,
+    restart: RestartPolicy | str = RestartPolicy.ON_FAILURE,
+    max_restarts: int | None = None,
+    backoff: Backoff | None = None,
+    interval: float | None = None,
+) -> F | Callable[[F], F]:
+    """
+    将组件的协程方法声明为后台任务，组件初始化完成后由 TaskSupervisor 启动，应用关闭时取消：
+
+        class Consumer(AsyncInitializingComponent):
+            @background_task(restart="on_failure", backoff=Backoff(initial=1))
+            async def consume(self): ...
+
+            @background_task(interval=5)
+            async def poll(self): ...
+    """
+    spec = BackgroundTaskSpec(
+        restart=RestartPolicy(restart), max_restarts=max_restarts, backoff=backoff, interval=interval
+    )
+
+    def decorator(function: F) -> F:
+        setattr(function, BACKGROUND_TASK_ATTRIBUTE, spec)
+        return function
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def get_background_tasks(_class: type[object]) -> dict[str, BackgroundTaskSpec]:
+    """
+    获取类及其父类声明的后台任务，子类重写的方法覆盖父类的声明。
+    """
+    result: dict[str, BackgroundTaskSpec] = {}
+    seen: set[str] = set()
+    for klass in _class.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            spec = getattr(value, BACKGROUND_TASK_ATTRIBUTE, None)
+            if isinstance(spec, BackgroundTaskSpec):
+                result[name] = spec
+    return result
+
+
+class TaskStats:
+    """
+    单个后台任务的运行统计。
+    """
+
+    def __init__(self):
+        self.state: TaskState = TaskState.PENDING
+        # 协程被调用的次数，interval 任务每个周期计一次
+        self.runs: int = 0
+        self.failures: int = 0
+        self.restarts: int = 0
+        self.last_error: BaseException | None = None
+        # 最近一次运行的耗时（秒）
+        self.last_duration: float = 0.0
+        # 计划开始时间与实际开始时间的差值（秒），包含等待并发名额的时间
+        self.last_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+
+class SupervisedTask:
+    def __init__(
+        self,
+        name: str,
+        function: Callable[[], Coroutine[Any, Any, Any]],
+        spec: BackgroundTaskSpec,
+    ):
+        self.name = name
+        self.function = function
+        self.spec = spec
+        self.stats = TaskStats()
+        self.task: asyncio.Task | None = None
+
+
+class TaskSupervisor:
+    """
+    后台任务监督器。按 RestartPolicy 和退避策略重启失败的任务，通过信号量限制同时执行的周期任务数量，
+    记录每个任务的运行耗时和调度延迟，并在关闭时统一取消。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        stop_timeout: float = 5.0,
+        metrics: "ContainerMetrics | None" = None,
+    ):
+        # 同时运行的周期任务数量上限，None 表示不限制；interval 为 None 的任务不计入
+        self.max_concurrency = max_concurrency
+        # 取消后等待任务退出的时间（秒）
+        self.stop_timeout = stop_timeout
+        self.metrics = metrics
+        self.tasks: dict[str, SupervisedTask] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+        self._stopping = False
+
+    def add(
+        self, name: str, function: Callable[[], Coroutine[Any, Any, Any]], spec: BackgroundTaskSpec
+    ) -> SupervisedTask:
+        if name in self.tasks:
+            raise ValueError(f"Background task {name} is already registered")
+        supervised = SupervisedTask(name, function, spec)
+        self.tasks[name] = supervised
+        return supervised
+
+    def add_component(self, component: object) -> list[SupervisedTask]:
+        """
+        注册组件声明的所有后台任务，任务名称为 `模块.类名.方法名`，不同模块中的同名类不会冲突。
+        """
+        cls = type(component)
+        return [
+            self.add(f"{cls.__module__}.{cls.__qualname__}.{name}", getattr(component, name), spec)
+            for name, spec in get_background_tasks(cls).items()
+        ]
+
+    def start_component(self, component: object):
+        for supervised in self.add_component(component):
+            self.start(supervised)
+
+    def start(self, supervised: SupervisedTask):
+        if self._stopping:
+            self._logger.warning("Supervisor is stopping, background task %s will not start", supervised.name)
+            return
+        if self.max_concurrency is not None and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._logger.info("Starting background task %s", supervised.name)
+        supervised.task = asyncio.create_task(self._supervise(supervised), name=supervised.name)
+
+    async def stop(self, timeout: float | None = None):
+        """
+        取消所有后台任务并等待退出，超过 stop_timeout 仍未退出的任务会被记录。
+        传入 timeout 时等待时间同时不超过 timeout。
+        """
+        timeout = self.stop_timeout if timeout is None else min(timeout, self.stop_timeout)
+        self._stopping = True
+        running = [supervised.task for supervised in self.tasks.values() if supervised.task is not None]
+        for task in running:
+            task.cancel()
+        if not running:
+            return
+        _, pending = await asyncio.wait(running, timeout=timeout)
+        for task in pending:
+            self._logger.warning("Background task %s did not stop within %ss", task.get_name(), timeout)
+
+    async def _supervise(self, supervised: SupervisedTask):
+        spec = supervised.spec
+        stats = supervised.stats
+        loop = asyncio.get_running_loop()
+        # 连续失败次数，用于计算退避时间
+        failures = 0
+        try:
+            while True:
+                started = loop.time()
+                try:
+                    await self._run(supervised)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self._logger.exception("Background task %s failed", supervised.name, exc_info=exc)
+                    stats.failures += 1
+                    stats.last_error = exc
+                    if self.metrics is not None:
+                        self.metrics.observe_task_failure(supervised.name)
+                    # 长时间运行后才失败的任务重新计算退避时间
+                    failures = 1 if loop.time() - started >= spec.backoff.maximum else failures + 1
+                    if spec.restart is RestartPolicy.NEVER:
+                        stats.state = TaskState.FAILED
+                        return
+                else:
+                    failures = 0
+                    if spec.restart is not RestartPolicy.ALWAYS:
+                        stats.state = TaskState.FINISHED
+                        return
+                if spec.max_restarts is not None and stats.restarts >= spec.max_restarts:
+                    self._logger.error("Background task %s reached %s restarts", supervised.name, spec.max_restarts)
+                    stats.state = TaskState.FAILED if failures else TaskState.FINISHED
+                    return
+                stats.state = TaskState.BACKING_OFF
+                await asyncio.sleep(spec.backoff.get_delay(failures))
+                stats.restarts += 1
+                if self.metrics is not None:
+                    self.metrics.observe_task_restart(supervised.name)
+        except asyncio.CancelledError:
+            stats.state = TaskState.CANCELLED
+            raise
+
+    async def _run(self, supervised: SupervisedTask):
+        loop = asyncio.get_running_loop()
+        interval = supervised.spec.interval
+        scheduled = loop.time()
+        while True:
+            await self._run_once(supervised, scheduled)
+            if interval is None:
+                return
+            scheduled += interval
+            now = loop.time()
+            # 运行耗时超过间隔时跳过错过的周期
+            scheduled = max(scheduled, now)
+            await asyncio.sleep(scheduled - now)
+
+    async def _run_once(self, supervised: SupervisedTask, scheduled: float):
+        loop = asyncio.get_running_loop()
+        # 只运行一次的任务通常是长期运行的循环，占用名额会使其他任务永远无法运行，因此不受并发限制
+        semaphore = self._semaphore if supervised.spec.interval is not None else None
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            started = loop.time()
+            self._observe_lag(supervised, started - scheduled)
+            supervised.stats.state = TaskState.RUNNING
+            supervised.stats.runs += 1
+            try:
+                await supervised.function()
+            finally:
+                duration = loop.time() - started
+                supervised.stats.last_duration = duration
+                if self.metrics is not None:
+                    self.metrics.observe_task_run(supervised.name, duration)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def _observe_lag(self, supervised: SupervisedTask, lag: float):
+        stats = supervised.stats
+        stats.last_lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+        if self.metrics is not None:
+            self.metrics.observe_task_lag(supervised.name, lag)
@@ -1,2 +1,45 @@
 class NoSuchParameterException(Exception):
     pass
+
+
+class AsyncConstructionRequired(Exception):
+    """
+    同步创建对象时遇到需要异步构造的类或工厂。
+    """
+
+    def __init__(self, cls: type[object]):
+        self.cls = cls
+        super().__init__(f"{cls.__name__} requires asynchronous construction")
+
+
+class PoolExhaustedError(Exception):
+    """
+    同步借用对象时对象池已满。
+    """
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        super().__init__(f"Pool {name} is exhausted (size {size})")
+
+
+class AmbiguousParameterException(Exception):
+    """
+    注解类型有多个可注入的实现，无法确定唯一的依赖。
+    """
+
+    def __init__(self, annotation: type[object], candidates: tuple[type[object], ...]):
+        self.annotation = annotation
+        self.candidates = candidates
+        names = ", ".join(candidate.__name__ for candidate in candidates)
+        super().__init__(f"Multiple implementations of {annotation.__name__} found: {names}")
+
+
+class CircularDependencyException(Exception):
+    """
+    构造依赖之间存在环，无法创建对象。classes 为环上的类，首尾相同。
+    """
+
+    def __init__(self, classes: list[type[object]]):
+        self.classes = tuple(classes)
+        super().__init__(f"Circular dependency detected: {' -> '.join(cls.__name__ for cls in classes)}")
@@ -1,37 +1,120 @@
+import asyncio
+import contextvars
 import inspect
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, cast
+import threading
+import time
+import types
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar, Union, cast, get_args, get_origin
 
-from persica.error import NoSuchParameterException
-from persica.factory.definition import ObjectDefinition
-from persica.factory.interface import InterfaceFactory
+from persica.error import AsyncConstructionRequired, CircularDependencyException, NoSuchParameterException
+from persica.factory.component import DEFAULT_ORDER, AsyncConstructingComponent
+from persica.factory.condition import get_class_condition
+from persica.factory.definition import LazyObjectDefinition, ObjectDefinition
+from persica.factory.index import TypeIndex
+from persica.factory.interface import AsyncInterfaceFactory, InterfaceFactory
+from persica.factory.pool import ObjectPool, PooledInterfaceFactory
 from persica.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from logging import Logger
 
+    from persica.metrics.container import ContainerMetrics
+
 _LOGGER = get_logger(__name__, "AbstractAutowireCapableFactory")
 
+T = TypeVar("T")
+
+# 当前异步创建任务正在创建的类，创建依赖的任务会复制该上下文
+_CREATING: contextvars.ContextVar[type[object] | None] = contextvars.ContextVar("persica_creating", default=None)
+
+
+class DependencyPlan:
+    """
+    注解的解析结果：value 为已经可用的对象；classes 为需要获取的对象的类，
+    container 为 list 或 tuple 时注入所有对象组成的集合，为 None 时注入单个对象。
+    """
+
+    __slots__ = ("classes", "container", "dependencies", "value")
+
+    def __init__(
+        self,
+        value: Any = None,
+        classes: tuple[type[object], ...] | None = None,
+        container: type[list] | type[tuple] | None = None,
+        dependencies: tuple[type[object], ...] = (),
+    ):
+        self.value = value
+        self.classes = classes
+        self.container = container
+        # 需要记录的构造依赖，默认与 classes 相同
+        self.dependencies = dependencies or (classes or ())
+
 
 class AbstractAutowireCapableFactory:
     _logger: "Logger" = _LOGGER
     # 存储对象定义对应的加载顺序的映射表，key 为顺序，value 为 ObjectDefinition
-    order_definitions: dict[int, ObjectDefinition] = {}
+    order_definitions: dict[int, ObjectDefinition]
     # 存储对象定义的映射表，key 为对象的类，value 为 ObjectDefinition
-    object_definitions: dict[type[object], ObjectDefinition] = {}
+    object_definitions: dict[type[object], ObjectDefinition]
+    # 存储延迟导入的对象定义，key 为类的完整名称，首次需要时导入模块并移入 object_definitions
+    lazy_definitions: dict[str, LazyObjectDefinition]
     # 工厂缓存，缓存已经创建的工厂对象，key 为对象的类，value 为工厂实例
-    factory_cache: dict[type[object], InterfaceFactory] = {}
+    factory_cache: dict[type[object], InterfaceFactory]
     # 存储已经实例化的单例对象，key 为对象的类，value 为对象实例
-    singleton_objects: dict[type[object], object] = {}
+    singleton_objects: dict[type[object], object]
     # 存储已经实例化的工厂对象，key 为工厂类，value 为工厂实例
-    singleton_factories: dict[type[InterfaceFactory], InterfaceFactory] = {}
+    singleton_factories: dict[type[InterfaceFactory], InterfaceFactory]
     # 存储外部可注入的对象，key 为对象的类，value 为对象实例
-    external_objects: dict[type[object], object] = {}
+    external_objects: dict[type[object], object]
+    # 存储构造依赖关系，key 为对象的类，value 为其构造函数依赖的类
+    dependencies: dict[type[object], set[type[object]]]
+    # 存储对象池，key 为池化的目标类，value 为 ObjectPool
+    pools: dict[type[object], ObjectPool]
+    # 同步实例化阶段因需要异步构造而被推迟的类，在事件循环上统一创建
+    deferred_classes: list[type[object]]
+    # 正在异步创建的对象任务，key 为对象的类，保证并发依赖方共享同一次创建
+    _creating_tasks: dict[type[object], "asyncio.Future[object]"]
+    # 异步创建任务之间的等待关系，key 为正在创建的类，value 为其正在等待创建的类，用于发现循环依赖
+    _waiting: dict[type[object], set[type[object]]]
+    # 发布后的只读单例映射，get_object 的快速路径只查询该映射，不加锁；更新时整体替换
+    _resolved: dict[type[object], object]
+    # 每个类独立的创建锁，保证多线程下单例只创建一次
+    _class_locks: dict[type[object], threading.RLock]
+    # 基类到实现类的索引，用于按基类注入唯一的实现或注入所有实现
+    type_index: TypeIndex
+    # 运行时指标，未启用时为 None
+    metrics: "ContainerMetrics | None"
+    # 启动完成后新创建的单例的回调，由应用上下文设置，返回完成初始化、事件订阅和后台任务启动的任务
+    activation_hook: "Callable[[type[object], object], asyncio.Future[None] | None] | None"
 
     def __init__(self, external_objects: Iterable[object] | None = None):
         """
         初始化工厂，允许外部传入可解析的对象，并将它们存入 external_objects。
         """
+        # 每个工厂实例持有独立的状态，避免多个工厂之间共享类属性
+        self.order_definitions = {}
+        self.object_definitions = {}
+        self.lazy_definitions = {}
+        self.factory_cache = {}
+        self.singleton_objects = {}
+        self.singleton_factories = {}
+        self.external_objects = {}
+        self.dependencies = {}
+        self.pools = {}
+        self.deferred_classes = []
+        self._creating_tasks = {}
+        self._waiting = {}
+        self._resolved = {}
+        self._published = False
+        self._class_locks = {}
+        # 每个线程正在同步创建的类，用于发现循环依赖
+        self._local = threading.local()
+        self.type_index = TypeIndex()
+        self.metrics = None
+        self.activation_hook = None
+        # 保护定义、锁表和只读映射等结构的修改，持有期间不会创建对象
+        self._lock = threading.RLock()
         if external_objects is not None:
             for obj in external_objects:
                 original_class = obj.__class__
@@ -46,41 +129,309 @@ class AbstractAutowireCapableFactory:
         实例化 object_definitions 中所有的对象。
         """
         self._logger.info("Instantiating all objects")
+        self.build_type_index()
         sorted_definition = sorted(self.order_definitions.items())
         for _, value in sorted_definition:
-            self.get_object(value.class_object)
-        for definition in self.object_definitions.values():
-            self.get_object(definition.class_object)
+            self._instantiate_or_defer(value.class_object)
+        # 创建过程中可能有延迟定义被移入 object_definitions，因此遍历副本
+        for definition in list(self.object_definitions.values()):
+            self._instantiate_or_defer(definition.class_object)
+        self._create_pools()
+        self.publish_singletons()
 
-    def get_object(self, cls: type[object]):
+    def build_type_index(self):
         """
-        根据类获取对象实例，如果未创建则调用 create_object 方法创建。
+        根据所有对象定义构建类型索引，工厂和池化组件不参与按基类注入。
+        延迟导入的定义在被导入后才会加入索引，按基类查询前由 _load_lazy_implementations 导入。
+        """
+        with self._lock:
+            self.type_index.clear()
+            for cls, definition in list(self.object_definitions.items()):
+                self._index_definition(cls, definition)
+
+    def _index_definition(self, cls: type[object], definition: ObjectDefinition):
+        if not definition.is_factory and not self._is_pooled_component(cls):
+            self.type_index.add(cls)
+
+    def _instantiate_or_defer(self, cls: type[object]):
+        """
+        同步创建对象，如果对象或其依赖需要异步构造，则推迟到 instantiate_deferred_objects 中创建。
+        """
+        if self._is_pooled_component(cls):
+            # 池化组件由 ObjectPool 按需创建，不作为单例
+            return
+        try:
+            self.get_object(cls)
+        except AsyncConstructionRequired as exc:
+            self._logger.debug("Deferring %s because %s requires async construction", cls.__name__, exc.cls.__name__)
+            if cls not in self.deferred_classes:
+                self.deferred_classes.append(cls)
+
+    async def instantiate_deferred_objects(self):
+        """
+        在事件循环上并发创建所有被推迟的对象，依赖关系之间的等待由 aget_object 中的任务缓存保证。
+        """
+        if not self.deferred_classes:
+            return
+        self._logger.info("Instantiating %s deferred objects", len(self.deferred_classes))
+        await asyncio.gather(*(self.aget_object(cls) for cls in self.deferred_classes))
+        self.deferred_classes.clear()
+        self._creating_tasks.clear()
+        self.publish_singletons()
+
+    def publish_singletons(self):
+        """
+        发布只读的单例映射，之后已创建的单例可以通过一次字典查找获取。
+        """
+        with self._lock:
+            self._resolved = {**self.singleton_objects, **self.singleton_factories}
+            self._published = True
+
+    def _publish_singleton(self, cls: type[object], obj: object):
+        """
+        发布后新创建的单例通过复制并整体替换只读映射加入，读取方不会看到修改中的映射。
+        """
+        if not self._published:
+            return
+        with self._lock:
+            resolved = dict(self._resolved)
+            resolved[cls] = obj
+            self._resolved = resolved
+
+    def _get_class_lock(self, cls: type[object]) -> threading.RLock:
+        lock = self._class_locks.get(cls)
+        if lock is None:
+            with self._lock:
+                lock = self._class_locks.setdefault(cls, threading.RLock())
+        return lock
+
+    def _create_pools(self):
+        for cls, definition in list(self.object_definitions.items()):
+            if definition.is_factory and issubclass(cls, PooledInterfaceFactory):
+                self.get_pool(cls.get_class())
+            elif self._is_pooled_component(cls):
+                self.get_pool(cls)
+
+    @staticmethod
+    def _is_pooled_component(_class: type[object]) -> bool:
+        return getattr(_class, "__pool_size__", None) is not None
+
+    def get_pool(self, target: type[T]) -> ObjectPool[T] | None:
+        """
+        获取目标类的对象池，目标类需要声明 pool_size 或由 PooledInterfaceFactory 管理。
+        """
+        pool = self.pools.get(target)
+        if pool is not None:
+            return pool
+        with self._get_class_lock(target):
+            pool = self.pools.get(target)
+            if pool is None:
+                pool = self._create_pool(target)
+                if pool is not None:
+                    self.pools[target] = pool
+        return pool
+
+    def _create_pool(self, target: type[T]) -> ObjectPool[T] | None:
+        definition = self.get_definition(target)
+        if definition is not None and not definition.is_factory and self._is_pooled_component(target):
+            pool = ObjectPool(
+                lambda: self._construct_pooled_object(target),
+                size=target.__pool_size__,
+                min_idle=target.__pool_min_idle__,
+                idle_timeout=target.__pool_idle_timeout__,
+                name=target.__name__,
+            )
+        else:
+            factory_cls = self._find_pooled_factory_class(target)
+            if factory_cls is None:
+                return None
+            factory = cast("PooledInterfaceFactory", self.get_object(factory_cls))
+            # 池中的对象由工厂创建，关闭对象池前需要保证工厂的依赖仍然可用
+            self.dependencies.setdefault(target, set()).add(factory_cls)
+            pool = ObjectPool(
+                lambda: factory.get_object(None),
+                size=factory_cls.__pool_size__,
+                min_idle=factory_cls.__pool_min_idle__,
+                idle_timeout=factory_cls.__pool_idle_timeout__,
+                reset=factory.reset_object,
+                destroy=factory.destroy_object,
+                name=factory_cls.__name__,
+            )
+        return pool
+
+    def _find_pooled_factory_class(self, target: type[object]) -> "type[PooledInterfaceFactory] | None":
+        for key, definition in list(self.object_definitions.items()):
+            if definition.is_factory and issubclass(key, PooledInterfaceFactory) and key.get_class() is target:
+                return key
+        return None
+
+    def _construct_pooled_object(self, cls: type[T]) -> Any:
+        """
+        为对象池创建新的组件实例，每次调用都会重新注入依赖。异步构造的组件返回协程，由对象池等待。
+        """
+        if issubclass(cls, AsyncConstructingComponent):
+            return self._aconstruct_pooled_object(cls)
+        return cls(**self._build_constructor_params(cls))
+
+    async def _aconstruct_pooled_object(self, cls: type[AsyncConstructingComponent]) -> object:
+        params = await self._abuild_constructor_params(cls)
+        return await cls.construct(**params)
+
+    def _resolve_pool_annotation(self, annotation: Any) -> ObjectPool | None:
+        """
+        解析 `ObjectPool[Target]` 形式的注解。
+        """
+        if get_origin(annotation) is not ObjectPool:
+            return None
+        args = get_args(annotation)
+        return self.get_pool(args[0]) if args else None
+
+    def get_definition(self, cls: Any) -> ObjectDefinition | None:
+        """
+        获取类的对象定义，类属于延迟导入的定义时将其移入 object_definitions。
         """
         definition = self.object_definitions.get(cls)
+        if definition is None and self.lazy_definitions and isinstance(cls, type):
+            with self._lock:
+                definition = self.object_definitions.get(cls)
+                if definition is None:
+                    lazy_definition = self.lazy_definitions.pop(f"{cls.__module__}.{cls.__qualname__}", None)
+                    if lazy_definition is not None and self._register_lazy_definition(cls, lazy_definition):
+                        definition = lazy_definition
+        return definition
+
+    def _register_lazy_definition(self, cls: type[object], definition: LazyObjectDefinition) -> bool:
+        """
+        对导入后的延迟定义执行与立即注册相同的处理：再次检查激活条件，并使用类实际的加载顺序。
+        调用方需要持有 self._lock。
+        """
+        # 扫描时的条件检查之后环境可能已经变化
+        condition = get_class_condition(cls)
+        if condition is not None and not condition.matches(definition.active_profiles):
+            self._logger.info("Skip inactive lazy definition %s", definition.class_name)
+            return False
+        # 静态提取的加载顺序只支持字面量，以类的 __order__ 为准
+        definition.order = getattr(cls, "__order__", DEFAULT_ORDER)
+        if not self._published:
+            self.order_definitions.setdefault(definition.order, definition)
+        self.object_definitions[cls] = definition
+        self._index_definition(cls, definition)
+        return True
+
+    def _load_lazy_definition(self, class_name: str) -> type[object] | None:
+        """
+        根据类的完整名称导入延迟定义的类，返回导入后的类。
+        """
+        definition = self.lazy_definitions.get(class_name)
+        if definition is None:
+            for key in list(self.object_definitions):
+                if f"{key.__module__}.{key.__qualname__}" == class_name:
+                    return key
+            self._logger.warning("No definition found for class %s", class_name)
+            return None
+        self._logger.info("Loading lazy definition %s", class_name)
+        # 在锁外导入模块，避免导入期间阻塞其他线程
+        cls = definition.class_object
+        with self._lock:
+            if cls in self.object_definitions:
+                return cls
+            # 其他线程已经处理过该定义但没有注册时，说明类未激活
+            if self.lazy_definitions.pop(class_name, None) is None:
+                return None
+            if not self._register_lazy_definition(cls, definition):
+                return None
+        return cls
+
+    def _load_lazy_implementations(self, base: Any):
+        """
+        根据扫描得到的继承关系导入 base 的所有延迟定义的子类，之后类型索引中包含 base 的全部实现。
+        """
+        if not self.lazy_definitions or not isinstance(base, type):
+            return
+        base_name = f"{base.__module__}.{base.__qualname__}"
+        for class_name, definition in list(self.lazy_definitions.items()):
+            if base_name in definition.ancestors:
+                self._load_lazy_definition(class_name)
+
+    def release_startup_state(self):
+        """
+        释放只在启动期间使用的数据。已创建的对象、对象定义和依赖关系会被保留。
+        """
+        self.order_definitions.clear()
+        self.deferred_classes.clear()
+        self._creating_tasks.clear()
+
+    def get_object(self, cls: type[object] | str):
+        """
+        根据类获取对象实例，如果未创建则调用 create_object 方法创建。
+        也可以传入类的完整名称，以获取延迟导入的对象。
+        """
+        # 快速路径：发布后已创建的单例只需一次字典查找
+        obj = self._resolved.get(cls)
+        if obj is not None:
+            return obj
+        if isinstance(cls, str):
+            cls = self._load_lazy_definition(cls)
+            if cls is None:
+                return None
+        definition = self.get_definition(cls)
         if definition is None:
             self._logger.warning("No definition found for class %s", cls.__name__)
             return None
 
-        if definition.is_factory:
-            # 如果对象定义是工厂，则获取或创建工厂对象
-            cls = cast("type[InterfaceFactory]", cls)
-            obj = self.singleton_factories.get(cls)
-            if obj is None:
-                return self.create_object(cls)
-        else:
-            # 如果对象定义不是工厂，则获取或创建单例对象
-            obj = self.singleton_objects.get(cls)
-            if obj is None:
-                return self.create_object(cls)
+        # 工厂存储在 singleton_factories 中，其他对象存储在 singleton_objects 中
+        cache = cast(
+            "dict[type[object], Any]", self.singleton_factories if definition.is_factory else self.singleton_objects
+        )
+        obj = cache.get(cls)
+        if obj is not None:
+            return obj
+        with self._get_class_lock(cls):
+            # 双重检查，其他线程可能已经完成创建
+            obj = cache.get(cls)
+            if obj is not None:
+                return obj
+            creating = self._get_creating_stack()
+            if cls in creating:
+                raise CircularDependencyException([*creating[creating.index(cls) :], cls])
+            creating.append(cls)
+            try:
+                obj = self.create_object(cls)
+            finally:
+                creating.pop()
+            if definition.is_factory:
+                cache[cls] = obj
+        self._publish_singleton(cls, obj)
+        if not definition.is_factory:
+            # 同步调用无法等待，对象返回时可能还没有完成初始化
+            self._activate_object(cls, obj)
         return obj
 
+    def _get_creating_stack(self) -> list[type[object]]:
+        stack = getattr(self._local, "creating", None)
+        if stack is None:
+            stack = self._local.creating = []
+        return stack
+
+    def _activate_object(self, cls: type[object], obj: object) -> "asyncio.Future[None] | None":
+        """
+        通知应用上下文新创建了单例，启动完成前不会设置回调。
+        """
+        hook = self.activation_hook
+        if hook is None:
+            return None
+        return hook(cls, obj)
+
     def create_object(self, cls: type[object]) -> object:
         """
         创建一个对象实例，支持依赖注入和工厂管理。
         """
         self._logger.info("Creating object %s", cls.__name__)
+        start = time.perf_counter() if self.metrics is not None else 0.0
         # 查找是否有该类的工厂
         factory = self._find_factory_for_class(cls)
+        if self._requires_async_construction(cls, factory):
+            raise AsyncConstructionRequired(cls)
         # 构建构造函数参数
         params = self._build_constructor_params(cls)
         # 创建对象
@@ -89,12 +440,127 @@ class AbstractAutowireCapableFactory:
         if factory is not None:
             instance = factory.get_object(obj)
             if instance is not None:
-                self.singleton_objects[cls] = obj
-                return instance
-        # 如果没有工厂管理，直接返回对象
+                obj = instance
+        # 单例存储最终返回的对象
         self.singleton_objects[cls] = obj
+        if self.metrics is not None:
+            self.metrics.observe_creation(cls, time.perf_counter() - start)
         return obj
 
+    async def aget_object(self, cls: type[object]):
+        """
+        get_object 的异步版本，支持异步构造方法和异步工厂。同一个类的并发请求共享同一个创建任务。
+        """
+        definition = self.get_definition(cls)
+        if definition is None:
+            self._logger.warning("No definition found for class %s", cls.__name__)
+            return None
+
+        if definition.is_factory:
+            obj = self.singleton_factories.get(cast("type[InterfaceFactory]", cls))
+        else:
+            obj = self.singleton_objects.get(cls)
+        if obj is not None:
+            return obj
+
+        task = self._creating_tasks.get(cls)
+        if task is None:
+            task = asyncio.ensure_future(self._acreate_and_activate(cls, definition))
+            task.add_done_callback(lambda done: self._discard_failed_creation(cls, done))
+            self._creating_tasks[cls] = task
+        obj = await self._await_creation(cls, task)
+        if definition.is_factory:
+            self.singleton_factories.setdefault(cast("type[InterfaceFactory]", cls), obj)
+        return obj
+
+    def _discard_failed_creation(self, cls: type[object], task: "asyncio.Future[object]"):
+        """
+        移除失败或被取消的创建任务，之后的请求会重新创建对象，而不是一直得到同一个异常。
+        """
+        if (task.cancelled() or task.exception() is not None) and self._creating_tasks.get(cls) is task:
+            del self._creating_tasks[cls]
+
+    async def _await_creation(self, cls: type[object], task: "asyncio.Future[object]") -> object:
+        """
+        等待 cls 的创建任务。在其他类的创建任务中等待时记录等待关系，
+        cls 已经在直接或间接等待当前任务时抛出 CircularDependencyException，避免互相等待。
+        """
+        waiter = _CREATING.get()
+        if waiter is None or task.done():
+            return await task
+        path = self._find_waiting_path(cls, waiter)
+        if path is not None:
+            raise CircularDependencyException([waiter, *path])
+        waiting = self._waiting.setdefault(waiter, set())
+        waiting.add(cls)
+        try:
+            return await task
+        finally:
+            waiting.discard(cls)
+            if not waiting:
+                self._waiting.pop(waiter, None)
+
+    def _find_waiting_path(self, start: type[object], target: type[object]) -> list[type[object]] | None:
+        """
+        查找从 start 到 target 的等待路径，路径包含首尾两个类，不存在时返回 None。
+        """
+        stack = [[start]]
+        visited: set[type[object]] = set()
+        while stack:
+            path = stack.pop()
+            if path[-1] is target:
+                return path
+            if path[-1] in visited:
+                continue
+            visited.add(path[-1])
+            stack.extend([*path, x] for x in self._waiting.get(path[-1], ()))
+        return None
+
+    async def _acreate_and_activate(self, cls: type[object], definition: ObjectDefinition) -> object:
+        """
+        创建对象，启动完成后创建的单例还会等待应用上下文完成初始化，并发的请求方拿到的都是可用的对象。
+        """
+        # 任务运行在复制的上下文中，设置的值只对该任务及其创建的依赖任务可见
+        _CREATING.set(cls)
+        obj = await self.acreate_object(cls)
+        self._publish_singleton(cls, obj)
+        if not definition.is_factory:
+            activation = self._activate_object(cls, obj)
+            if activation is not None:
+                await activation
+        return obj
+
+    async def acreate_object(self, cls: type[object]) -> object:
+        """
+        异步创建一个对象实例，依赖对象会被并发创建。
+        """
+        self._logger.info("Creating object %s asynchronously", cls.__name__)
+        start = time.perf_counter() if self.metrics is not None else 0.0
+        factory = self._find_factory_for_class(cls)
+        params = await self._abuild_constructor_params(cls)
+        if issubclass(cls, AsyncConstructingComponent):
+            obj = await cls.construct(**params)
+        else:
+            obj = cls(**params)
+        if factory is not None:
+            instance = factory.get_object(obj)
+            if inspect.isawaitable(instance):
+                instance = await instance
+            if instance is not None:
+                obj = instance
+        self.singleton_objects[cls] = obj
+        if self.metrics is not None:
+            # 异步创建的耗时包含并发等待依赖的时间
+            self.metrics.observe_creation(cls, time.perf_counter() - start)
+        return obj
+
+    @staticmethod
+    def _requires_async_construction(_class: type[object], factory: InterfaceFactory | None) -> bool:
+        """
+        判断类是否需要在事件循环上构造：类定义了异步构造方法，或由异步工厂管理。
+        """
+        return issubclass(_class, AsyncConstructingComponent) or isinstance(factory, AsyncInterfaceFactory)
+
     def _find_factory_for_class(self, cls: type[object]) -> InterfaceFactory | None:
         """
         查找与给定类对应的工厂，如果没有找到则返回 None。
@@ -102,57 +568,203 @@ class AbstractAutowireCapableFactory:
         # 先检查工厂缓存中是否存在
         factory = self.factory_cache.get(cls)
         if factory is None:
-            # 遍历 object_definitions 查找是否有与该类对应的工厂
-            for key, definition in self.object_definitions.items():
-                if definition.is_factory:
+            # 遍历 object_definitions 的副本查找是否有与该类对应的工厂，其他线程可能同时修改定义
+            for key, definition in list(self.object_definitions.items()):
+                # 池化工厂只为对象池创建对象，不参与单例的创建
+                if definition.is_factory and not issubclass(key, PooledInterfaceFactory):
                     factory_cls = cast("type[InterfaceFactory]", key)
                     # 判断该类是否是工厂管理的类或其子类
                     if issubclass(cls, factory_cls.get_class()):
-                        factory_instance = self.singleton_factories.get(factory_cls)
-                        if factory_instance is None:
-                            factory_instance = self.create_object(factory_cls)
-                            factory = cast("InterfaceFactory", factory_instance)
-                        else:
-                            factory = factory_instance
+                        # 通过 get_object 获取或创建工厂实例，由工厂类的创建锁保证只创建一次
+                        factory = cast("InterfaceFactory", self.get_object(factory_cls))
                         # 缓存工厂实例
-                        self.factory_cache[cls] = factory
-                        self.singleton_factories[factory_cls] = factory
+                        factory = self.factory_cache.setdefault(cls, factory)
                         break
         return factory
 
-    def _build_constructor_params(self, cls: type[object]) -> dict[str, Any]:
+    def _get_constructor_signature(self, cls: type[object]) -> inspect.Signature:
         """
-        构建构造函数参数，支持依赖注入和默认值处理。
+        获取用于依赖注入的构造函数签名，重写了 construct 的异步构造组件使用 construct 的签名。
         """
+        constructor = cls.__init__
+        if issubclass(cls, AsyncConstructingComponent):
+            construct = cast("Any", cls.construct)
+            if construct.__func__ is not cast("Any", AsyncConstructingComponent.construct).__func__:
+                constructor = construct
         try:
             # 获取构造函数签名，并设置 eval_str=True 以支持 Python 3.10+ 的字符串注解
-            signature = inspect.signature(cls.__init__, eval_str=True)
+            return inspect.signature(constructor, eval_str=True)
         except ValueError as exc:
             self._logger.exception("Failed to retrieve __init__ signature for %s: %s", cls.__name__, exc_info=exc)
             raise
 
-        params: dict[str, Any] = {}
-        for name, parameter in signature.parameters.items():
+    def _iter_constructor_parameters(self, cls: type[object]) -> Iterator[tuple[str, inspect.Parameter]]:
+        for name, parameter in self._get_constructor_signature(cls).parameters.items():
             # 跳过 'self', 'args', 'kwargs'
             if name in ("self", "args", "kwargs"):
                 continue
-            annotation = parameter.annotation
-            # 从单例缓存或外部对象中获取依赖对象实例
-            instance = self.singleton_objects.get(annotation) or self.external_objects.get(annotation)
-            # 如果没有找到依赖对象，尝试创建
-            if instance is None:
-                object_definition = self.object_definitions.get(annotation)
-                if object_definition is not None:
-                    instance = self.create_object(object_definition.class_object)
-                    self.singleton_objects[object_definition.class_object] = instance
-            # 如果依然没有找到，检查参数是否有默认值
-            if instance is None:
-                if parameter.default != inspect.Parameter.empty:
-                    instance = parameter.default
-                else:
-                    raise NoSuchParameterException(
-                        f"Cannot find the {name} parameter of type {annotation.__name__} required "
-                        f"by the {cls.__name__} component"
-                    )
-            params[name] = instance
+            yield name, parameter
+
+    @staticmethod
+    def _get_parameter_default(_class: type[object], name: str, parameter: inspect.Parameter) -> Any:
+        """
+        依赖对象不存在时，返回参数的默认值，没有默认值则抛出 NoSuchParameterException。
+        """
+        if parameter.default != inspect.Parameter.empty:
+            return parameter.default
+        # `A | B` 等注解没有 __name__
+        annotation = getattr(parameter.annotation, "__name__", repr(parameter.annotation))
+        raise NoSuchParameterException(
+            f"Cannot find the {name} parameter of type {annotation} required by the {_class.__name__} component"
+        )
+
+    @staticmethod
+    def _apply_default(instance: Any, parameter: inspect.Parameter) -> Any:
+        """
+        可选依赖没有解析到对象时，参数有默认值则使用默认值。
+        """
+        if instance is None and parameter.default is not inspect.Parameter.empty:
+            return parameter.default
+        return instance
+
+    def _record_dependency(self, cls: type[object], plan: DependencyPlan):
+        """
+        记录由容器管理的构造依赖，关闭时依赖方会先于被依赖方关闭。
+        """
+        if plan.dependencies:
+            self.dependencies.setdefault(cls, set()).update(plan.dependencies)
+
+    def _plan_dependency(self, annotation: Any) -> DependencyPlan | None:
+        """
+        解析构造参数的注解，无法解析时返回 None。支持以下形式：
+
+        - `ObjectPool[X]`：注入 X 的对象池
+        - `X | None`：X 无法解析时注入 None
+        - `list[X]` 与 `tuple[X, ...]`：注入 X 的所有实现，按 __order__ 排序
+        - `X`：优先使用 X 自身，否则使用 X 唯一的子类实现
+        """
+        origin = get_origin(annotation)
+        if origin is not None:
+            return self._plan_generic_dependency(origin, annotation)
+        if annotation in self.pools or self._is_pooled_component(annotation):
+            self._check_not_pooled(annotation)
+        # 从单例缓存或外部对象中获取依赖对象实例
+        instance = self.singleton_objects.get(annotation)
+        if instance is not None:
+            return DependencyPlan(value=instance, dependencies=(annotation,))
+        instance = self.external_objects.get(annotation)
+        if instance is not None:
+            return DependencyPlan(value=instance)
+        if self.get_definition(annotation) is not None:
+            return DependencyPlan(classes=(annotation,))
+        # 注解没有对应的定义时，查找唯一的子类实现
+        self._load_lazy_implementations(annotation)
+        implementation = self.type_index.get_unique(annotation)
+        if implementation is not None:
+            return DependencyPlan(classes=(implementation,))
+        return None
+
+    def _check_not_pooled(self, annotation: Any):
+        """
+        池化类的对象由对象池创建，直接注入会额外创建一个不受对象池管理的单例。
+        """
+        definition = self.get_definition(annotation)
+        if annotation in self.pools or (definition is not None and not definition.is_factory):
+            name = annotation.__name__
+            raise NoSuchParameterException(f"{name} is pooled and cannot be injected directly, use ObjectPool[{name}]")
+
+    def _plan_generic_dependency(self, origin: Any, annotation: Any) -> DependencyPlan | None:
+        args = get_args(annotation)
+        if origin is ObjectPool:
+            pool = self._resolve_pool_annotation(annotation)
+            # 记录对池化类的依赖，关闭时使用对象池的组件先于对象池关闭
+            return None if pool is None else DependencyPlan(value=pool, dependencies=(args[0],))
+        if origin is Union or origin is types.UnionType:
+            inner = [x for x in args if x is not type(None)]
+            if len(inner) != 1 or len(inner) == len(args):
+                return None
+            return self._plan_dependency(inner[0]) or DependencyPlan(value=None)
+        if (origin is list and args) or (origin is tuple and args[1:] == (Ellipsis,)):
+            self._load_lazy_implementations(args[0])
+            return DependencyPlan(classes=self.type_index.get_all(args[0]), container=origin)
+        return None
+
+    def _resolve_plan(self, plan: DependencyPlan) -> Any:
+        if plan.classes is None:
+            return plan.value
+        objects = [self.get_object(x) for x in plan.classes]
+        if plan.container is None:
+            return objects[0]
+        return plan.container(objects)
+
+    async def _aresolve_plan(self, plan: DependencyPlan) -> Any:
+        if plan.classes is None:
+            return plan.value
+        objects = await asyncio.gather(*(self.aget_object(x) for x in plan.classes))
+        if plan.container is None:
+            return objects[0]
+        return plan.container(objects)
+
+    def get_singletons_of_type(self, base: type[T]) -> dict[type[object], T]:
+        """
+        获取所有已实例化的工厂和单例对象中属于 base 类型的实例，key 为对象的类。
+        """
+        result: dict[type[object], T] = {}
+        for component_dict in [self.singleton_factories, self.singleton_objects]:
+            for key, value in component_dict.items():
+                if isinstance(value, base):
+                    result.setdefault(key, value)
+        return result
+
+    def get_all_dependencies(self, cls: type[object]) -> set[type[object]]:
+        """
+        获取类的所有直接和间接构造依赖。
+        """
+        result: set[type[object]] = set()
+        stack = list(self.dependencies.get(cls, ()))
+        while stack:
+            dependency = stack.pop()
+            if dependency in result:
+                continue
+            result.add(dependency)
+            stack.extend(self.dependencies.get(dependency, ()))
+        result.discard(cls)
+        return result
+
+    def _build_constructor_params(self, cls: type[object]) -> dict[str, Any]:
+        """
+        构建构造函数参数，支持依赖注入和默认值处理。
+        """
+        params: dict[str, Any] = {}
+        for name, parameter in self._iter_constructor_parameters(cls):
+            plan = self._plan_dependency(parameter.annotation)
+            # 没有找到依赖对象时，检查参数是否有默认值
+            if plan is None:
+                params[name] = self._get_parameter_default(cls, name, parameter)
+                continue
+            self._record_dependency(cls, plan)
+            params[name] = self._apply_default(self._resolve_plan(plan), parameter)
+        return params
+
+    async def _abuild_constructor_params(self, cls: type[object]) -> dict[str, Any]:
+        """
+        _build_constructor_params 的异步版本，尚未创建的依赖对象会被并发创建。
+        """
+        params: dict[str, Any] = {}
+        # 先完成所有参数的解析，再创建协程，解析失败时不会留下未等待的协程
+        pending: dict[str, tuple[inspect.Parameter, DependencyPlan]] = {}
+        for name, parameter in self._iter_constructor_parameters(cls):
+            plan = self._plan_dependency(parameter.annotation)
+            if plan is None:
+                params[name] = self._get_parameter_default(cls, name, parameter)
+                continue
+            self._record_dependency(cls, plan)
+            if plan.classes is None:
+                params[name] = self._apply_default(plan.value, parameter)
+            else:
+                pending[name] = (parameter, plan)
+        if pending:
+            results = await asyncio.gather(*(self._aresolve_plan(plan) for _, plan in pending.values()))
+            for (name, (parameter, _)), result in zip(pending.items(), results, strict=True):
+                params[name] = self._apply_default(result, parameter)
         return params
@@ -1,14 +1,51 @@
+from enum import Enum
+from typing import Self
+
+from persica.utils.condition import Condition
+
 DEFAULT_ORDER: int = 0
 
 
+class StartupTier(Enum):
+    # 应用就绪前必须完成初始化
+    CRITICAL = "critical"
+    # 应用就绪后在后台继续初始化
+    BACKGROUND = "background"
+
+
 class BaseComponent:
     __order__: int = DEFAULT_ORDER
+    __startup_tier__: StartupTier = StartupTier.CRITICAL
+    # 对象池容量，设置后该组件不再作为单例创建，而是通过 ObjectPool 注入
+    __pool_size__: int | None = None
+    __pool_min_idle__: int = 0
+    __pool_idle_timeout__: float | None = None
+    # 关闭时允许 shutdown 执行的最长时间（秒），None 表示使用应用的默认值
+    __shutdown_timeout__: float | None = None
+    # 激活条件，通过 profiles、env、requires 关键字参数声明，只对声明的类本身生效
+    __condition__: Condition | None = None
 
     def __init_subclass__(cls, **kwargs):
+        order = kwargs.pop("order", None)
+        shutdown_timeout = kwargs.pop("shutdown_timeout", None)
+        tier = kwargs.pop("tier", None)
+        pool_size = kwargs.pop("pool_size", None)
+        pool_min_idle = kwargs.pop("pool_min_idle", None)
+        pool_idle_timeout = kwargs.pop("pool_idle_timeout", None)
+        cls.__condition__ = Condition.pop_from_kwargs(kwargs)
         super().__init_subclass__(**kwargs)
-        order = kwargs.get("order")
         if order is not None:
             cls.__order__ = order
+        if shutdown_timeout is not None:
+            cls.__shutdown_timeout__ = shutdown_timeout
+        if tier is not None:
+            cls.__startup_tier__ = StartupTier(tier)
+        if pool_size is not None:
+            cls.__pool_size__ = pool_size
+        if pool_min_idle is not None:
+            cls.__pool_min_idle__ = pool_min_idle
+        if pool_idle_timeout is not None:
+            cls.__pool_idle_timeout__ = pool_idle_timeout
 
 
 class AsyncInitializingComponent(BaseComponent):
@@ -17,3 +54,12 @@ class AsyncInitializingComponent(BaseComponent):
 
     async def shutdown(self):
         pass
+
+
+class AsyncConstructingComponent(BaseComponent):
+    @classmethod
+    async def construct(cls, *args, **kwargs) -> Self:
+        """
+        异步构造方法，参数与 __init__ 一样由容器根据注解注入。子类可以重写该方法以在构造时执行 I/O。
+        """
+        return cls(*args, **kwargs)
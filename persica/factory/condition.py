@@ -0,0 +1,20 @@
+import os
+from collections.abc import Iterable
+
+from persica.utils.condition import Condition
+
+
+def get_class_condition(_class: type[object]) -> Condition | None:
+    """
+    获取类自身声明的激活条件，激活条件不会被子类继承。
+    """
+    return vars(_class).get("__condition__")
+
+
+def get_active_profiles(profiles: Iterable[str] | None = None) -> frozenset[str]:
+    """
+    获取激活的 profile，未指定时读取逗号分隔的 PERSICA_PROFILES 环境变量。
+    """
+    if profiles is None:
+        profiles = os.environ.get("PERSICA_PROFILES", "").split(",")
+    return frozenset(profile.strip() for profile in profiles if profile.strip())
@@ -1,3 +1,7 @@
+from collections.abc import Iterable
+from importlib import import_module
+
+
 class ObjectDefinition:
     """
     定义对象的结构，包括对象的类和是否是工厂。
@@ -10,3 +14,39 @@ class ObjectDefinition:
     def __init__(self, class_object: type[object], is_factory: bool | None = None):
         self.class_object = class_object
         self.is_factory = is_factory
+
+
+class LazyObjectDefinition(ObjectDefinition):
+    """
+    延迟导入的对象定义，只保存扫描得到的类名、模块和加载顺序，首次访问 class_object 时才导入模块。
+    active_profiles 为注册时激活的 profile，导入后用于再次检查类的激活条件；
+    ancestors 为扫描得到的所有父类的完整名称，按基类注入时用于在导入前找到候选实现。
+    """
+
+    def __init__(
+        self,
+        class_name: str,
+        module_name: str,
+        is_factory: bool | None = None,
+        order: int = 0,
+        active_profiles: Iterable[str] = (),
+        ancestors: Iterable[str] = (),
+    ):
+        self.class_name = class_name
+        self.module_name = module_name
+        self.is_factory = is_factory
+        self.order = order
+        self.active_profiles = frozenset(active_profiles)
+        self.ancestors = frozenset(ancestors)
+        self._class_object: type[object] | None = None
+
+    @property
+    def class_object(self) -> type[object]:
+        if self._class_object is None:
+            module = import_module(self.module_name)
+            self._class_object = getattr(module, self.class_name.rpartition(".")[2])
+        return self._class_object
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._class_object is not None
@@ -0,0 +1,47 @@
+from typing import Generic
+
+from persica.error import AmbiguousParameterException
+from persica.factory.component import DEFAULT_ORDER
+
+
+class TypeIndex:
+    """
+    类型索引，根据每个类的 MRO 记录基类到实现类的映射，用于按基类或协议注入依赖。
+    索引在注册时构建，创建对象时的查询只需一次字典查找。
+    """
+
+    def __init__(self):
+        # key 为基类，value 为按 __order__ 排序的实现类
+        self._implementations: dict[type[object], tuple[type[object], ...]] = {}
+
+    def clear(self):
+        self._implementations.clear()
+
+    def add(self, cls: type[object]):
+        for base in cls.__mro__:
+            if base in (object, Generic):
+                continue
+            implementations = self._implementations.get(base, ())
+            if cls in implementations:
+                continue
+            # sorted 是稳定排序，相同 order 的实现保持注册顺序
+            self._implementations[base] = tuple(
+                sorted((*implementations, cls), key=lambda x: getattr(x, "__order__", DEFAULT_ORDER))
+            )
+
+    def get_all(self, base: type[object]) -> tuple[type[object], ...]:
+        """
+        获取基类的所有实现，按 __order__ 排序。
+        """
+        return self._implementations.get(base, ())
+
+    def get_unique(self, base: type[object]) -> type[object] | None:
+        """
+        获取基类唯一的实现，没有实现时返回 None，有多个实现时抛出 AmbiguousParameterException。
+        """
+        implementations = self._implementations.get(base, ())
+        if not implementations:
+            return None
+        if len(implementations) > 1:
+            raise AmbiguousParameterException(base, implementations)
+        return implementations[0]
@@ -1,11 +1,19 @@
 from typing import Generic, TypeVar, get_args
 
+from persica.utils.condition import Condition
+
 T = TypeVar("T", bound=object)
 
 
 class InterfaceFactory(Generic[T]):
     # 表示该工厂所管理的目标类
     target_class: type[T]
+    # 激活条件，通过 profiles、env、requires 关键字参数声明，只对声明的类本身生效
+    __condition__: Condition | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        cls.__condition__ = Condition.pop_from_kwargs(kwargs)
+        super().__init_subclass__(**kwargs)
 
     def get_object(self, obj: T | None) -> T:
         """
@@ -31,3 +39,11 @@ class InterfaceFactory(Generic[T]):
                     cls.target_class = type_args[0]
                     return cls.target_class
         raise NotImplementedError(f"{cls.__name__} must specify a generic type parameter or define 'target_class'")
+
+
+class AsyncInterfaceFactory(InterfaceFactory[T]):
+    async def get_object(self, obj: T | None) -> T:
+        """
+        异步返回与传入对象相关的对象实例，由容器在事件循环上等待。
+        """
+        raise NotImplementedError("Subclasses must implement this method")
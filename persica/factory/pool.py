@@ -0,0 +1,351 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+from persica.error import PoolExhaustedError
+from persica.factory.component import AsyncInitializingComponent
+from persica.factory.interface import InterfaceFactory
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+T = TypeVar("T", bound=object)
+
+_LOGGER = get_logger(__name__, "ObjectPool")
+
+# 创建失败后交给等待者的空闲名额，等待者收到后重新创建对象
+_FREE_SLOT: Any = object()
+
+
+class PoolStats:
+    """
+    对象池的统计信息。
+    """
+
+    def __init__(self):
+        # 成功借出的次数
+        self.acquisitions: int = 0
+        # 直接复用空闲对象的次数
+        self.hits: int = 0
+        # 新建对象的次数
+        self.created: int = 0
+        # 因对象池已满而等待的次数及累计等待时间（秒）
+        self.waits: int = 0
+        self.wait_time: float = 0.0
+        # 因空闲超时被回收的对象数量
+        self.evicted: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        if self.acquisitions == 0:
+            return 0.0
+        return self.hits / self.acquisitions
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "acquisitions": self.acquisitions,
+            "hits": self.hits,
+            "created": self.created,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "evicted": self.evicted,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class PoolLease(Generic[T]):
+    """
+    对象池租约，同时支持 `with` 与 `async with`。
+    同步方式只会复用空闲对象或在容量范围内新建对象，对象池已满时抛出 PoolExhaustedError。
+    """
+
+    def __init__(self, pool: "ObjectPool[T]"):
+        self.pool = pool
+        self.obj: T | None = None
+
+    def __enter__(self) -> T:
+        self.obj = self.pool.acquire_nowait()
+        return self.obj
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._release()
+
+    async def __aenter__(self) -> T:
+        self.obj = await self.pool.acquire()
+        return self.obj
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._release()
+
+    def _release(self):
+        if self.obj is not None:
+            self.pool.release(self.obj)
+            self.obj = None
+
+
+class ObjectPool(Generic[T]):
+    """
+    有界对象池。通过 lease() 借出对象，归还时交给正在等待的协程或放回空闲队列。
+    对象池不是线程安全的，只应在事件循环所在的线程中使用。
+    AsyncInitializingComponent 对象在创建后调用 initialize()，在回收或对象池关闭时调用 shutdown()。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(
+        self,
+        creator: Callable[[], Any],
+        size: int,
+        min_idle: int = 0,
+        idle_timeout: float | None = None,
+        reset: Callable[[T], Any] | None = None,
+        destroy: Callable[[T], Any] | None = None,
+        name: str | None = None,
+    ):
+        if size <= 0:
+            raise ValueError("Pool size must be positive")
+        self.creator = creator
+        self.size = size
+        self.min_idle = min(min_idle, size)
+        self.idle_timeout = idle_timeout
+        self.reset = reset
+        self.destroy = destroy
+        self.name = name or getattr(creator, "__qualname__", repr(creator))
+        self.stats = PoolStats()
+        # 空闲对象及其归还时间
+        self._idle: deque[tuple[T, float]] = deque()
+        self._waiters: deque[asyncio.Future[T]] = deque()
+        # 当前存活（空闲或借出）的对象数量
+        self._total: int = 0
+        self._closed = False
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        return self._total - len(self._idle)
+
+    def lease(self) -> PoolLease[T]:
+        return PoolLease(self)
+
+    def acquire_nowait(self) -> T:
+        self._check_closed()
+        self.evict_idle()
+        if self._idle:
+            return self._take_idle()
+        if self._total < self.size:
+            obj = self.creator()
+            if inspect.isawaitable(obj):
+                if inspect.iscoroutine(obj):
+                    obj.close()
+                raise TypeError(f"{self.name} creates objects asynchronously, use `async with pool.lease()` instead")
+            if isinstance(obj, AsyncInitializingComponent):
+                raise TypeError(f"{self.name} objects require initialize(), use `async with pool.lease()` instead")
+            return self._on_created(obj)
+        raise PoolExhaustedError(self.name, self.size)
+
+    async def acquire(self) -> T:
+        self._check_closed()
+        self.evict_idle()
+        if self._idle:
+            return self._take_idle()
+        while True:
+            if self._total < self.size:
+                return await self._create()
+            obj = await self._wait()
+            if obj is not _FREE_SLOT:
+                self.stats.acquisitions += 1
+                self.stats.hits += 1
+                return obj
+            # 创建失败释放了名额，由当前等待者重新创建
+
+    async def _create(self) -> T:
+        # 先占用名额再创建，避免并发创建时超出容量
+        self._total += 1
+        try:
+            obj = await self._create_object()
+        except BaseException:
+            self._total -= 1
+            # 名额交给下一个等待者，否则等待者会一直等待不会发生的归还
+            self._hand_over(_FREE_SLOT)
+            raise
+        self._total -= 1
+        return self._on_created(obj)
+
+    async def _create_object(self) -> T:
+        obj = self.creator()
+        if inspect.isawaitable(obj):
+            obj = await obj
+        if isinstance(obj, AsyncInitializingComponent):
+            await obj.initialize()
+        return obj
+
+    async def _wait(self) -> Any:
+        waiter: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats.waits += 1
+        start = time.monotonic()
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # 取消与归还同时发生时，已经交给等待者的对象或名额转交给下一个等待者，对象不会再次重置
+            if waiter.done() and not waiter.cancelled():
+                self._hand_over(waiter.result())
+            raise
+        finally:
+            self.stats.wait_time += time.monotonic() - start
+
+    def release(self, obj: T):
+        if self.reset is not None:
+            try:
+                self.reset(obj)
+            except Exception as exc:
+                # 重置失败的对象状态未知，不能再复用；销毁后把名额交给等待者
+                self._logger.exception("Reset of pooled object %s failed", self.name, exc_info=exc)
+                try:
+                    self._destroy_later(obj)
+                finally:
+                    self._hand_over(_FREE_SLOT)
+                return
+        if self._closed:
+            self._destroy_later(obj)
+            return
+        self._hand_over(obj)
+
+    def _hand_over(self, obj: Any):
+        """
+        将已经重置的对象或空闲名额交给等待者，没有等待者时对象放回空闲队列。
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # 直接交给等待者，对象不进入空闲队列
+                waiter.set_result(obj)
+                return
+        if obj is not _FREE_SLOT:
+            if self._closed:
+                self._destroy_later(obj)
+            else:
+                self._idle.append((obj, time.monotonic()))
+
+    async def warm(self, count: int | None = None):
+        """
+        预先创建对象放入空闲队列，默认创建到 min_idle 个。
+        """
+        target = self.min_idle if count is None else min(count, self.size)
+        while self._total < target:
+            obj = await self._create_object()
+            self.stats.created += 1
+            self._total += 1
+            self._idle.append((obj, time.monotonic()))
+
+    def evict_idle(self) -> int:
+        """
+        回收空闲时间超过 idle_timeout 的对象，至少保留 min_idle 个空闲对象。
+        """
+        if self.idle_timeout is None:
+            return 0
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = 0
+        # 空闲队列按归还时间排序，最早归还的在左侧
+        while len(self._idle) > self.min_idle and self._idle[0][1] < deadline:
+            obj, _ = self._idle.popleft()
+            self._destroy_later(obj)
+            evicted += 1
+        self.stats.evicted += evicted
+        return evicted
+
+    async def close(self):
+        self._closed = True
+        for waiter in self._waiters:
+            waiter.cancel()
+        self._waiters.clear()
+        while self._idle:
+            obj, _ = self._idle.popleft()
+            result = self._destroy(obj)
+            if inspect.isawaitable(result):
+                await result
+
+    def _take_idle(self) -> T:
+        obj, _ = self._idle.pop()
+        self.stats.acquisitions += 1
+        self.stats.hits += 1
+        return obj
+
+    def _on_created(self, obj: T) -> T:
+        self._total += 1
+        self.stats.created += 1
+        self.stats.acquisitions += 1
+        return obj
+
+    def _destroy(self, obj: T) -> Any:
+        self._total -= 1
+        if isinstance(obj, AsyncInitializingComponent):
+            return self._shutdown(obj)
+        if self.destroy is not None:
+            return self.destroy(obj)
+        return None
+
+    async def _shutdown(self, obj: AsyncInitializingComponent):
+        try:
+            await obj.shutdown()
+        except Exception as exc:
+            self._logger.exception("Shutdown of pooled object %s failed", self.name, exc_info=exc)
+        if self.destroy is not None:
+            result = self.destroy(cast("T", obj))
+            if inspect.isawaitable(result):
+                await result
+
+    def _destroy_later(self, obj: T):
+        result = self._destroy(obj)
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(result)
+
+    def _check_closed(self):
+        if self._closed:
+            raise RuntimeError(f"Pool {self.name} is closed")
+
+
+class PooledInterfaceFactory(InterfaceFactory[T]):
+    """
+    池化工厂，声明方式为 `class ParserFactory(PooledInterfaceFactory[Parser], pool_size=8)`。
+    容器为目标类创建 ObjectPool，注入点使用 `ObjectPool[Parser]` 注解获取对象池。
+    """
+
+    __pool_size__: int = 1
+    __pool_min_idle__: int = 0
+    __pool_idle_timeout__: float | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        pool_size = kwargs.pop("pool_size", None)
+        pool_min_idle = kwargs.pop("pool_min_idle", None)
+        pool_idle_timeout = kwargs.pop("pool_idle_timeout", None)
+        super().__init_subclass__(**kwargs)
+        if pool_size is not None:
+            cls.__pool_size__ = pool_size
+        if pool_min_idle is not None:
+            cls.__pool_min_idle__ = pool_min_idle
+        if pool_idle_timeout is not None:
+            cls.__pool_idle_timeout__ = pool_idle_timeout
+
+    def get_object(self, obj: T | None) -> T:
+        """
+        创建一个新的池化对象，obj 始终为 None。
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def reset_object(self, obj: T) -> None:
+        """
+        对象归还到对象池时调用，用于清理状态。
+        """
+
+    def destroy_object(self, obj: T) -> Any:
+        """
+        对象被回收或对象池关闭时调用，可以返回协程。
+        """
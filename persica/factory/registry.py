@@ -1,9 +1,14 @@
+import time
+from collections.abc import Iterable
 from importlib import import_module
 from typing import TYPE_CHECKING
 
-from persica.factory.component import BaseComponent
-from persica.factory.definition import ObjectDefinition
-from persica.factory.interface import InterfaceFactory
+from persica.factory.component import AsyncConstructingComponent, AsyncInitializingComponent, BaseComponent
+from persica.factory.condition import get_active_profiles, get_class_condition
+from persica.factory.definition import LazyObjectDefinition, ObjectDefinition
+from persica.factory.interface import AsyncInterfaceFactory, InterfaceFactory
+from persica.factory.pool import PooledInterfaceFactory
+from persica.metrics.endpoint import MetricsEndpoint
 from persica.scanner.graph import LoadOrderConflictError
 from persica.utils.logging import get_logger
 
@@ -18,32 +23,88 @@ _LOGGER = get_logger(__name__, "DefinitionRegistry")
 
 class DefinitionRegistry:
     _logger: "Logger" = _LOGGER
-    import_module_status: dict[str, bool] = {}
+    # 模块的导入结果，key 为模块名称，导入失败时为 False
+    import_module_status: dict[str, bool]
+    # 框架提供的抽象基类，只用于被继承，不注册为对象定义
+    abstract_classes: tuple[type[object], ...] = (
+        AsyncInitializingComponent,
+        AsyncConstructingComponent,
+        AsyncInterfaceFactory,
+        PooledInterfaceFactory,
+        MetricsEndpoint,
+    )
+    # 需要导入其子类所在模块的基类的完整名称
+    component_base_class_names: tuple[str, ...] = (
+        "persica.factory.component.BaseComponent",
+        "persica.factory.component.AsyncInitializingComponent",
+        "persica.factory.component.AsyncConstructingComponent",
+        "persica.metrics.endpoint.MetricsEndpoint",
+    )
+    factory_base_class_names: tuple[str, ...] = (
+        "persica.factory.interface.InterfaceFactory",
+        "persica.factory.interface.AsyncInterfaceFactory",
+        "persica.factory.pool.PooledInterfaceFactory",
+    )
 
-    def __init__(self, factory: "AbstractAutowireCapableFactory", class_scanner: "ClassPathScanner"):
+    def __init__(
+        self,
+        factory: "AbstractAutowireCapableFactory",
+        class_scanner: "ClassPathScanner",
+        profiles: Iterable[str] | None = None,
+        lazy: bool = False,
+    ):
         self.factory = factory
         self.class_scanner = class_scanner
+        self.active_profiles = get_active_profiles(profiles)
+        # 每个注册器实例持有独立的导入状态，release 时不会影响其他实例
+        self.import_module_status = {}
+        # 延迟导入模式下，组件只根据扫描结果注册，模块在首次需要时才导入
+        self.lazy = lazy
+        # 每个模块的导入耗时（秒），包含导入期间首次导入的其他模块
+        self.import_module_times: dict[str, float] = {}
 
     def flash(self):
-        self._import_module()
-        self._registry_class()
+        if self.lazy:
+            # 工厂需要导入后才能确定其管理的目标类，因此仍然立即导入
+            self._import_module(self.factory_base_class_names)
+            self._registry_base_class(InterfaceFactory, True)
+            self._registry_lazy_class()
+        else:
+            self._import_module(self.component_base_class_names + self.factory_base_class_names)
+            self._registry_class()
         self._check_class()
 
-    def _import_module(self):
-        for module_name in self.class_scanner.get_modules_to_import("persica.factory.component.BaseComponent"):
-            self.__import_module(module_name)
-        for module_name in self.class_scanner.get_modules_to_import(
-            "persica.factory.component.AsyncInitializingComponent"
-        ):
-            self.__import_module(module_name)
-        for module_name in self.class_scanner.get_modules_to_import("persica.factory.interface.InterfaceFactory"):
-            self.__import_module(module_name)
+    def release(self):
+        """
+        释放导入状态记录，启动完成后不再需要。
+        """
+        self.import_module_status.clear()
+        self.import_module_times.clear()
+
+    def _import_module(self, base_class_names: tuple[str, ...]):
+        for base_class_name in base_class_names:
+            for module_name in self.class_scanner.get_modules_to_import(base_class_name, self._is_class_active):
+                self.__import_module(module_name)
+
+    def _is_class_active(self, class_name: str) -> bool:
+        """
+        根据扫描时静态提取的激活条件判断类是否需要导入。
+        """
+        condition = self.class_scanner.class_graph.get_condition(class_name)
+        if condition is None:
+            return True
+        active = condition.matches(self.active_profiles)
+        if not active:
+            self._logger.info("skip inactive class %s", class_name)
+        return active
 
     def __import_module(self, module_name: str):
         if self.import_module_status.get(module_name) is None:
             self._logger.info("import module %s", module_name)
+            start = time.perf_counter()
             try:
                 import_module(module_name)
+                self.import_module_times[module_name] = time.perf_counter() - start
                 self.import_module_status.setdefault(module_name, True)
             except Exception:
                 self.import_module_status.setdefault(module_name, False)
@@ -56,6 +117,14 @@ class DefinitionRegistry:
 
     def _registry_base_class(self, _class: type[object], is_factory: bool | None = None):
         for _cls in _class.__subclasses__():
+            if _cls in self.abstract_classes:
+                self._registry_base_class(_cls, is_factory)
+                continue
+            # 模块可能因为其他原因被导入，运行时再次检查激活条件
+            condition = get_class_condition(_cls)
+            if condition is not None and not condition.matches(self.active_profiles):
+                self._registry_base_class(_cls, is_factory)
+                continue
             definition = ObjectDefinition(_cls, is_factory)
             if hasattr(_cls, "__order__"):
                 __order__: int = _cls.__order__
@@ -64,7 +133,28 @@ class DefinitionRegistry:
                 self.class_scanner.class_graph.set_order(class_name, __order__)
                 self.factory.order_definitions.setdefault(__order__, definition)
             self.factory.object_definitions.setdefault(_cls, definition)
-            self._registry_base_class(_cls)
+            self._registry_base_class(_cls, is_factory)
+
+    def _registry_lazy_class(self):
+        """
+        根据扫描得到的类图创建延迟导入的对象定义，不导入组件所在的模块。
+        """
+        class_graph = self.class_scanner.class_graph
+        abstract_class_names = {f"{_cls.__module__}.{_cls.__qualname__}" for _cls in self.abstract_classes}
+        class_names: set[str] = set()
+        for base_class_name in self.component_base_class_names:
+            class_names.update(self.class_scanner.get_classes_to_import(base_class_name, self._is_class_active))
+        for class_name in sorted(class_names - abstract_class_names):
+            if class_name in self.factory.lazy_definitions:
+                continue
+            definition = LazyObjectDefinition(
+                class_name,
+                class_graph.class_to_module[class_name],
+                order=class_graph.class_to_order.get(class_name, class_graph.default_order),
+                active_profiles=self.active_profiles,
+                ancestors=class_graph.find_all_ancestors(class_name),
+            )
+            self.factory.lazy_definitions[class_name] = definition
 
     def _check_class(self):
         conflicts = self.class_scanner.class_graph.check_conflict()
@@ -0,0 +1,50 @@
+import argparse
+import json
+import logging
+import sys
+
+from persica.inspect.analyzer import StartupAnalyzer
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m persica.inspect",
+        description="Analyze the startup of a persica application: critical path, unused components and import cost.",
+    )
+    parser.add_argument("packages", nargs="+", help="packages to scan")
+    parser.add_argument("--profile", action="append", dest="profiles", help="active profile, can be repeated")
+    parser.add_argument("--instantiate", action="store_true", help="create all objects and measure constructors")
+    parser.add_argument(
+        "--initialize", action="store_true", help="also run initialize() and shutdown(), implies --instantiate"
+    )
+    parser.add_argument("--format", choices=("json", "dot"), default="json", help="output format")
+    parser.add_argument(
+        "--graph", choices=("dependencies", "classes"), default="dependencies", help="graph rendered by --format dot"
+    )
+    parser.add_argument("--top", type=int, default=10, help="number of modules listed by import cost")
+    parser.add_argument("--output", "-o", help="write the report to a file instead of stdout")
+    parser.add_argument("--verbose", "-v", action="store_true", help="show container logs")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    analyzer = StartupAnalyzer(
+        args.packages, profiles=args.profiles, instantiate=args.instantiate, initialize=args.initialize
+    )
+    report = analyzer.run()
+    if args.format == "dot":
+        output = report.to_dot(args.graph)
+    else:
+        output = json.dumps(report.to_dict(top=args.top), indent=2, ensure_ascii=False) + "\n"
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+import asyncio
+import time
+import types
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Union, cast, get_args, get_origin
+
+import networkx as nx
+
+from persica.applicationbuilder import ApplicationBuilder
+from persica.context.application import ApplicationContext
+from persica.context.bus import get_subscriptions
+from persica.context.supervisor import get_background_tasks
+from persica.error import AmbiguousParameterException
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import DEFAULT_ORDER, AsyncInitializingComponent
+from persica.factory.pool import ObjectPool
+from persica.inspect.report import ComponentInfo, StartupReport
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from persica.application import Application
+
+_LOGGER = get_logger(__name__, "StartupAnalyzer")
+
+
+def get_class_name(cls: type[object]) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class InspectingFactory(AbstractAutowireCapableFactory):
+    """
+    记录每个类构造耗时的工厂，耗时不包含创建依赖对象的时间。
+    """
+
+    # 构造耗时（秒），key 为对象的类
+    construct_times: dict[type[object], float]
+
+    def __init__(self, external_objects: Iterable[object] | None = None):
+        super().__init__(external_objects)
+        self.construct_times = {}
+        # 同步创建的嵌套栈，每层累计在其中创建的依赖对象的耗时
+        self._nested_times: list[float] = []
+        # 异步创建时构建参数的耗时，即等待依赖对象的时间
+        self._params_times: dict[type[object], float] = {}
+
+    def create_object(self, cls: type[object]) -> object:
+        start = time.perf_counter()
+        self._nested_times.append(0.0)
+        try:
+            obj = super().create_object(cls)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested_times.pop()
+            if self._nested_times:
+                self._nested_times[-1] += elapsed
+        self.construct_times[cls] = elapsed - nested
+        return obj
+
+    async def acreate_object(self, cls: type[object]) -> object:
+        start = time.perf_counter()
+        obj = await super().acreate_object(cls)
+        self.construct_times[cls] = time.perf_counter() - start - self._params_times.pop(cls, 0.0)
+        return obj
+
+    async def _abuild_constructor_params(self, cls: type[object]) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return await super()._abuild_constructor_params(cls)
+        finally:
+            self._params_times[cls] = time.perf_counter() - start
+
+    def get_declared_dependencies(self, cls: type[object]) -> set[type[object]]:
+        """
+        根据构造参数的注解解析依赖的类，不创建任何对象。
+        """
+        result: set[type[object]] = set()
+        for _, parameter in self._iter_constructor_parameters(cls):
+            result.update(self._get_annotation_classes(parameter.annotation))
+        result.discard(cls)
+        return result
+
+    def _get_annotation_classes(self, annotation: Any) -> tuple[type[object], ...]:
+        """
+        与 _plan_dependency 支持的注解形式一致，返回注解对应的对象定义。
+        """
+        origin = get_origin(annotation)
+        if origin is None:
+            if not isinstance(annotation, type) or annotation in self.external_objects:
+                return ()
+            if annotation in self.object_definitions:
+                return (annotation,)
+            try:
+                implementation = self.type_index.get_unique(annotation)
+            except AmbiguousParameterException:
+                # 运行时会创建失败，图中保留所有候选以便定位
+                return self.type_index.get_all(annotation)
+            return () if implementation is None else (implementation,)
+        return self._get_generic_annotation_classes(origin, get_args(annotation))
+
+    def _get_generic_annotation_classes(self, origin: Any, args: tuple[Any, ...]) -> tuple[type[object], ...]:
+        if origin is ObjectPool:
+            return tuple(x for x in args[:1] if x in self.object_definitions)
+        if origin is Union or origin is types.UnionType:
+            return tuple(cls for x in args if x is not type(None) for cls in self._get_annotation_classes(x))
+        if (origin is list and args) or (origin is tuple and args[1:] == (Ellipsis,)):
+            return self.type_index.get_all(args[0])
+        return ()
+
+
+class InspectingApplicationContext(ApplicationContext):
+    """
+    记录每个组件 initialize 耗时的应用上下文。
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # 初始化耗时（秒），key 为组件的类
+        self.initialize_times: dict[type[object], float] = {}
+
+    async def _initialize_component(self, component: AsyncInitializingComponent):
+        start = time.perf_counter()
+        await super()._initialize_component(component)
+        self.initialize_times[type(component)] = time.perf_counter() - start
+
+
+class InspectingApplicationBuilder(ApplicationBuilder):
+    _application_context_class = InspectingApplicationContext
+    _abstract_autowire_capable_factory_class = InspectingFactory
+
+
+class StartupAnalyzer:
+    """
+    分析应用的启动过程：扫描并注册组件，可选地实例化和初始化组件，
+    根据构造依赖图和测量的耗时计算关键路径，并找出没有被注入的组件和导入耗时最高的模块。
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(
+        self,
+        packages: list[str],
+        profiles: list[str] | None = None,
+        instantiate: bool = False,
+        initialize: bool = False,
+    ):
+        self.packages = packages
+        self.profiles = profiles
+        # 初始化组件前必须先实例化
+        self.instantiate = instantiate or initialize
+        self.initialize = initialize
+
+    def run(self) -> StartupReport:
+        loop = asyncio.new_event_loop()
+        try:
+            builder = InspectingApplicationBuilder().set_scanner_packages(self.packages).set_loop(loop)
+            if self.profiles is not None:
+                builder.set_profiles(self.profiles)
+            return self._run(builder.build(), loop)
+        finally:
+            loop.close()
+
+    def _run(self, application: "Application", loop: asyncio.AbstractEventLoop) -> StartupReport:
+        factory = cast("InspectingFactory", application.factory)
+        context = cast("InspectingApplicationContext", application.context)
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        application.class_scanner.flash()
+        timings["scan"] = time.perf_counter() - start
+        start = time.perf_counter()
+        application.registry.flash()
+        timings["registry"] = time.perf_counter() - start
+        factory.build_type_index()
+        dependencies = {cls: self._get_declared_dependencies(factory, cls) for cls in list(factory.object_definitions)}
+        if self.instantiate:
+            start = time.perf_counter()
+            factory.instantiate_all_objects()
+            loop.run_until_complete(factory.instantiate_deferred_objects())
+            timings["instantiate"] = time.perf_counter() - start
+        if self.initialize:
+            start = time.perf_counter()
+            try:
+                loop.run_until_complete(application.initialize())
+                loop.run_until_complete(context.wait_background())
+                timings["initialize"] = time.perf_counter() - start
+            finally:
+                loop.run_until_complete(application.shutdown())
+        # 实例化时实际解析到的依赖补充静态解析的结果
+        for cls, classes in factory.dependencies.items():
+            dependencies.setdefault(cls, set()).update(classes)
+        report = self._build_report(application, dependencies)
+        report.timings = timings
+        report.import_costs = sorted(
+            application.registry.import_module_times.items(), key=lambda item: item[1], reverse=True
+        )
+        return report
+
+    def _build_report(
+        self, application: "Application", dependencies: dict[type[object], set[type[object]]]
+    ) -> StartupReport:
+        factory = cast("InspectingFactory", application.factory)
+        context = cast("InspectingApplicationContext", application.context)
+        class_graph = application.class_scanner.class_graph
+        components: dict[str, ComponentInfo] = {}
+        graph = nx.DiGraph()
+        for cls, definition in factory.object_definitions.items():
+            name = get_class_name(cls)
+            info = ComponentInfo(
+                name,
+                cls.__module__,
+                getattr(cls, "__order__", DEFAULT_ORDER),
+                bool(definition.is_factory),
+                self._is_entrypoint(cls),
+            )
+            if self.instantiate:
+                info.construct_seconds = factory.construct_times.get(cls)
+            if self.initialize:
+                info.initialize_seconds = context.initialize_times.get(cls)
+            if name in class_graph.graph:
+                info.ancestors = sorted(class_graph.find_all_ancestors(name))
+            components[name] = info
+            graph.add_node(name)
+        for cls, classes in dependencies.items():
+            for dependency in classes:
+                source, target = get_class_name(dependency), get_class_name(cls)
+                if source in components and target in components:
+                    graph.add_edge(source, target)
+        for name, info in components.items():
+            info.dependencies = sorted(graph.predecessors(name))
+            info.dependents = sorted(graph.successors(name))
+        report = StartupReport(self.packages, components, graph, class_graph.graph)
+        self._find_critical_path(report)
+        return report
+
+    def _get_declared_dependencies(self, factory: InspectingFactory, cls: type[object]) -> set[type[object]]:
+        try:
+            return factory.get_declared_dependencies(cls)
+        except (NameError, ValueError) as exc:
+            # 注解只在类型检查时可用等情况，实例化后由实际解析到的依赖补充
+            self._logger.warning("Cannot resolve constructor annotations of %s: %s", cls.__name__, exc)
+            return set()
+
+    @staticmethod
+    def _is_entrypoint(_class: type[object]) -> bool:
+        initialize = getattr(_class, "initialize", None)
+        if initialize is not None and initialize is not AsyncInitializingComponent.initialize:
+            return True
+        return bool(get_background_tasks(_class) or get_subscriptions(_class))
+
+    def _find_critical_path(self, report: StartupReport):
+        graph = report.dependency_graph
+        try:
+            order = list(nx.topological_sort(graph))
+        except nx.NetworkXUnfeasible:
+            report.cycle = [source for source, _ in nx.find_cycle(graph)]
+            self._logger.warning("Constructor dependencies contain a cycle: %s", report.cycle)
+            return
+        timed = self.instantiate
+        report.cost_unit = "seconds" if timed else "components"
+        # 以每个组件结尾的最大代价及路径上的前一个组件
+        best: dict[str, tuple[float, str | None]] = {}
+        for name in order:
+            cost = report.components[name].cost if timed else 1.0
+            previous: str | None = None
+            total = 0.0
+            for predecessor in graph.predecessors(name):
+                if best[predecessor][0] > total:
+                    total, previous = best[predecessor][0], predecessor
+            best[name] = (total + cost, previous)
+        if not best:
+            return
+        end: str | None = max(order, key=lambda x: best[x][0])
+        report.critical_path_cost = best[end][0]
+        path: list[str] = []
+        while end is not None:
+            path.append(end)
+            end = best[end][1]
+        report.critical_path = path[::-1]
@@ -0,0 +1,148 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+class ComponentInfo:
+    """
+    单个对象定义的分析结果，耗时只在实例化或初始化后才有值。
+    """
+
+    def __init__(self, name: str, module: str, order: int, is_factory: bool, entrypoint: bool):
+        self.name = name
+        self.module = module
+        self.order = order
+        self.is_factory = is_factory
+        # 组件自身会被容器调用：实现了 initialize、声明了后台任务或订阅了事件
+        self.entrypoint = entrypoint
+        # 构造耗时（秒），不包含创建依赖对象的时间
+        self.construct_seconds: float | None = None
+        self.initialize_seconds: float | None = None
+        self.dependencies: list[str] = []
+        self.dependents: list[str] = []
+        # 扫描范围内的所有父类
+        self.ancestors: list[str] = []
+
+    @property
+    def cost(self) -> float:
+        return (self.construct_seconds or 0.0) + (self.initialize_seconds or 0.0)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "module": self.module,
+            "order": self.order,
+            "is_factory": self.is_factory,
+            "entrypoint": self.entrypoint,
+            "construct_seconds": self.construct_seconds,
+            "initialize_seconds": self.initialize_seconds,
+            "dependencies": self.dependencies,
+            "dependents": self.dependents,
+            "ancestors": self.ancestors,
+        }
+
+
+class StartupReport:
+    """
+    启动分析的结果，可以输出为 JSON 兼容的字典或 Graphviz DOT。
+
+    关键路径是构造依赖图中代价最大的一条依赖链，代价为构造与初始化耗时之和；
+    没有测量耗时时每个组件的代价为 1，即最长的依赖链。
+    """
+
+    def __init__(
+        self,
+        packages: list[str],
+        components: dict[str, ComponentInfo],
+        dependency_graph: "nx.DiGraph",
+        class_graph: "nx.DiGraph",
+    ):
+        self.packages = packages
+        self.components = components
+        # 构造依赖图，边从被依赖方指向依赖方，即创建顺序
+        self.dependency_graph = dependency_graph
+        # 扫描得到的继承关系图，边从父类指向子类
+        self.class_graph = class_graph
+        # 各阶段耗时（秒）：scan、registry、instantiate、initialize
+        self.timings: dict[str, float] = {}
+        # 模块导入耗时（秒），按耗时降序排列
+        self.import_costs: list[tuple[str, float]] = []
+        self.critical_path: list[str] = []
+        self.critical_path_cost: float = 0.0
+        # 关键路径代价的单位，seconds 或 components
+        self.cost_unit: str = "components"
+        # 构造依赖存在环时记录其中一个环，此时无法计算关键路径
+        self.cycle: list[str] = []
+
+    @property
+    def never_injected(self) -> list[str]:
+        """
+        没有被任何组件注入的组件，工厂除外。
+        """
+        return [name for name, info in self.components.items() if not info.dependents and not info.is_factory]
+
+    def to_dict(self, top: int | None = None) -> dict[str, Any]:
+        import_costs = self.import_costs if top is None else self.import_costs[:top]
+        return {
+            "packages": self.packages,
+            "timings": self.timings,
+            "critical_path": {
+                "components": self.critical_path,
+                "cost": self.critical_path_cost,
+                "unit": self.cost_unit,
+                "cycle": self.cycle,
+            },
+            "never_injected": [
+                {"name": name, "entrypoint": self.components[name].entrypoint} for name in self.never_injected
+            ],
+            "import_costs": [{"module": module, "seconds": seconds} for module, seconds in import_costs],
+            "class_graph": {
+                "classes": self.class_graph.number_of_nodes(),
+                "edges": self.class_graph.number_of_edges(),
+            },
+            "components": [info.to_dict() for info in self.components.values()],
+        }
+
+    def to_dot(self, graph: str = "dependencies") -> str:
+        """
+        输出 Graphviz DOT。graph 为 dependencies 时输出构造依赖图并标出关键路径，
+        为 classes 时输出扫描得到的继承关系图。
+        """
+        if graph == "classes":
+            return self._render_dot("classes", {node: node for node in self.class_graph}, self.class_graph, set())
+        if graph != "dependencies":
+            raise ValueError(f"Unknown graph {graph}")
+        labels = {name: self._get_label(info) for name, info in self.components.items()}
+        critical = set(zip(self.critical_path, self.critical_path[1:], strict=False))
+        return self._render_dot("dependencies", labels, self.dependency_graph, critical)
+
+    def _render_dot(
+        self, name: str, labels: dict[str, str], graph: "nx.DiGraph", critical: set[tuple[str, str]]
+    ) -> str:
+        on_path = set(self.critical_path) if critical else set()
+        lines = [f"digraph {name} {{", "  rankdir=LR;", "  node [shape=box];"]
+        for node, label in labels.items():
+            attributes = [f"label={_quote(label)}"]
+            if node in on_path:
+                attributes.append("color=red")
+            lines.append(f"  {_quote(node)} [{', '.join(attributes)}];")
+        for source, target in graph.edges():
+            suffix = " [color=red, penwidth=2]" if (source, target) in critical else ""
+            lines.append(f"  {_quote(source)} -> {_quote(target)}{suffix};")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _get_label(info: ComponentInfo) -> str:
+        label = info.name.rpartition(".")[2]
+        if info.construct_seconds is not None:
+            label += f"\\nconstruct {info.construct_seconds * 1000:.2f}ms"
+        if info.initialize_seconds is not None:
+            label += f"\\ninitialize {info.initialize_seconds * 1000:.2f}ms"
+        return label
+
+
+def _quote(value: str) -> str:
+    # 标签中的 \n 是 DOT 的换行转义，需要保留
+    return '"' + value.replace('"', '\\"') + '"'
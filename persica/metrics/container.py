@@ -0,0 +1,139 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from persica.metrics.registry import Counter, Gauge, Metric, MetricsRegistry
+
+if TYPE_CHECKING:
+    from persica.context.bus import EventBus
+    from persica.context.shutdown import ShutdownReport
+    from persica.factory.abstract import AbstractAutowireCapableFactory
+
+# 对象池统计中按计数器输出的字段及说明
+_POOL_COUNTERS: tuple[tuple[str, str, str], ...] = (
+    ("acquisitions", "persica_pool_acquisitions_total", "Objects leased from the pool"),
+    ("hits", "persica_pool_hits_total", "Leases served by an idle or released object"),
+    ("created", "persica_pool_created_total", "Objects created by the pool"),
+    ("waits", "persica_pool_waits_total", "Leases that had to wait for a released object"),
+    ("wait_time", "persica_pool_wait_seconds_total", "Time spent waiting for a released object"),
+    ("evicted", "persica_pool_evicted_total", "Idle objects evicted after the idle timeout"),
+)
+
+
+class ContainerMetrics:
+    """
+    容器的运行时指标。工厂和应用上下文只在启用指标时持有该对象，未启用时只有一次 None 判断的开销。
+    已经由容器自行维护的数据（单例数量、对象池统计等）在采集时读取，不会在运行时重复统计。
+    """
+
+    def __init__(self, registry: MetricsRegistry, factory: "AbstractAutowireCapableFactory"):
+        self.registry = registry
+        self.factory = factory
+        self.object_creation = registry.histogram(
+            "persica_object_creation_seconds", "Time spent creating container managed objects", ["component"]
+        )
+        self.component_initialize = registry.gauge(
+            "persica_component_initialize_seconds", "Duration of the last initialize() call", ["component"]
+        )
+        self.component_shutdown = registry.gauge(
+            "persica_component_shutdown_seconds", "Duration of the last shutdown() call", ["component", "status"]
+        )
+        self.component_failures = registry.counter(
+            "persica_component_failures_total", "Lifecycle methods that raised an exception", ["component", "phase"]
+        )
+        self.startup = registry.gauge("persica_startup_seconds", "Duration of the application initialize phase")
+        self.task_run = registry.histogram("persica_task_run_seconds", "Duration of each background task run", ["task"])
+        self.task_lag = registry.histogram(
+            "persica_task_lag_seconds", "Delay between the scheduled and the actual start of a run", ["task"]
+        )
+        self.task_failures = registry.counter(
+            "persica_task_failures_total", "Background task runs that raised", ["task"]
+        )
+        self.task_restarts = registry.counter("persica_task_restarts_total", "Background task restarts", ["task"])
+        self.event_buses: list[EventBus] = []
+        registry.add_collector(self.collect)
+
+    def add_event_bus(self, bus: "EventBus"):
+        self.event_buses.append(bus)
+
+    def observe_creation(self, cls: type[object], elapsed: float):
+        self.object_creation.observe(elapsed, component=cls.__name__)
+
+    def observe_initialize(self, component: object, elapsed: float, succeeded: bool):
+        name = type(component).__name__
+        self.component_initialize.set(elapsed, component=name)
+        if not succeeded:
+            self.component_failures.inc(component=name, phase="initialize")
+
+    def observe_shutdown(self, report: "ShutdownReport"):
+        for record in report.records:
+            self.component_shutdown.set(record.elapsed, component=record.name, status=record.status.value)
+        for record in report.failed:
+            self.component_failures.inc(component=record.name, phase="shutdown")
+
+    def observe_task_run(self, name: str, elapsed: float):
+        self.task_run.observe(elapsed, task=name)
+
+    def observe_task_lag(self, name: str, lag: float):
+        self.task_lag.observe(lag, task=name)
+
+    def observe_task_failure(self, name: str):
+        self.task_failures.inc(task=name)
+
+    def observe_task_restart(self, name: str):
+        self.task_restarts.inc(task=name)
+
+    def collect(self) -> Iterator[Metric]:
+        factory = self.factory
+        for name, documentation, value in (
+            ("persica_singletons", "Singleton objects created by the container", len(factory.singleton_objects)),
+            ("persica_factories", "Factory objects created by the container", len(factory.singleton_factories)),
+            ("persica_definitions", "Registered object definitions", len(factory.object_definitions)),
+            ("persica_lazy_definitions", "Object definitions not imported yet", len(factory.lazy_definitions)),
+        ):
+            gauge = Gauge(self.registry.full_name(name), documentation)
+            gauge.set(value)
+            yield gauge
+        yield from self._collect_event_buses()
+        pools = list(factory.pools.values())
+        if not pools:
+            return
+        for field, name, documentation in _POOL_COUNTERS:
+            counter = Counter(self.registry.full_name(name), documentation, ["pool"])
+            for pool in pools:
+                counter.inc(getattr(pool.stats, field), pool=pool.name)
+            yield counter
+        for name, documentation, attribute in (
+            ("persica_pool_size", "Maximum number of objects in the pool", "size"),
+            ("persica_pool_idle", "Idle objects in the pool", "idle"),
+            ("persica_pool_in_use", "Objects currently leased from the pool", "in_use"),
+        ):
+            gauge = Gauge(self.registry.full_name(name), documentation, ["pool"])
+            for pool in pools:
+                gauge.set(getattr(pool, attribute), pool=pool.name)
+            yield gauge
+
+    def _collect_event_buses(self) -> Iterator[Metric]:
+        if not self.event_buses:
+            return
+        full_name = self.registry.full_name
+        published = Counter(full_name("persica_events_published_total"), "Events published to a topic", ["topic"])
+        depth = Gauge(full_name("persica_event_queue_depth"), "Events queued for the handlers of a topic", ["topic"])
+        handled = Counter(
+            full_name("persica_events_handled_total"), "Events handled successfully", ["topic", "handler"]
+        )
+        failures = Counter(
+            full_name("persica_event_failures_total"), "Events whose handler raised", ["topic", "handler"]
+        )
+        unrouted = Counter(
+            full_name("persica_events_unrouted_total"), "Events published to a topic without subscribers"
+        )
+        for bus in self.event_buses:
+            unrouted.inc(bus.unrouted)
+            for topic, stats in list(bus.topics.items()):
+                published.inc(stats.published, topic=topic)
+                depth.inc(bus.get_queue_depth(topic), topic=topic)
+            for subscription in bus.subscriptions:
+                topic = subscription.spec.topic
+                handled.inc(subscription.handled, topic=topic, handler=subscription.name)
+                failures.inc(subscription.failures, topic=topic, handler=subscription.name)
+        yield from (published, unrouted, depth, handled, failures)
@@ -0,0 +1,86 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from persica.factory.component import AsyncInitializingComponent
+from persica.metrics.registry import MetricsRegistry
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+_LOGGER = get_logger(__name__, "MetricsEndpoint")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsEndpoint(AsyncInitializingComponent):
+    """
+    以 Prometheus 文本格式提供指标的 HTTP 端点，只支持 `GET {path}`。
+    使用时在扫描的包中继承该类，并通过类属性修改监听地址：
+
+        class Metrics(MetricsEndpoint):
+            port = 9464
+
+    应用需要通过 ApplicationBuilder.set_metrics() 启用指标，否则端点不会启动。
+    """
+
+    _logger: "Logger" = _LOGGER
+    host: str = "127.0.0.1"
+    port: int = 9464
+    path: str = "/metrics"
+    # 读取请求头的超时时间（秒）
+    read_timeout: float = 5.0
+
+    def __init__(self, metrics: MetricsRegistry | None = None):
+        self.metrics = metrics
+        self.server: asyncio.Server | None = None
+        # 实际监听的端口，port 为 0 时由系统分配
+        self.bound_port: int | None = None
+
+    async def initialize(self):
+        if self.metrics is None:
+            self._logger.warning("Metrics are not enabled, %s will not start", type(self).__name__)
+            return
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.bound_port = self.server.sockets[0].getsockname()[1]
+        self._logger.info("Serving metrics on http://%s:%s%s", self.host, self.bound_port, self.path)
+
+    async def shutdown(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), self.read_timeout)
+            # 读取并丢弃请求头
+            while True:
+                line = await asyncio.wait_for(reader.readline(), self.read_timeout)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] not in ("GET", "HEAD"):  # noqa: PLR2004
+                self._write(writer, "405 Method Not Allowed", b"")
+            elif parts[1].split("?", 1)[0] != self.path:
+                self._write(writer, "404 Not Found", b"")
+            else:
+                body = self.metrics.render().encode() if self.metrics is not None else b""
+                self._write(writer, "200 OK", body, include_body=parts[0] == "GET")
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _write(writer: asyncio.StreamWriter, status: str, body: bytes, include_body: bool = True):
+        headers = (
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(headers.encode("latin-1"))
+        if include_body:
+            writer.write(body)
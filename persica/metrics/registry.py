@@ -0,0 +1,266 @@
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+
+# 与 Prometheus 客户端一致的默认直方图分桶（秒）
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# 一个采样点：指标名称、标签和值
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+class Metric:
+    """
+    指标的基类，按标签值分别记录数据。所有方法都是线程安全的。
+    """
+
+    type_name: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as exc:
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}") from exc
+
+    def _label_pairs(self, values: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, values, strict=True))
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape_help(self.documentation)}", f"# TYPE {self.name} {self.type_name}"]
+        for name, labels, value in self.samples():
+            if labels:
+                label_text = ",".join(f'{key}="{_escape_label_value(item)}"' for key, item in labels)
+                lines.append(f"{name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """
+    只增不减的计数器。
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object):
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: object) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, self._label_pairs(key), value
+
+
+class Gauge(Metric):
+    """
+    可增可减的测量值。没有标签的 Gauge 可以通过 set_function 在采集时计算。
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float, **labels: object):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]):
+        if self.labelnames:
+            raise ValueError("set_function is only supported for gauges without labels")
+        self._function = function
+
+    def get(self, **labels: object) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        if self._function is not None:
+            yield self.name, (), float(self._function())
+            return
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, self._label_pairs(key), value
+
+
+class Histogram(Metric):
+    """
+    直方图，记录观测值在各分桶中的累计数量、总和与次数。
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        if "le" in labelnames:
+            raise ValueError("Histogram cannot have a label named 'le'")
+        super().__init__(name, documentation, labelnames)
+        upper_bounds = sorted(float(bucket) for bucket in buckets)
+        if not upper_bounds or not math.isinf(upper_bounds[-1]):
+            upper_bounds.append(math.inf)
+        self.upper_bounds: tuple[float, ...] = tuple(upper_bounds)
+        # key 为标签值，value 为各分桶（非累计）的数量、总和与次数
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: object):
+        key = self._label_values(labels)
+        with self._lock:
+            data = self._values.get(key)
+            if data is None:
+                data = self._values[key] = ([0] * len(self.upper_bounds), [0.0, 0.0])
+            counts, totals = data
+            for index, bound in enumerate(self.upper_bounds):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            totals[0] += value
+            totals[1] += 1
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels: object) -> int:
+        data = self._values.get(self._label_values(labels))
+        return 0 if data is None else int(data[1][1])
+
+    def get_sum(self, **labels: object) -> float:
+        data = self._values.get(self._label_values(labels))
+        return 0.0 if data is None else data[1][0]
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = [(key, list(counts), list(totals)) for key, (counts, totals) in self._values.items()]
+        for key, counts, totals in items:
+            labels = self._label_pairs(key)
+            cumulative = 0
+            for bound, count in zip(self.upper_bounds, counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket", (*labels, ("le", _format_value(bound))), cumulative
+            yield f"{self.name}_sum", labels, totals[0]
+            yield f"{self.name}_count", labels, totals[1]
+
+
+class MetricsRegistry:
+    """
+    指标注册表。注册的指标和采集函数在 render 时输出为 Prometheus 文本格式。
+    采集函数在每次采集时调用，返回根据当前状态临时创建的指标，适合对象池等已经自行统计的数据。
+    """
+
+    def __init__(self, namespace: str = ""):
+        # 指标名称的前缀，例如 "myapp" 会生成 "myapp_persica_singletons"
+        self.namespace = namespace
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+        self._lock = threading.Lock()
+
+    def full_name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _get_or_create(self, metric_class: type[Metric], name: str, *args, **kwargs) -> Metric:
+        full_name = self.full_name(name)
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = metric_class(full_name, *args, **kwargs)
+            elif type(metric) is not metric_class:
+                raise ValueError(f"Metric {full_name} is already registered as a {metric.type_name}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)  # type: ignore[return-value]
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(self.full_name(name))
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]):
+        self._collectors.append(collector)
+
+    def collect(self) -> list[Metric]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for collector in list(self._collectors):
+            metrics.extend(collector())
+        return metrics
+
+    def render(self) -> str:
+        """
+        输出 Prometheus 文本格式（0.0.4）。
+        """
+        return "".join(metric.render() for metric in self.collect())
@@ -0,0 +1,238 @@
+import ast
+import dis
+from types import CodeType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# 不影响求值栈中类定义参数的指令
+_IGNORED_OPNAMES = frozenset(
+    {
+        "CACHE",
+        "COPY_FREE_VARS",
+        "EXTENDED_ARG",
+        "NOP",
+        "PRECALL",
+        "PUSH_NULL",
+        "RESUME",
+        "SET_FUNCTION_ATTRIBUTE",
+    }
+)
+_LOAD_NAME_OPNAMES = frozenset({"LOAD_NAME", "LOAD_GLOBAL", "LOAD_DEREF", "LOAD_CLASSDEREF", "LOAD_FAST"})
+_STORE_NAME_OPNAMES = frozenset({"STORE_NAME", "STORE_GLOBAL", "STORE_FAST", "STORE_DEREF"})
+_CALL_OPNAMES = frozenset({"CALL", "CALL_FUNCTION", "CALL_FUNCTION_KW", "CALL_KW", "CALL_METHOD"})
+# 参数列表中关键字名称元组位于栈顶的调用指令（3.10 与 3.13+）
+_CALL_KW_OPNAMES = frozenset({"CALL_FUNCTION_KW", "CALL_KW"})
+# MAKE_FUNCTION 生成的类体函数在栈中的占位
+_FUNCTION = object()
+
+
+class _Unknown(ast.Constant):
+    """无法还原的表达式，ClassVisitor 会将其作为无法解析的父类忽略"""
+
+    def __init__(self):
+        super().__init__(value=None)
+
+
+def code_to_module(code: CodeType) -> ast.Module:
+    """
+    从模块的代码对象还原出只包含导入语句和类定义的 AST，供 ClassVisitor 使用。
+    类定义会还原父类和字面量关键字参数，函数和类体中的语句按原有顺序展开。
+    """
+    module = ast.Module(body=_read_statements(code), type_ignores=[])
+    return ast.fix_missing_locations(module)
+
+
+def _read_statements(code: CodeType) -> list[ast.stmt]:
+    instructions = [instr for instr in dis.get_instructions(code) if instr.opname not in _IGNORED_OPNAMES]
+    body: list[ast.stmt] = []
+    index = 0
+    while index < len(instructions):
+        instr = instructions[index]
+        if instr.opname == "IMPORT_NAME":
+            node, index = _read_import(instructions, index)
+            if node is not None:
+                body.append(node)
+        elif instr.opname == "LOAD_BUILD_CLASS":
+            node, index = _ClassReader(code).read(instructions, index + 1)
+            if node is not None:
+                body.append(node)
+        else:
+            if instr.opname == "LOAD_CONST" and isinstance(instr.argval, CodeType):
+                # 函数体中的导入和类定义同样会被 ClassVisitor 访问
+                body.extend(_read_statements(instr.argval))
+            index += 1
+    return body
+
+
+def _read_import(instructions: list[dis.Instruction], index: int) -> tuple[ast.stmt | None, int]:
+    instr = instructions[index]
+    module: str = instr.argval
+    level = 0
+    fromlist = None
+    if index >= 2 and instructions[index - 1].opname == "LOAD_CONST" and instructions[index - 2].opname == "LOAD_CONST":  # noqa: PLR2004
+        fromlist = instructions[index - 1].argval
+        level = instructions[index - 2].argval if isinstance(instructions[index - 2].argval, int) else 0
+    index += 1
+    if not fromlist:
+        # import a.b 保存名称 a；import a.b as c 先通过 IMPORT_FROM 取出子模块再保存为 c
+        has_import_from = False
+        while index < len(instructions) and instructions[index].opname not in _STORE_NAME_OPNAMES:
+            if instructions[index].opname == "IMPORT_FROM":
+                has_import_from = True
+            elif instructions[index].opname not in ("SWAP", "ROT_TWO", "POP_TOP"):
+                return None, index
+            index += 1
+        if index >= len(instructions):
+            return None, index
+        stored = instructions[index].argval
+        asname = stored if has_import_from or stored != module.partition(".")[0] else None
+        return ast.Import(names=[ast.alias(name=module, asname=asname)]), index + 1
+    if tuple(fromlist) == ("*",):
+        return ast.ImportFrom(module=module or None, names=[ast.alias(name="*")], level=level), index + 1
+    names = []
+    while (
+        index + 1 < len(instructions)
+        and instructions[index].opname == "IMPORT_FROM"
+        and instructions[index + 1].opname in _STORE_NAME_OPNAMES
+    ):
+        name = instructions[index].argval
+        stored = instructions[index + 1].argval
+        names.append(ast.alias(name=name, asname=stored if stored != name else None))
+        index += 2
+    if not names:
+        return None, index
+    return ast.ImportFrom(module=module or None, names=names, level=level), index
+
+
+class _ClassReader:
+    """
+    模拟 LOAD_BUILD_CLASS 到对应调用指令之间的求值栈，还原类名、父类和关键字参数。
+    """
+
+    def __init__(self, code: CodeType):
+        self.code = code
+        self.stack: list[Any] = []
+        self.kwnames: tuple[str, ...] = ()
+        self.body_code: CodeType | None = None
+        self.handlers: dict[str, Callable[[dis.Instruction], bool]] = {
+            "LOAD_CONST": self._load_const,
+            "MAKE_FUNCTION": self._make_function,
+            "LOAD_ATTR": self._load_attr,
+            "LOAD_METHOD": self._load_attr,
+            "BINARY_SUBSCR": self._binary_subscr,
+            "BUILD_LIST": self._build_sequence,
+            "BUILD_TUPLE": self._build_sequence,
+            "BUILD_SET": self._build_sequence,
+            "LIST_EXTEND": self._extend,
+            "SET_UPDATE": self._extend,
+            "KW_NAMES": self._kw_names,
+            "LOAD_CLOSURE": self._push_unknown,
+        }
+        for opname in _LOAD_NAME_OPNAMES:
+            self.handlers[opname] = self._load_name
+
+    def read(self, instructions: list[dis.Instruction], index: int) -> tuple[ast.ClassDef | None, int]:
+        while index < len(instructions):
+            instr = instructions[index]
+            index += 1
+            if instr.opname in _CALL_OPNAMES:
+                if self._call(instr):
+                    return _build_class_def(self.stack, self.kwnames, self.body_code), index
+                continue
+            handler = self.handlers.get(instr.opname)
+            # 遇到无法模拟的指令（跳转、解包等）时放弃还原该类
+            if handler is None or not handler(instr):
+                return None, index
+        return None, index
+
+    def _pop(self) -> Any:
+        return self.stack.pop() if self.stack else _Unknown()
+
+    def _load_const(self, instr: dis.Instruction) -> bool:
+        self.stack.append(ast.Constant(value=instr.argval))
+        return True
+
+    def _load_name(self, instr: dis.Instruction) -> bool:
+        self.stack.append(ast.Name(id=instr.argval, ctx=ast.Load()))
+        return True
+
+    def _load_attr(self, instr: dis.Instruction) -> bool:
+        self.stack.append(ast.Attribute(value=self._pop(), attr=instr.argval, ctx=ast.Load()))
+        return True
+
+    def _push_unknown(self, _instr: dis.Instruction) -> bool:
+        self.stack.append(_Unknown())
+        return True
+
+    def _make_function(self, _instr: dis.Instruction) -> bool:
+        # 3.10 的 MAKE_FUNCTION 在代码对象之后还有限定名，从最后一个代码对象开始整体替换
+        positions = [i for i, item in enumerate(self.stack) if isinstance(getattr(item, "value", None), CodeType)]
+        if not positions:
+            return False
+        function_code = self.stack[positions[-1]].value
+        del self.stack[positions[-1] :]
+        if self.body_code is None and not self.stack:
+            self.body_code = function_code
+            self.stack.append(_FUNCTION)
+        else:
+            self.stack.append(_Unknown())
+        return True
+
+    def _binary_subscr(self, _instr: dis.Instruction) -> bool:
+        item = self._pop()
+        self.stack.append(ast.Subscript(value=self._pop(), slice=item, ctx=ast.Load()))
+        return True
+
+    def _build_sequence(self, instr: dis.Instruction) -> bool:
+        count = instr.arg or 0
+        elements = self.stack[len(self.stack) - count :] if count else []
+        del self.stack[len(self.stack) - count :]
+        if instr.opname == "BUILD_SET":
+            self.stack.append(ast.Set(elts=elements))
+        else:
+            node_class = ast.List if instr.opname == "BUILD_LIST" else ast.Tuple
+            self.stack.append(node_class(elts=elements, ctx=ast.Load()))
+        return True
+
+    def _extend(self, _instr: dis.Instruction) -> bool:
+        # 常量列表编译为 BUILD_LIST 0 + LOAD_CONST (...) + LIST_EXTEND
+        values = self._pop()
+        target = self.stack[-1] if self.stack else None
+        if not isinstance(values, ast.Constant) or not isinstance(target, (ast.List, ast.Set)):
+            return False
+        target.elts.extend(ast.Constant(value=value) for value in values.value)
+        return True
+
+    def _kw_names(self, instr: dis.Instruction) -> bool:
+        self.kwnames = self.code.co_consts[instr.arg]
+        return True
+
+    def _call(self, instr: dis.Instruction) -> bool:
+        """
+        处理调用指令，返回 True 表示这是创建类的调用。
+        """
+        argc = instr.arg or 0
+        if instr.opname in _CALL_KW_OPNAMES:
+            names = self._pop()
+            self.kwnames = names.value if isinstance(names, ast.Constant) else ()
+        if len(self.stack) == argc and self.stack and self.stack[0] is _FUNCTION:
+            return True
+        # 父类或关键字参数中的函数调用，整体作为无法还原的表达式
+        del self.stack[max(len(self.stack) - argc - 1, 0) :]
+        self.stack.append(_Unknown())
+        self.kwnames = ()
+        return False
+
+
+def _build_class_def(stack: list[Any], kwnames: tuple[str, ...], body_code: CodeType | None) -> ast.ClassDef | None:
+    name = stack[1] if len(stack) > 1 else None
+    if not isinstance(name, ast.Constant) or not isinstance(name.value, str):
+        return None
+    arguments = stack[2:]
+    split = len(arguments) - len(kwnames)
+    bases = arguments[:split]
+    keywords = [ast.keyword(arg=arg, value=value) for arg, value in zip(kwnames, arguments[split:], strict=True)]
+    body: list[ast.stmt] = _read_statements(body_code) if body_code is not None else []
+    return ast.ClassDef(name=name.value, bases=bases, keywords=keywords, body=body or [ast.Pass()], decorator_list=[])
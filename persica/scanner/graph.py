@@ -1,5 +1,11 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
 import networkx as nx
 
+if TYPE_CHECKING:
+    from persica.utils.condition import Condition
+
 
 class ConflictInfo:
     def __init__(self, parent: str, child: str, parent_order: int, child_order: int):
@@ -26,6 +32,7 @@ class ClassGraph:
         self.graph = nx.DiGraph()
         self.class_to_module: dict[str, str] = {}  # 存储类名到模块路径的映射
         self.class_to_order: dict[str, int] = {}  # 存储类名到加载顺序的映射
+        self.class_to_condition: dict[str, Condition] = {}  # 存储类名到静态激活条件的映射
         self.default_order = default_order
 
     def add_class(self, class_name: str, parent_names: set[str], module_path: str):
@@ -38,6 +45,23 @@ class ClassGraph:
         """设置手动加载顺序"""
         self.class_to_order[class_name] = order
 
+    def set_condition(self, class_name: str, condition: "Condition"):
+        """设置静态提取的激活条件"""
+        self.class_to_condition[class_name] = condition
+
+    def get_condition(self, class_name: str) -> "Condition | None":
+        return self.class_to_condition.get(class_name)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        返回不依赖 networkx 图的紧凑摘要，用于释放图之后的查询。
+        """
+        return {
+            "classes": len(self.graph),
+            "edges": self.graph.number_of_edges(),
+            "class_to_module": dict(self.class_to_module),
+        }
+
     def find_all_ancestors(self, class_name: str) -> set[str]:
         return nx.ancestors(self.graph, class_name)
 
@@ -77,10 +101,17 @@ class ClassGraph:
         sorted_classes.sort(key=lambda x: self.class_to_order.get(x, 0))
         return sorted_classes
 
-    def get_modules_to_import(self, class_name: str) -> set[str]:
+    def get_classes_to_import(self, class_name: str, class_filter: Callable[[str], bool] | None = None) -> set[str]:
         """
-        获取需要导入的模块集合，以导入指定类及其所有子类。
+        获取指定类及其所有子类中位于扫描范围内的类，class_filter 返回 False 的类会被排除。
         """
         descendants = self.find_all_descendants(class_name)
         classes = descendants.union({class_name})
-        return {self.class_to_module[cls] for cls in classes if cls in self.class_to_module}
+        return {cls for cls in classes if cls in self.class_to_module and (class_filter is None or class_filter(cls))}
+
+    def get_modules_to_import(self, class_name: str, class_filter: Callable[[str], bool] | None = None) -> set[str]:
+        """
+        获取需要导入的模块集合，以导入指定类及其所有子类。
+        class_filter 返回 False 的类不会导致其所在模块被导入。
+        """
+        return {self.class_to_module[cls] for cls in self.get_classes_to_import(class_name, class_filter)}
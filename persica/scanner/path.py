@@ -1,4 +1,4 @@
-import ast
+from collections.abc import Callable
 from importlib.util import find_spec
 from pkgutil import walk_packages
 from typing import TYPE_CHECKING
@@ -6,12 +6,14 @@ from typing import TYPE_CHECKING
 from networkx import NetworkXError
 
 from persica.scanner.graph import ClassGraph
+from persica.scanner.source import ModuleSourceReader
 from persica.scanner.visitor import ClassVisitor
 from persica.utils.logging import get_logger
 
 _LOGGER = get_logger(__name__, "ClassPathScanner")
 
 if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
     from logging import Logger
 
 
@@ -20,6 +22,7 @@ class ClassPathScanner:
 
     def __init__(self, default_base_packages: list[str] | None = None):
         self.class_graph = ClassGraph()
+        self.source_reader = ModuleSourceReader()
         if default_base_packages is None:
             default_base_packages = []
         self.default_base_packages = default_base_packages
@@ -37,6 +40,8 @@ class ClassPathScanner:
         if package_spec is None or package_spec.submodule_search_locations is None:
             return
 
+        # 包的 __init__ 中同样可能定义类
+        self._parse_module(base_package, package_spec, True, base_package)
         # 使用 walk_packages 遍历包中的所有模块
         for module_info in walk_packages(package_spec.submodule_search_locations, prefix=base_package + "."):
             # 获取模块规范
@@ -44,35 +49,51 @@ class ClassPathScanner:
             if mod_spec is None or mod_spec.origin is None:
                 continue
 
-            # 跳过内置模块和没有源文件的模块
+            # 跳过内置模块
             if mod_spec.origin == "built-in":
                 continue
 
             self._logger.info("Find module: %s", module_info.name)
+            self._parse_module(module_info.name, mod_spec, module_info.ispkg, base_package)
 
-            # 读取模块的源代码
-            try:
-                with open(mod_spec.origin, encoding="utf-8") as file:
-                    source = file.read()
-            except (OSError, FileNotFoundError):
-                continue
+    def _parse_module(self, module_name: str, spec: "ModuleSpec", is_package: bool, base_package: str | None = None):
+        # 通过模块的 loader 读取源代码并解析为 AST，zip 归档和只有字节码的模块同样支持
+        try:
+            tree = self.source_reader.read(module_name, spec, base_package)
+        except SyntaxError as exc:
+            # 处理语法错误
+            self._logger.error("ast parse error", exc_info=exc)
+            return
+        if tree is None:
+            return
 
-            # 解析源代码为 AST
-            try:
-                tree = ast.parse(source, filename=mod_spec.origin)
-            except SyntaxError as exc:
-                # 处理语法错误
-                self._logger.error("ast parse error", exc_info=exc)
-                continue
+        # 创建 ClassVisitor 实例 并访问 AST，包的 __init__ 需要作为相对导入的基准
+        visitor = ClassVisitor(self.class_graph, module_name, is_package)
+        visitor.visit(tree)
 
-            # 创建 ClassVisitor 实例 并访问 AST
-            visitor = ClassVisitor(self.class_graph, module_info.name)
-            visitor.visit(tree)
+    def release(self):
+        """
+        释放扫描得到的类图和读取的归档，启动完成后不再需要。
+        """
+        self.class_graph = ClassGraph(self.class_graph.default_order)
+        self.source_reader.release()
 
-    def get_modules_to_import(self, superclass_name: str) -> set[str]:
+    def get_modules_to_import(
+        self, superclass_name: str, class_filter: Callable[[str], bool] | None = None
+    ) -> set[str]:
         try:
-            return self.class_graph.get_modules_to_import(superclass_name)
+            return self.class_graph.get_modules_to_import(superclass_name, class_filter)
         except NetworkXError as exc:
             if "is not in the digraph" in str(exc):
                 return set()
             raise RuntimeError("Get Modules Error") from exc
+
+    def get_classes_to_import(
+        self, superclass_name: str, class_filter: Callable[[str], bool] | None = None
+    ) -> set[str]:
+        try:
+            return self.class_graph.get_classes_to_import(superclass_name, class_filter)
+        except NetworkXError as exc:
+            if "is not in the digraph" in str(exc):
+                return set()
+            raise RuntimeError("Get Classes Error") from exc
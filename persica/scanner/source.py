@@ -0,0 +1,200 @@
+import ast
+import hashlib
+import marshal
+import os
+import sys
+import zipfile
+import zipimport
+from importlib.machinery import ModuleSpec
+from importlib.util import MAGIC_NUMBER, decode_source
+from types import CodeType
+from typing import TYPE_CHECKING
+
+from persica.scanner.bytecode import code_to_module
+from persica.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+_LOGGER = get_logger(__name__, "ModuleSourceReader")
+
+# pyc 文件头的长度：魔数、标志位以及时间戳和大小（或源码哈希）
+PYC_HEADER_SIZE = 16
+
+
+def parse_source(source: str | bytes, filename: str) -> ast.Module:
+    return ast.parse(source, filename=filename)
+
+
+def load_pyc(data: bytes) -> CodeType | None:
+    """
+    从 pyc 文件内容中读取代码对象，魔数与当前解释器不一致时返回 None。
+    """
+    if data[:4] != MAGIC_NUMBER:
+        return None
+    # pyc 来自即将被导入的模块，与导入时执行的代码相同
+    code = marshal.loads(data[PYC_HEADER_SIZE:])  # noqa: S302
+    return code if isinstance(code, CodeType) else None
+
+
+def parse_pyc(data: bytes) -> ast.Module | None:
+    code = load_pyc(data)
+    return None if code is None else code_to_module(code)
+
+
+class ArchiveContents:
+    """
+    一个 zip 归档中的模块。每个目录前缀只打开一次归档，前缀下的 .py 和 .pyc 成员被批量读取，
+    其他成员不会被解压；模块在首次需要时解析为 AST 并缓存，有源码时优先使用源码。
+    """
+
+    def __init__(self, path: str, digest: str):
+        self.path = path
+        self.digest = digest
+        # 解析后的 AST，key 为归档内的路径（不含扩展名），无法解析的模块为 None
+        self.trees: dict[str, ast.Module | None] = {}
+        self._sources: dict[str, bytes] = {}
+        self._bytecodes: dict[str, bytes] = {}
+        # 已经读取过的目录前缀，空字符串表示整个归档
+        self._prefixes: set[str] = set()
+
+    def _read_members(self, prefix: str):
+        sources = self._sources
+        bytecodes = self._bytecodes
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                if not info.filename.startswith(prefix):
+                    continue
+                stem, ext = os.path.splitext(info.filename)
+                if ext == ".py":
+                    sources[stem] = archive.read(info)
+                elif ext == ".pyc":
+                    # __pycache__/mod.cpython-311.pyc 与源码旁的 mod.pyc 都映射到 mod
+                    directory, name = os.path.split(stem)
+                    if os.path.basename(directory) == "__pycache__":
+                        name, _, tag = name.partition(".")
+                        if tag != sys.implementation.cache_tag:
+                            continue
+                        stem = f"{os.path.dirname(directory)}/{name}".lstrip("/")
+                    bytecodes.setdefault(stem, archive.read(info))
+        self._prefixes.add(prefix)
+
+    def get_tree(self, stem: str, prefix: str = "") -> ast.Module | None:
+        """
+        获取归档内路径为 stem 的模块，prefix 为需要读取的目录前缀，不包含 stem 时读取整个归档。
+        """
+        if stem in self.trees:
+            return self.trees[stem]
+        if not stem.startswith(prefix):
+            prefix = ""
+        if not any(prefix.startswith(x) for x in self._prefixes):
+            self._read_members(prefix)
+        source = self._sources.get(stem)
+        if source is not None:
+            tree = parse_source(decode_source(source), f"{self.path}/{stem}.py")
+        else:
+            data = self._bytecodes.get(stem)
+            tree = None if data is None else parse_pyc(data)
+        self.trees[stem] = tree
+        return tree
+
+    def release(self):
+        """
+        释放读取的成员内容，只保留已经解析的 AST。
+        """
+        self._sources.clear()
+        self._bytecodes.clear()
+        self._prefixes.clear()
+
+
+class ModuleSourceReader:
+    """
+    通过模块的 loader 读取模块并解析为 AST，不需要将模块解压到文件系统：
+
+    - zip 归档（zipapp、wheel 等）中的模块按扫描的包所在目录批量读取，结果按归档内容的哈希缓存
+    - 其他模块通过 loader.get_source 读取源码
+    - 没有源码时（只包含 pyc 或冻结的模块）通过 loader.get_code 获取代码对象，从字节码中还原类定义
+    """
+
+    _logger: "Logger" = _LOGGER
+
+    def __init__(self):
+        # 按归档内容哈希缓存的解析结果，同一个归档被多次扫描时不会重复读取，release 时清空
+        self.archive_cache: dict[str, ArchiveContents] = {}
+        # 本次扫描中已经处理过的归档，key 为归档路径
+        self._archives: dict[str, ArchiveContents] = {}
+
+    def read(self, module_name: str, spec: ModuleSpec, package: str | None = None) -> ast.Module | None:
+        """
+        读取模块并解析为 AST。package 为正在扫描的包，模块位于 zip 归档中时只读取该包目录下的成员。
+        """
+        loader = spec.loader
+        if isinstance(loader, zipimport.zipimporter) and spec.origin is not None:
+            return self._read_from_archive(loader, spec.origin, module_name, package)
+        get_source = getattr(loader, "get_source", None)
+        if get_source is not None:
+            try:
+                source = get_source(module_name)
+            except (ImportError, OSError):
+                source = None
+            if source is not None:
+                return parse_source(source, spec.origin or module_name)
+        get_code = getattr(loader, "get_code", None)
+        if get_code is None:
+            return None
+        try:
+            code = get_code(module_name)
+        except (ImportError, OSError):
+            return None
+        if code is None:
+            return None
+        self._logger.debug("Reading %s from bytecode", module_name)
+        return code_to_module(code)
+
+    def _read_from_archive(
+        self, loader: zipimport.zipimporter, origin: str, module_name: str, package: str | None
+    ) -> ast.Module | None:
+        contents = self._get_archive(loader.archive)
+        member = origin[len(loader.archive) :].lstrip(os.sep).replace(os.sep, "/")
+        stem = os.path.splitext(member)[0]
+        return contents.get_tree(stem, self._get_package_prefix(stem, module_name, package))
+
+    @staticmethod
+    def _get_package_prefix(stem: str, module_name: str, package: str | None) -> str:
+        """
+        根据模块在归档内的路径计算包所在目录的前缀，例如 lib/app/api/user 与 app.api.user 对应的包 app 为 lib/app/。
+        """
+        if package is None:
+            return ""
+        parts = stem.split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
+        root = parts[: len(parts) - len(module_name.split("."))]
+        return "/".join([*root, *package.split(".")]) + "/"
+
+    def _get_archive(self, path: str) -> ArchiveContents:
+        contents = self._archives.get(path)
+        if contents is not None:
+            return contents
+        digest = self._hash_file(path)
+        contents = self.archive_cache.get(digest)
+        if contents is None:
+            self._logger.info("Reading archive %s", path)
+            contents = ArchiveContents(path, digest)
+            self.archive_cache[digest] = contents
+        self._archives[path] = contents
+        return contents
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def release(self):
+        for contents in self._archives.values():
+            contents.release()
+        self._archives.clear()
+        self.archive_cache.clear()
@@ -1,6 +1,9 @@
 import ast
+from importlib.util import resolve_name
 from typing import TYPE_CHECKING
 
+from persica.utils.condition import CONDITION_KEYWORDS, Condition
+
 if TYPE_CHECKING:
     from _ast import expr
 
@@ -8,16 +11,21 @@ if TYPE_CHECKING:
 
 
 class ClassVisitor(ast.NodeVisitor):
-    def __init__(self, graph: "ClassGraph", module_prefix: str):
+    def __init__(self, graph: "ClassGraph", module_prefix: str, is_package: bool = False):
         self.graph = graph
         self.imports: dict[str, str] = {}  # 映射本地名称到完整的模块路径
         self.module_prefix = module_prefix  # 当前模块的完整路径
+        # 相对导入的基准包，当前模块是包的 __init__ 时为模块自身
+        self.package = module_prefix if is_package else module_prefix.rpartition(".")[0]
 
     def visit_ImportFrom(self, node):
         """
-        处理形如 `from module import ClassName` 的导入语句。
+        处理形如 `from module import ClassName` 和 `from ..module import ClassName` 的导入语句。
         """
-        module = node.module  # 导入的模块，例如 'a.b.c'
+        module = self.resolve_module(node.module, node.level)  # 导入的模块，例如 'a.b.c'
+        if module is None:
+            self.generic_visit(node)
+            return
         for alias in node.names:
             if alias.name == "*":
                 # 对于 'from module import *'，可以根据实际需求处理
@@ -28,6 +36,17 @@ class ClassVisitor(ast.NodeVisitor):
                 self.imports[local_name] = full_name
         self.generic_visit(node)
 
+    def resolve_module(self, module: str | None, level: int) -> str | None:
+        """
+        将相对导入的模块转换为完整路径，超出顶层包时返回 None。
+        """
+        if not level:
+            return module
+        try:
+            return resolve_name("." * level + (module or ""), self.package)
+        except (ImportError, ValueError):
+            return None
+
     def visit_Import(self, node):
         """
         处理形如 `import module` 或 `import module as mod` 的导入语句。
@@ -49,8 +68,48 @@ class ClassVisitor(ast.NodeVisitor):
                 parent_names.add(parent_full_name)
         # 传递 module_path 参数到 add_class 方法
         self.graph.add_class(class_name, parent_names, self.module_prefix)
+        condition = self.extract_condition(node)
+        if condition is not None:
+            self.graph.set_condition(class_name, condition)
+        order = self.extract_order(node)
+        if order is not None:
+            self.graph.set_order(class_name, order)
         self.generic_visit(node)
 
+    @staticmethod
+    def extract_order(node: ast.ClassDef) -> int | None:
+        """
+        从类定义的 order 关键字参数中静态提取加载顺序。
+        """
+        for keyword in node.keywords:
+            if keyword.arg == "order":
+                try:
+                    order = ast.literal_eval(keyword.value)
+                except ValueError:
+                    return None
+                return order if isinstance(order, int) else None
+        return None
+
+    @staticmethod
+    def extract_condition(node: ast.ClassDef) -> Condition | None:
+        """
+        从类定义的关键字参数中静态提取激活条件，只支持字面量，无法求值的条件留到运行时判断。
+        """
+        values = {}
+        for keyword in node.keywords:
+            if keyword.arg not in CONDITION_KEYWORDS:
+                continue
+            try:
+                values[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                continue
+        if not values:
+            return None
+        try:
+            return Condition(**values)
+        except TypeError:
+            return None
+
     def resolve_full_name(self, node: "expr") -> str | None:
         """
         解析父类的完整模块路径和类名。
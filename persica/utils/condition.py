@@ -0,0 +1,64 @@
+import os
+from collections.abc import Iterable
+from importlib.util import find_spec
+from typing import Any
+
+# 组件类声明激活条件时使用的关键字参数
+CONDITION_KEYWORDS: tuple[str, ...] = ("profiles", "env", "requires")
+
+
+def _as_tuple(value: str | Iterable[str] | None) -> tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def _is_module_available(module_name: str) -> bool:
+    try:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class Condition:
+    """
+    组件的激活条件，所有条件都满足时组件才会被导入和注册：
+
+    - profiles: 任一 profile 处于激活状态
+    - env: 所有环境变量都存在，`KEY=value` 形式还要求值相等
+    - requires: 所有模块都可以被找到（不会导入模块本身）
+    """
+
+    def __init__(
+        self,
+        profiles: str | Iterable[str] | None = None,
+        env: str | Iterable[str] | None = None,
+        requires: str | Iterable[str] | None = None,
+    ):
+        self.profiles = frozenset(_as_tuple(profiles))
+        self.env = _as_tuple(env)
+        self.requires = _as_tuple(requires)
+
+    @classmethod
+    def pop_from_kwargs(cls, kwargs: dict[str, Any]) -> "Condition | None":
+        """
+        从 __init_subclass__ 的关键字参数中取出激活条件，没有声明时返回 None。
+        """
+        values = {key: kwargs.pop(key) for key in CONDITION_KEYWORDS if key in kwargs}
+        if not values:
+            return None
+        return cls(**values)
+
+    def matches(self, active_profiles: Iterable[str] = ()) -> bool:
+        if self.profiles and self.profiles.isdisjoint(active_profiles):
+            return False
+        for item in self.env:
+            key, sep, value = item.partition("=")
+            if key not in os.environ or (sep and os.environ[key] != value):
+                return False
+        return all(_is_module_available(module_name) for module_name in self.requires)
+
+    def __repr__(self):
+        return f"Condition(profiles={sorted(self.profiles)}, env={list(self.env)}, requires={list(self.requires)})"
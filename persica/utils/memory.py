@@ -0,0 +1,18 @@
+import os
+import sys
+
+
+def get_rss() -> int | None:
+    """
+    获取当前进程的常驻内存（字节），无法获取时返回 None。
+
+    只支持 Linux。其他平台只能通过 ru_maxrss 获取峰值常驻内存，不能反映回收前后的变化，因此返回 None。
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as file:
+            resident_pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
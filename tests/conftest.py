@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import sys
 
 import pytest
@@ -13,6 +14,16 @@ def event_loop(request):
     return asyncio.get_event_loop_policy().new_event_loop()
 
 
+@pytest.fixture(autouse=True)
+def collect_local_classes():
+    """
+    测试函数内部定义的类与自身存在引用环，垃圾回收前仍会出现在基类的 __subclasses__() 中，
+    会被之后测试中的 DefinitionRegistry 注册。每个测试结束后立即回收，使测试之间互不影响。
+    """
+    yield
+    gc.collect()
+
+
 @pytest.fixture
 async def app():
     return ApplicationBuilder().set_scanner_package("tests.test_package").build()
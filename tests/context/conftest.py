@@ -0,0 +1,22 @@
+from collections.abc import Callable
+
+import pytest
+
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.definition import ObjectDefinition
+
+
+@pytest.fixture
+def build_factory() -> Callable[..., AbstractAutowireCapableFactory]:
+    """
+    根据组件类创建工厂并实例化所有对象。
+    测试组件定义在测试函数内部，由 collect_local_classes 在测试结束后回收。
+    """
+
+    def build(*classes: type[object]) -> AbstractAutowireCapableFactory:
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in classes}
+        factory.instantiate_all_objects()
+        return factory
+
+    return build
@@ -1,4 +1,17 @@
 import asyncio
+import gc
+import sys
+
+from persica.context.application import ApplicationContext
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import AsyncInitializingComponent, StartupTier
+from persica.factory.definition import ObjectDefinition
+from persica.factory.registry import DefinitionRegistry
+from persica.scanner.path import ClassPathScanner
+
+WARMUP_DELAY = 0.05
+LAZY_PACKAGE = "tests.test_lazy_activation_package"
+LAZY_MODULE = f"{LAZY_PACKAGE}.components"
 
 
 class TestApplicationContext:
@@ -8,3 +21,161 @@ class TestApplicationContext:
         await loop.run_in_executor(None, context.run)
         await context.initialize()
         await context.shutdown()
+
+    async def test_lazy_component_after_startup(self, monkeypatch):
+        monkeypatch.setenv("PERSICA_TEST_LAZY_ACTIVE", "1")
+        scanner = ClassPathScanner(default_base_packages=[LAZY_PACKAGE])
+        scanner.flash()
+        factory = AbstractAutowireCapableFactory()
+        registry = DefinitionRegistry(factory, scanner, lazy=True)
+        registry.flash()
+        factory.instantiate_all_objects()
+        context = ApplicationContext(factory=factory, class_scanner=scanner, registry=registry)
+        await context.initialize()
+
+        # 激活条件在导入时重新检查
+        monkeypatch.delenv("PERSICA_TEST_LAZY_ACTIVE")
+        assert factory.get_object(f"{LAZY_MODULE}.InactiveComponent") is None
+        module = sys.modules[LAZY_MODULE]
+        assert module.InactiveComponent not in factory.object_definitions
+
+        worker = await factory.aget_object(module.LazyWorker)
+        assert worker.initialized
+        assert factory.object_definitions[module.LazyWorker].order == module.WORKER_ORDER
+        assert f"{LAZY_MODULE}.LazyWorker.run" in context.supervisor.tasks
+
+        # 同步获取时组件的处理在事件循环上进行
+        factory.get_object(f"{LAZY_MODULE}.LazyPoller")
+        await asyncio.wait(list(context.activation_tasks.values()))
+        assert f"{LAZY_MODULE}.LazyPoller.poll" in context.supervisor.tasks
+
+        await context.bus.publish("lazy", "event")
+        await context.shutdown()
+        assert worker.events == ["event"]
+        assert worker.listener.events == ["event"]
+
+    async def test_lazy_component_requested_by_lower_order(self, build_factory):
+        class Late(AsyncInitializingComponent, order=1):
+            def __init__(self):
+                self.initialized = False
+
+            async def initialize(self):
+                self.initialized = True
+
+        class Early(AsyncInitializingComponent):
+            def __init__(self):
+                self.late = None
+
+            async def initialize(self):
+                # 加载顺序更小的组件在 initialize 中获取加载顺序更大的组件
+                self.late = await factory.aget_object(Late)
+
+        factory = build_factory()
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        await context.initialize()
+        for cls in (Early, Late):
+            factory.object_definitions[cls] = ObjectDefinition(class_object=cls)
+        early = await asyncio.wait_for(factory.aget_object(Early), WARMUP_DELAY)
+        assert early.late.initialized
+        await context.shutdown()
+
+    async def test_background_tier(self, build_factory):
+        class Cache(AsyncInitializingComponent, tier="background"):
+            def __init__(self):
+                self.warm = False
+
+            async def initialize(self):
+                await asyncio.sleep(WARMUP_DELAY)
+                self.warm = True
+
+        class Config(AsyncInitializingComponent, tier=StartupTier.BACKGROUND):
+            def __init__(self):
+                self.loaded = False
+
+            async def initialize(self):
+                self.loaded = True
+
+        class Api(AsyncInitializingComponent):
+            def __init__(self, config: Config):
+                self.config = config
+                self.config_loaded = False
+
+            async def initialize(self):
+                self.config_loaded = self.config.loaded
+
+        factory = build_factory(Cache, Config, Api)
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        await context.initialize()
+        cache = factory.singleton_objects[Cache]
+        # Config 被 CRITICAL 组件依赖，因此在就绪前完成初始化
+        assert factory.singleton_objects[Api].config_loaded
+        assert not cache.warm
+        await context.wait_background()
+        assert cache.warm
+        await context.shutdown()
+
+    async def test_shutdown_cancels_background(self, build_factory):
+        class Slow(AsyncInitializingComponent, tier="background"):
+            async def initialize(self):
+                await asyncio.Event().wait()
+
+        factory = build_factory(Slow)
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        await context.initialize()
+        await context.shutdown()
+        assert context.background_task.cancelled()
+
+    async def test_complete_startup(self, app):
+        loop = asyncio.get_event_loop()
+        context = app.context
+        await loop.run_in_executor(None, context.run)
+        report = context.complete_startup()
+        assert len(context.class_scanner.class_graph.graph) == 0
+        assert context.startup_summary is report.summary
+        assert (
+            report.summary["class_to_module"]["tests.test_package.module_a.BaseClass"] == "tests.test_package.module_a"
+        )
+        assert report.frozen is None
+        assert "Startup reclaim" in str(report)
+
+    def test_complete_startup_without_rss(self, app, monkeypatch):
+        # 其他平台只有峰值常驻内存，不作为回收前后的变化
+        monkeypatch.setattr(sys, "platform", "darwin")
+        report = app.context.complete_startup()
+        assert report.rss_delta is None
+        assert "rss unknown" in str(report)
+
+    def test_complete_startup_freeze(self, app):
+        try:
+            report = app.context.complete_startup(keep_summary=False, freeze=True)
+            assert report.summary is None
+            assert report.frozen > 0
+        finally:
+            gc.unfreeze()
+
+
+class TestApplication:
+    async def test_ready_callback(self, app):
+        called = []
+        release = asyncio.Event()
+
+        async def on_ready():
+            called.append(app.is_ready)
+            await release.wait()
+            called.append("released")
+
+        app.add_ready_callback(on_ready)
+        assert not app.is_ready
+        # 就绪前添加的回调被调度执行，initialize 不等待回调完成
+        await asyncio.wait_for(app.initialize(), WARMUP_DELAY)
+        await asyncio.wait_for(app.wait_ready(), WARMUP_DELAY)
+        await asyncio.sleep(0)
+        assert called == [True]
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*app._ready_tasks), WARMUP_DELAY)
+        assert called == [True, "released"]
+        # 就绪后添加的回调立即被调度
+        ready = asyncio.Event()
+        app.add_ready_callback(ready.set)
+        await asyncio.wait_for(ready.wait(), WARMUP_DELAY)
+        await app.shutdown()
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from persica.context.application import ApplicationContext
+from persica.context.bus import EventBus, SubscriptionSpec, subscribe
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import AsyncInitializingComponent, BaseComponent
+from persica.factory.definition import ObjectDefinition
+
+BATCH_SIZE = 3
+EVENT_COUNT = 5
+
+
+class TestEventBus:
+    async def test_fan_out_and_batching(self):
+        single = []
+        batches = []
+
+        async def on_single(event):
+            single.append(event)
+
+        async def on_batch(events):
+            batches.append(events)
+
+        bus = EventBus()
+        bus.add_subscription("single", on_single, SubscriptionSpec("orders"))
+        bus.add_subscription("batch", on_batch, SubscriptionSpec("orders", batch_size=BATCH_SIZE, batch_timeout=0.01))
+        for index in range(EVENT_COUNT):
+            await bus.publish("orders", index)
+        await bus.publish("unknown", None)
+        assert bus.get_queue_depth("orders") == EVENT_COUNT * 2
+        bus.start()
+        await bus.stop()
+        assert single == list(range(EVENT_COUNT))
+        assert batches == [[0, 1, 2], [3, 4]]
+        assert bus.topics["orders"].published == EVENT_COUNT
+        # 没有订阅的主题不记录统计
+        assert "unknown" not in bus.topics
+        assert bus.unrouted == 1
+        assert bus.get_queue_depth("orders") == 0
+
+    async def test_backpressure(self):
+        release = asyncio.Event()
+        handled = []
+
+        async def slow(event):
+            await release.wait()
+            handled.append(event)
+
+        bus = EventBus()
+        subscription = bus.add_subscription("slow", slow, SubscriptionSpec("jobs", queue_size=1))
+        bus.start()
+        await bus.publish("jobs", 1)
+        await asyncio.sleep(0)
+        # 第一个事件正在处理，第二个事件占满队列
+        await bus.publish("jobs", 2)
+        with pytest.raises(asyncio.QueueFull):
+            bus.publish_nowait("jobs", 3)
+        blocked = asyncio.create_task(bus.publish("jobs", 3))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        release.set()
+        await blocked
+        await bus.stop()
+        assert handled == [1, 2, 3]
+        assert subscription.handled == len(handled)
+
+    async def test_component_subscriptions(self):
+        class Audit(BaseComponent):
+            def __init__(self):
+                self.events = []
+
+            @subscribe("users")
+            @subscribe("orders")
+            async def record(self, event):
+                self.events.append(event)
+
+        class Orders(AsyncInitializingComponent):
+            def __init__(self, bus: EventBus):
+                self.bus = bus
+
+            async def initialize(self):
+                await self.bus.publish("orders", "created")
+                await self.bus.publish("users", "joined")
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (Audit, Orders)}
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        factory.instantiate_all_objects()
+        assert factory.singleton_objects[Orders].bus is context.bus
+        await context.initialize()
+        await context.shutdown()
+        assert sorted(factory.singleton_objects[Audit].events) == ["created", "joined"]
+        assert {subscription.name for subscription in context.bus.subscriptions} == {
+            f"{Audit.__module__}.{Audit.__qualname__}.record"
+        }
+
+    async def test_subscribe_after_initialize(self):
+        class Publisher(AsyncInitializingComponent):
+            def __init__(self, bus: EventBus):
+                self.bus = bus
+
+            async def initialize(self):
+                await self.bus.publish("jobs", "early")
+
+        class Worker(AsyncInitializingComponent, order=1):
+            def __init__(self):
+                self.ready = False
+                self.events = []
+
+            async def initialize(self):
+                self.ready = True
+
+            @subscribe("jobs")
+            async def handle(self, event):
+                assert self.ready
+                self.events.append(event)
+
+        class Broken(AsyncInitializingComponent, order=1):
+            def __init__(self):
+                self.events = []
+
+            async def initialize(self):
+                raise RuntimeError("broken")
+
+            @subscribe("jobs")
+            async def handle(self, event):
+                self.events.append(event)
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (Publisher, Worker, Broken)}
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        factory.instantiate_all_objects()
+        await context.initialize()
+        await context.bus.publish("jobs", "late")
+        await context.shutdown()
+        # Worker 初始化之前发布的事件没有订阅者，初始化失败的组件不会订阅
+        assert factory.singleton_objects[Worker].events == ["late"]
+        assert factory.singleton_objects[Broken].events == []
+        assert context.bus.unrouted == 1
@@ -0,0 +1,180 @@
+import asyncio
+
+import networkx as nx
+
+from persica.context.application import ApplicationContext
+from persica.context.shutdown import ShutdownEngine, ShutdownStatus
+from persica.context.supervisor import background_task
+from persica.factory.component import AsyncInitializingComponent
+
+SHUTDOWN_DELAY = 0.05
+
+
+class TestShutdownEngine:
+    async def test_reverse_dependency_order(self, build_factory):
+        shutdown_order = []
+
+        class Database(AsyncInitializingComponent):
+            async def shutdown(self):
+                shutdown_order.append("Database")
+
+        class Repository:
+            def __init__(self, database: Database):
+                self.database = database
+
+        class Service(AsyncInitializingComponent):
+            def __init__(self, repository: Repository):
+                self.repository = repository
+
+            async def shutdown(self):
+                await asyncio.sleep(SHUTDOWN_DELAY)
+                shutdown_order.append("Service")
+
+        class Early(AsyncInitializingComponent, order=1):
+            async def shutdown(self):
+                shutdown_order.append("Early")
+
+        factory = build_factory(Database, Repository, Service, Early)
+        report = await ShutdownEngine(factory).run()
+        assert shutdown_order.index("Service") < shutdown_order.index("Database")
+        assert shutdown_order.index("Early") < shutdown_order.index("Database")
+        assert all(record.status is ShutdownStatus.COMPLETED for record in report.records)
+
+    async def test_independent_components_run_concurrently(self, build_factory):
+        class First(AsyncInitializingComponent):
+            async def shutdown(self):
+                await asyncio.sleep(SHUTDOWN_DELAY)
+
+        class Second(AsyncInitializingComponent):
+            async def shutdown(self):
+                await asyncio.sleep(SHUTDOWN_DELAY)
+
+        factory = build_factory(First, Second)
+        report = await ShutdownEngine(factory).run()
+        assert {record.name for record in report.records} == {"First", "Second"}
+        assert report.elapsed < SHUTDOWN_DELAY * 2
+
+    async def test_component_timeout(self, build_factory):
+        class Slow(AsyncInitializingComponent, shutdown_timeout=SHUTDOWN_DELAY):
+            async def shutdown(self):
+                await asyncio.sleep(SHUTDOWN_DELAY * 20)
+
+        class Fast(AsyncInitializingComponent):
+            pass
+
+        factory = build_factory(Slow, Fast)
+        report = await ShutdownEngine(factory).run()
+        assert [record.name for record in report.stragglers] == ["Slow"]
+        assert report.stragglers[0].status is ShutdownStatus.TIMEOUT
+        assert "Slow exceeded" in str(report)
+
+    async def test_global_deadline_cancels_stragglers(self, build_factory):
+        class Hanging(AsyncInitializingComponent):
+            async def shutdown(self):
+                await asyncio.Event().wait()
+
+        class Dependent(AsyncInitializingComponent):
+            def __init__(self, hanging: Hanging):
+                self.hanging = hanging
+
+        factory = build_factory(Hanging, Dependent)
+        report = await ShutdownEngine(factory, timeout=SHUTDOWN_DELAY).run()
+        records = {record.name: record for record in report.records}
+        assert records["Dependent"].status is ShutdownStatus.COMPLETED
+        assert records["Hanging"].status is ShutdownStatus.CANCELLED
+        assert report.elapsed < SHUTDOWN_DELAY * 20
+
+    async def test_overrun_uses_component_budget(self, build_factory):
+        class Stubborn(AsyncInitializingComponent, shutdown_timeout=SHUTDOWN_DELAY * 2):
+            async def shutdown(self):
+                try:
+                    await asyncio.sleep(SHUTDOWN_DELAY * 20)
+                except asyncio.CancelledError:
+                    # 忽略取消请求
+                    await asyncio.sleep(SHUTDOWN_DELAY * 2)
+
+        class Dependent(AsyncInitializingComponent):
+            def __init__(self, stubborn: Stubborn):
+                self.stubborn = stubborn
+
+            async def shutdown(self):
+                await asyncio.sleep(SHUTDOWN_DELAY * 2)
+
+        factory = build_factory(Stubborn, Dependent)
+        engine = ShutdownEngine(factory, timeout=SHUTDOWN_DELAY * 3, cancel_grace=SHUTDOWN_DELAY / 5)
+        report = await engine.run()
+        record = {record.name: record for record in report.records}["Stubborn"]
+        assert record.status is ShutdownStatus.CANCELLED
+        # 等待 Dependent 关闭的时间不计入 Stubborn 的耗时
+        assert record.elapsed < SHUTDOWN_DELAY * 2
+        assert record.overrun == 0
+
+    async def test_order_conflicting_with_dependencies(self, build_factory):
+        class Primary(AsyncInitializingComponent, order=3):
+            pass
+
+        class Middle(AsyncInitializingComponent, order=2):
+            pass
+
+        class Client(AsyncInitializingComponent, order=1):
+            def __init__(self, primary: Primary):
+                self.primary = primary
+
+        factory = build_factory(Primary, Middle, Client)
+        engine = ShutdownEngine(factory)
+        graph = engine.build_graph(factory.get_singletons_of_type(AsyncInitializingComponent))
+        # 依赖方先关闭，与加载顺序矛盾的边不会产生环
+        assert graph.has_edge(Client, Primary)
+        assert nx.is_directed_acyclic_graph(graph)
+
+    async def test_pools_follow_dependency_order(self, build_factory):
+        events = []
+
+        class Db(AsyncInitializingComponent):
+            async def shutdown(self):
+                events.append("Db")
+
+        class Session(AsyncInitializingComponent, pool_size=1, pool_min_idle=1, shutdown_timeout=SHUTDOWN_DELAY):
+            def __init__(self, db: Db):
+                self.db = db
+
+            async def shutdown(self):
+                events.append("Session")
+                await asyncio.Event().wait()
+
+        factory = build_factory(Db, Session)
+        context = ApplicationContext(
+            factory=factory, class_scanner=None, registry=None, shutdown_timeout=SHUTDOWN_DELAY * 10
+        )
+        await context.initialize()
+        report = await asyncio.wait_for(context.shutdown(), SHUTDOWN_DELAY * 20)
+        # 池中的对象先于其依赖关闭，挂起的 shutdown 受组件预算限制
+        assert events == ["Session", "Db"]
+        records = {record.name: record for record in report.records}
+        assert records["ObjectPool[Session]"].status is ShutdownStatus.TIMEOUT
+        assert records["Db"].status is ShutdownStatus.COMPLETED
+
+    async def test_background_tasks_share_global_deadline(self, build_factory):
+        release = asyncio.Event()
+
+        class Worker(AsyncInitializingComponent):
+            @background_task
+            async def run(self):
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    # 忽略取消，直到测试结束
+                    await release.wait()
+
+        factory = build_factory(Worker)
+        context = ApplicationContext(
+            factory=factory, class_scanner=None, registry=None, shutdown_timeout=SHUTDOWN_DELAY
+        )
+        await context.initialize()
+        await asyncio.sleep(0)
+        assert context.supervisor.stop_timeout > SHUTDOWN_DELAY * 10
+        try:
+            # 等待后台任务退出的时间计入全局截止时间，不会等满 stop_timeout
+            await asyncio.wait_for(context.shutdown(), SHUTDOWN_DELAY * 10)
+        finally:
+            release.set()
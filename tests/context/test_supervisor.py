@@ -0,0 +1,127 @@
+import asyncio
+import functools
+
+from persica.context.application import ApplicationContext
+from persica.context.supervisor import (
+    BackgroundTaskSpec,
+    Backoff,
+    RestartPolicy,
+    TaskState,
+    TaskSupervisor,
+    background_task,
+)
+from persica.factory.component import AsyncInitializingComponent
+
+TASK_DELAY = 0.05
+FAILURE_COUNT = 2
+
+
+class TestTaskSupervisor:
+    async def test_restart_with_backoff(self):
+        attempts = []
+        running = asyncio.Event()
+
+        async def flaky():
+            attempts.append(asyncio.get_running_loop().time())
+            if len(attempts) <= FAILURE_COUNT:
+                raise RuntimeError("flaky")
+            running.set()
+            await asyncio.Event().wait()
+
+        supervisor = TaskSupervisor()
+        spec = BackgroundTaskSpec(backoff=Backoff(initial=TASK_DELAY / 5, factor=2))
+        supervised = supervisor.add("flaky", flaky, spec)
+        supervisor.start(supervised)
+        await asyncio.wait_for(running.wait(), 1)
+        assert supervised.stats.failures == FAILURE_COUNT
+        assert supervised.stats.restarts == FAILURE_COUNT
+        assert supervised.stats.state is TaskState.RUNNING
+        # 第二次失败后的退避时间是第一次的两倍
+        assert attempts[2] - attempts[1] >= attempts[1] - attempts[0]
+        await supervisor.stop()
+        assert supervised.stats.state is TaskState.CANCELLED
+
+    async def test_never_restart_and_max_restarts(self):
+        async def failing():
+            raise RuntimeError("failing")
+
+        supervisor = TaskSupervisor()
+        never = supervisor.add("never", failing, BackgroundTaskSpec(restart=RestartPolicy.NEVER))
+        limited = supervisor.add(
+            "limited", failing, BackgroundTaskSpec(max_restarts=FAILURE_COUNT, backoff=Backoff(initial=0))
+        )
+        supervisor.start(never)
+        supervisor.start(limited)
+        await asyncio.wait([never.task, limited.task])
+        assert never.stats.state is TaskState.FAILED
+        assert never.stats.runs == 1
+        assert limited.stats.state is TaskState.FAILED
+        assert limited.stats.runs == FAILURE_COUNT + 1
+
+    async def test_bounded_concurrency_records_lag(self):
+        async def work():
+            await asyncio.sleep(TASK_DELAY)
+
+        supervisor = TaskSupervisor(max_concurrency=1)
+        first = supervisor.add("first", work, BackgroundTaskSpec(interval=TASK_DELAY * 10))
+        second = supervisor.add("second", work, BackgroundTaskSpec(interval=TASK_DELAY * 10))
+        supervisor.start(first)
+        supervisor.start(second)
+        await asyncio.sleep(TASK_DELAY * 3)
+        await supervisor.stop()
+        assert first.stats.runs == second.stats.runs == 1
+        # 第二个周期任务需要等待第一个任务释放并发名额
+        assert second.stats.last_lag >= TASK_DELAY * 0.9
+        assert first.stats.last_duration >= TASK_DELAY * 0.9
+
+    async def test_loops_are_not_limited(self):
+        started = []
+
+        async def loop(name):
+            started.append(name)
+            await asyncio.Event().wait()
+
+        supervisor = TaskSupervisor(max_concurrency=1)
+        for name in ("first", "second"):
+            supervisor.start(supervisor.add(name, functools.partial(loop, name), BackgroundTaskSpec()))
+        await asyncio.sleep(TASK_DELAY)
+        await supervisor.stop()
+        # 长期运行的循环不占用并发名额
+        assert started == ["first", "second"]
+
+    def test_task_names_include_module(self):
+        first = type("Worker", (), {"run": background_task(lambda self: None)})
+        second = type("Worker", (), {"run": background_task(lambda self: None), "__module__": "other"})
+        supervisor = TaskSupervisor()
+        supervisor.add_component(first())
+        supervisor.add_component(second())
+        assert set(supervisor.tasks) == {f"{__name__}.Worker.run", "other.Worker.run"}
+
+    async def test_component_tasks_follow_lifecycle(self, build_factory):
+        class Poller(AsyncInitializingComponent):
+            def __init__(self):
+                self.initialized = False
+                self.polls = 0
+                self.tasks_running_at_shutdown = None
+
+            async def initialize(self):
+                self.initialized = True
+
+            @background_task(interval=TASK_DELAY / 5)
+            async def poll(self):
+                assert self.initialized
+                self.polls += 1
+
+            async def shutdown(self):
+                self.tasks_running_at_shutdown = not context.supervisor.tasks[
+                    f"{Poller.__module__}.{Poller.__qualname__}.poll"
+                ].task.done()
+
+        factory = build_factory(Poller)
+        context = ApplicationContext(factory=factory, class_scanner=None, registry=None)
+        await context.initialize()
+        await asyncio.sleep(TASK_DELAY)
+        poller = factory.singleton_objects[Poller]
+        assert poller.polls > 1
+        await context.shutdown()
+        assert poller.tasks_running_at_shutdown is False
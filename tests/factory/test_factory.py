@@ -1,9 +1,22 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from persica.error import NoSuchParameterException
+from persica.error import (
+    AmbiguousParameterException,
+    AsyncConstructionRequired,
+    CircularDependencyException,
+    NoSuchParameterException,
+)
 from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import AsyncConstructingComponent, BaseComponent
 from persica.factory.definition import ObjectDefinition
-from persica.factory.interface import InterfaceFactory
+from persica.factory.interface import AsyncInterfaceFactory, InterfaceFactory
+
+CONSTRUCT_DELAY = 0.05
 
 
 class SimpleClass:
@@ -37,6 +50,68 @@ class UnresolvedClass:
         self.missing_dependency = missing_dependency
 
 
+class AsyncPool(AsyncConstructingComponent):
+    def __init__(self, connected: bool = False):
+        self.connected = connected
+
+    @classmethod
+    async def construct(cls) -> "AsyncPool":
+        await asyncio.sleep(CONSTRUCT_DELAY)
+        return cls(connected=True)
+
+
+class AsyncSession(AsyncConstructingComponent):
+    def __init__(self, opened: bool = False):
+        self.opened = opened
+
+    @classmethod
+    async def construct(cls) -> "AsyncSession":
+        await asyncio.sleep(CONSTRUCT_DELAY)
+        return cls(opened=True)
+
+
+class AsyncService:
+    def __init__(self, pool: AsyncPool, session: AsyncSession):
+        self.pool = pool
+        self.session = session
+
+
+class AsyncProduct:
+    def __init__(self):
+        self.name = "AsyncProduct"
+
+
+class AsyncProductFactory(AsyncInterfaceFactory[AsyncProduct]):
+    async def get_object(self, obj: AsyncProduct | None) -> AsyncProduct:
+        await asyncio.sleep(0)
+        obj.name = "AsyncProduct from Factory"
+        return obj
+
+
+THREAD_COUNT = 8
+CYCLE_TIMEOUT = 1
+
+
+class CyclicA:
+    def __init__(self, b: "CyclicB"):
+        self.b = b
+
+
+class CyclicB:
+    def __init__(self, a: CyclicA):
+        self.a = a
+
+
+class SlowClass:
+    instances = 0
+
+    def __init__(self, dependency: DependencyClass):
+        SlowClass.instances += 1
+        self.dependency = dependency
+        # 放大创建窗口，使未加锁的实现更容易创建出多个实例
+        time.sleep(CONSTRUCT_DELAY)
+
+
 class TestAbstractAutowireCapableFactory:
     def test_simple_class_instantiation(self):
         factory = AbstractAutowireCapableFactory()
@@ -87,3 +162,229 @@ class TestAbstractAutowireCapableFactory:
         with pytest.raises(NoSuchParameterException) as exc_info:
             factory.instantiate_all_objects()
         assert "Cannot find the missing_dependency" in str(exc_info.value)
+
+    def test_missing_union_dependency(self):
+        class Host:
+            def __init__(self, dependency: SimpleClass | DependencyClass):
+                self.dependency = dependency
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {Host: ObjectDefinition(class_object=Host)}
+        with pytest.raises(NoSuchParameterException) as exc_info:
+            factory.instantiate_all_objects()
+        assert repr(SimpleClass | DependencyClass) in str(exc_info.value)
+
+    def test_async_construction_is_deferred(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            AsyncPool: ObjectDefinition(class_object=AsyncPool),
+            AsyncService: ObjectDefinition(class_object=AsyncService),
+        }
+        factory.instantiate_all_objects()
+        assert factory.deferred_classes == [AsyncPool, AsyncService]
+        with pytest.raises(AsyncConstructionRequired):
+            factory.get_object(AsyncPool)
+
+    async def test_async_construction_runs_concurrently(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            AsyncService: ObjectDefinition(class_object=AsyncService),
+            AsyncPool: ObjectDefinition(class_object=AsyncPool),
+            AsyncSession: ObjectDefinition(class_object=AsyncSession),
+        }
+        factory.instantiate_all_objects()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await factory.instantiate_deferred_objects()
+        elapsed = loop.time() - start
+        service = factory.singleton_objects.get(AsyncService)
+        assert isinstance(service, AsyncService)
+        assert service.pool is factory.singleton_objects.get(AsyncPool)
+        assert service.pool.connected
+        assert service.session.opened
+        # 两个异步构造并发执行，总耗时小于串行执行的耗时
+        assert elapsed < CONSTRUCT_DELAY * 2
+        assert factory.deferred_classes == []
+
+    async def test_async_factory_usage(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            AsyncProductFactory: ObjectDefinition(class_object=AsyncProductFactory, is_factory=True),
+            AsyncProduct: ObjectDefinition(class_object=AsyncProduct),
+        }
+        factory.instantiate_all_objects()
+        assert AsyncProduct in factory.deferred_classes
+        await factory.instantiate_deferred_objects()
+        product_instance = factory.singleton_objects.get(AsyncProduct)
+        assert product_instance.name == "AsyncProduct from Factory"
+
+    async def test_async_optional_dependency_default(self):
+        class Cache(AsyncConstructingComponent):
+            @classmethod
+            async def construct(cls):
+                # 缓存服务不可用时不创建对象
+                return None
+
+        class Service:
+            def __init__(self, cache: Cache | None = "memory"):
+                self.cache = cache
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (Cache, Service)}
+        service = await factory.aget_object(Service)
+        assert service.cache == "memory"
+
+    async def test_async_creation_retry_after_failure(self):
+        attempts = []
+
+        class Client(AsyncConstructingComponent):
+            @classmethod
+            async def construct(cls):
+                attempts.append(None)
+                if len(attempts) == 1:
+                    raise ConnectionError("connect failed")
+                return cls()
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {Client: ObjectDefinition(class_object=Client)}
+        with pytest.raises(ConnectionError):
+            await factory.aget_object(Client)
+        # 失败的创建任务不会被缓存，再次请求时重新创建
+        client = await factory.aget_object(Client)
+        assert isinstance(client, Client)
+        assert factory.singleton_objects[Client] is client
+
+    def test_circular_dependency(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (CyclicA, CyclicB)}
+        with pytest.raises(CircularDependencyException) as exc_info:
+            factory.get_object(CyclicA)
+        assert exc_info.value.classes == (CyclicA, CyclicB, CyclicA)
+
+    async def test_async_circular_dependency(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (CyclicA, CyclicB)}
+        # 互相等待的创建任务会一直挂起，检测到环时应立即失败
+        with pytest.raises(CircularDependencyException):
+            await asyncio.wait_for(factory.aget_object(CyclicA), CYCLE_TIMEOUT)
+
+    async def test_async_plan_failure_leaves_no_coroutine(self):
+        class Host:
+            def __init__(self, dependency: DependencyClass, missing: UnresolvedClass):
+                self.dependency = dependency
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (DependencyClass, Host)}
+        created = []
+        resolve_plan = factory._aresolve_plan
+        factory._aresolve_plan = lambda plan: created.append(plan) or resolve_plan(plan)
+        # 后面的参数解析失败时，前面的依赖不应已经创建了协程
+        with pytest.raises(NoSuchParameterException):
+            await factory._abuild_constructor_params(Host)
+        assert created == []
+
+    def test_concurrent_get_object_creates_singleton_once(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            DependencyClass: ObjectDefinition(class_object=DependencyClass),
+            SlowClass: ObjectDefinition(class_object=SlowClass),
+        }
+        barrier = threading.Barrier(THREAD_COUNT)
+
+        def resolve():
+            barrier.wait()
+            return factory.get_object(SlowClass)
+
+        with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+            results = list(executor.map(lambda _: resolve(), range(THREAD_COUNT)))
+        assert SlowClass.instances == 1
+        assert all(result is results[0] for result in results)
+
+    def test_published_fast_path(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            SimpleClass: ObjectDefinition(class_object=SimpleClass),
+            DependencyClass: ObjectDefinition(class_object=DependencyClass),
+        }
+        factory.instantiate_all_objects()
+        resolved = factory._resolved
+        assert resolved[SimpleClass] is factory.get_object(SimpleClass)
+        # 发布后的映射只会被整体替换，不会被原地修改
+        factory.object_definitions[DependentClass] = ObjectDefinition(class_object=DependentClass)
+        dependent = factory.get_object(DependentClass)
+        assert DependentClass not in resolved
+        assert factory._resolved[DependentClass] is dependent
+
+    async def test_published_async_singleton(self):
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {SimpleClass: ObjectDefinition(class_object=SimpleClass)}
+        factory.instantiate_all_objects()
+        # 发布后异步创建的单例与同步创建的一样加入只读映射
+        factory.object_definitions[AsyncPool] = ObjectDefinition(class_object=AsyncPool)
+        pool = await factory.aget_object(AsyncPool)
+        assert factory._resolved[AsyncPool] is pool
+        assert factory.get_object(AsyncPool) is pool
+
+    def test_subtype_and_collection_injection(self):
+        class Plugin(BaseComponent):
+            pass
+
+        class LatePlugin(Plugin, order=2):
+            pass
+
+        class EarlyPlugin(Plugin, order=1):
+            pass
+
+        class Storage:
+            pass
+
+        class MemoryStorage(Storage):
+            pass
+
+        class Host:
+            def __init__(
+                self,
+                storage: Storage,
+                plugins: list[Plugin],
+                plugin_tuple: tuple[Plugin, ...],
+                missing: UnresolvedClass | None,
+            ):
+                self.storage = storage
+                self.plugins = plugins
+                self.plugin_tuple = plugin_tuple
+                self.missing = missing
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            cls: ObjectDefinition(class_object=cls) for cls in (Host, LatePlugin, EarlyPlugin, MemoryStorage)
+        }
+        factory.instantiate_all_objects()
+        host = factory.get_object(Host)
+        # Storage 没有定义，注入唯一的子类实现
+        assert host.storage is factory.get_object(MemoryStorage)
+        assert [type(plugin) for plugin in host.plugins] == [EarlyPlugin, LatePlugin]
+        assert host.plugin_tuple == tuple(host.plugins)
+        assert host.missing is None
+        assert factory.dependencies[Host] == {MemoryStorage, EarlyPlugin, LatePlugin}
+
+    def test_ambiguous_subtype(self):
+        class Plugin(BaseComponent):
+            pass
+
+        class FirstPlugin(Plugin):
+            pass
+
+        class SecondPlugin(Plugin):
+            pass
+
+        class Host:
+            def __init__(self, plugin: Plugin):
+                self.plugin = plugin
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            cls: ObjectDefinition(class_object=cls) for cls in (FirstPlugin, SecondPlugin, Host)
+        }
+        factory.build_type_index()
+        with pytest.raises(AmbiguousParameterException):
+            factory.get_object(Host)
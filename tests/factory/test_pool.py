@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+
+from persica.error import NoSuchParameterException, PoolExhaustedError
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import AsyncInitializingComponent, BaseComponent
+from persica.factory.definition import ObjectDefinition
+from persica.factory.pool import ObjectPool, PooledInterfaceFactory
+
+POOL_SIZE = 3
+
+
+class Buffer:
+    def __init__(self):
+        self.data = []
+
+
+class TestObjectPool:
+    async def test_reuse(self):
+        pool = ObjectPool(Buffer, size=2)
+        async with pool.lease() as first:
+            pass
+        async with pool.lease() as second:
+            assert second is first
+        assert pool.stats.created == 1
+        assert pool.stats.hits == 1
+        assert pool.stats.acquisitions == 2 * pool.stats.hits
+
+    async def test_waiter_receives_released_object(self):
+        pool = ObjectPool(Buffer, size=1)
+        lease = pool.lease()
+        obj = await lease.__aenter__()
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await lease.__aexit__(None, None, None)
+        assert await waiter is obj
+        assert pool.stats.waits == 1
+        assert pool.in_use == 1
+
+    async def test_failed_creation_wakes_waiter(self):
+        attempts = []
+
+        async def creator():
+            attempts.append(None)
+            await asyncio.sleep(0)
+            if len(attempts) == 1:
+                raise RuntimeError("connect failed")
+            return Buffer()
+
+        pool = ObjectPool(creator, size=1)
+        first = asyncio.create_task(pool.acquire())
+        second = asyncio.create_task(pool.acquire())
+        with pytest.raises(RuntimeError):
+            await first
+        # 失败释放的名额交给等待者，由等待者重新创建
+        obj = await asyncio.wait_for(second, 1)
+        assert isinstance(obj, Buffer)
+        assert pool.in_use == 1
+
+    async def test_cancelled_waiter_resets_once(self):
+        resets = []
+        pool = ObjectPool(Buffer, size=1, reset=resets.append)
+        obj = await pool.acquire()
+        cancelled = asyncio.create_task(pool.acquire())
+        waiting = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        # 对象交给第一个等待者的同时该等待者被取消，对象转交给下一个等待者
+        pool.release(obj)
+        cancelled.cancel()
+        assert await waiting is obj
+        assert resets == [obj]
+
+    async def test_failed_reset_frees_slot(self):
+        destroyed = []
+
+        def reset(_):
+            raise RuntimeError("reset failed")
+
+        pool = ObjectPool(Buffer, size=1, reset=reset, destroy=destroyed.append)
+        # 重置失败不会覆盖租约内抛出的原始异常
+        with pytest.raises(ValueError, match="work failed"):
+            async with pool.lease() as obj:
+                raise ValueError("work failed")
+        assert destroyed == [obj]
+        assert pool.in_use == 0
+        # 名额已经释放，下一次获取会重新创建对象
+        second = await asyncio.wait_for(pool.acquire(), 1)
+        assert second is not obj
+        assert pool.stats.created == len(destroyed) + 1
+
+    def test_sync_lease_exhausted(self):
+        pool = ObjectPool(Buffer, size=1)
+        with pool.lease() as obj:
+            assert isinstance(obj, Buffer)
+            with pytest.raises(PoolExhaustedError):
+                pool.acquire_nowait()
+        assert pool.idle == 1
+
+    async def test_warm_and_evict(self):
+        destroyed = []
+        pool = ObjectPool(Buffer, size=POOL_SIZE + 1, min_idle=1, idle_timeout=0, destroy=destroyed.append)
+        await pool.warm(POOL_SIZE)
+        assert pool.idle == POOL_SIZE
+        # 空闲超时为 0，除了 min_idle 个对象外全部被回收
+        assert pool.evict_idle() == POOL_SIZE - 1
+        assert len(destroyed) == POOL_SIZE - 1
+        await pool.close()
+        assert len(destroyed) == POOL_SIZE
+
+
+class TestPooledInjection:
+    async def test_pooled_factory(self):
+        class Parser:
+            def __init__(self):
+                self.reset_count = 0
+
+        class ParserFactory(PooledInterfaceFactory[Parser], pool_size=2, pool_min_idle=1):
+            def get_object(self, obj: Parser | None) -> Parser:
+                return Parser()
+
+            def reset_object(self, obj: Parser) -> None:
+                obj.reset_count += 1
+
+        class Handler:
+            def __init__(self, parsers: ObjectPool[Parser]):
+                self.parsers = parsers
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            ParserFactory: ObjectDefinition(class_object=ParserFactory, is_factory=True),
+            Handler: ObjectDefinition(class_object=Handler),
+        }
+        factory.instantiate_all_objects()
+        handler = factory.singleton_objects[Handler]
+        assert handler.parsers is factory.get_pool(Parser)
+        await handler.parsers.warm()
+        async with handler.parsers.lease() as parser:
+            assert isinstance(parser, Parser)
+        assert parser.reset_count == 1
+        assert handler.parsers.stats.hits == 1
+
+    def test_pooled_component(self):
+        class Connection(BaseComponent, pool_size=POOL_SIZE):
+            pass
+
+        class Client:
+            def __init__(self, connections: ObjectPool[Connection]):
+                self.connections = connections
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            Connection: ObjectDefinition(class_object=Connection),
+            Client: ObjectDefinition(class_object=Client),
+        }
+        factory.instantiate_all_objects()
+        assert Connection not in factory.singleton_objects
+        client = factory.singleton_objects[Client]
+        assert client.connections.size == POOL_SIZE
+        with client.connections.lease() as first, client.connections.lease() as second:
+            assert first is not second
+
+    def test_pooled_component_injected_directly(self):
+        class Connection(BaseComponent, pool_size=POOL_SIZE):
+            pass
+
+        class Client:
+            def __init__(self, connection: Connection):
+                self.connection = connection
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {
+            Connection: ObjectDefinition(class_object=Connection),
+            Client: ObjectDefinition(class_object=Client),
+        }
+        # 直接注入池化类会绕过对象池，提示改用 ObjectPool[Connection]
+        with pytest.raises(NoSuchParameterException, match=r"ObjectPool\[Connection\]"):
+            factory.instantiate_all_objects()
+        assert Connection not in factory.singleton_objects
+
+    async def test_pooled_initializing_component(self):
+        events = []
+
+        class Session(AsyncInitializingComponent, pool_size=POOL_SIZE):
+            async def initialize(self):
+                events.append("initialize")
+
+            async def shutdown(self):
+                events.append("shutdown")
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {Session: ObjectDefinition(class_object=Session)}
+        factory.instantiate_all_objects()
+        pool = factory.get_pool(Session)
+        async with pool.lease():
+            assert events == ["initialize"]
+            # 同步借用无法调用 initialize()
+            with pytest.raises(TypeError):
+                pool.acquire_nowait()
+        await pool.close()
+        assert events == ["initialize", "shutdown"]
@@ -0,0 +1,82 @@
+import sys
+
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.registry import DefinitionRegistry
+from persica.scanner.path import ClassPathScanner
+from persica.utils.condition import Condition
+
+CONDITIONAL_MODULE = "tests.test_package.conditional"
+LAZY_MODULE = "tests.test_lazy_package.service"
+PLUGIN_PACKAGE = "tests.test_lazy_plugin_package"
+
+
+class TestCondition:
+    def test_profiles(self):
+        condition = Condition(profiles=["worker", "cli"])
+        assert condition.matches({"worker"})
+        assert not condition.matches({"api"})
+        assert Condition().matches()
+
+    def test_env(self, monkeypatch):
+        monkeypatch.setenv("PERSICA_TEST_MODE", "on")
+        assert Condition(env="PERSICA_TEST_MODE").matches()
+        assert Condition(env="PERSICA_TEST_MODE=on").matches()
+        assert not Condition(env="PERSICA_TEST_MODE=off").matches()
+        assert not Condition(env=["PERSICA_TEST_MODE", "PERSICA_TEST_MISSING"]).matches()
+
+    def test_requires(self):
+        assert Condition(requires="networkx").matches()
+        assert not Condition(requires=["networkx", "persica_missing_dependency"]).matches()
+
+
+class TestDefinitionRegistry:
+    def test_inactive_module_is_not_imported(self):
+        scanner = ClassPathScanner(default_base_packages=["tests.test_package"])
+        scanner.flash()
+        factory = AbstractAutowireCapableFactory()
+        DefinitionRegistry(factory, scanner, profiles=[]).flash()
+        assert CONDITIONAL_MODULE not in sys.modules
+
+        DefinitionRegistry(factory, scanner, profiles=["worker"]).flash()
+        module = sys.modules[CONDITIONAL_MODULE]
+        assert module.WorkerComponent in factory.object_definitions
+
+    def test_lazy_registration(self):
+        scanner = ClassPathScanner(default_base_packages=["tests.test_lazy_package"])
+        scanner.flash()
+        factory = AbstractAutowireCapableFactory()
+        DefinitionRegistry(factory, scanner, lazy=True).flash()
+        factory.instantiate_all_objects()
+        assert LAZY_MODULE not in sys.modules
+        definition = factory.lazy_definitions[f"{LAZY_MODULE}.LazyService"]
+        assert definition.order == 1
+        assert not definition.is_loaded
+
+        service = factory.get_object(f"{LAZY_MODULE}.LazyService")
+        module = sys.modules[LAZY_MODULE]
+        assert isinstance(service, module.LazyService)
+        assert isinstance(service.repository, module.LazyRepository)
+        assert factory.lazy_definitions == {}
+
+    def test_lazy_subtype_injection(self):
+        scanner = ClassPathScanner(default_base_packages=[PLUGIN_PACKAGE])
+        scanner.flash()
+        factory = AbstractAutowireCapableFactory()
+        DefinitionRegistry(factory, scanner, lazy=True).flash()
+        factory.instantiate_all_objects()
+        host = factory.get_object(f"{PLUGIN_PACKAGE}.host.PluginHost")
+        # 按基类注入前根据扫描得到的继承关系导入所有候选实现
+        module = sys.modules[f"{PLUGIN_PACKAGE}.plugins"]
+        assert isinstance(host.storage, module.MemoryStorage)
+        assert [type(plugin) for plugin in host.plugins] == [module.SecondPlugin, module.FirstPlugin]
+
+    def test_import_status_per_registry(self):
+        scanner = ClassPathScanner(default_base_packages=[PLUGIN_PACKAGE])
+        scanner.flash()
+        registry = DefinitionRegistry(AbstractAutowireCapableFactory(), scanner)
+        registry.flash()
+        other = DefinitionRegistry(AbstractAutowireCapableFactory(), scanner)
+        assert registry.import_module_status
+        assert other.import_module_status == {}
+        registry.release()
+        assert registry.import_module_status == {}
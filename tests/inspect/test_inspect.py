@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+
+from persica.inspect.__main__ import main
+from persica.inspect.analyzer import StartupAnalyzer
+
+PACKAGE = "tests.test_inspect_package"
+MODULE = f"{PACKAGE}.components"
+SETTINGS = f"{MODULE}.Settings"
+DATABASE = f"{MODULE}.Database"
+USER_SERVICE = f"{MODULE}.UserService"
+AUDIT = f"{MODULE}.Audit"
+UNUSED = f"{MODULE}.Unused"
+# Database 的构造和初始化分别至少耗时 10ms 和 20ms
+DATABASE_CONSTRUCT = 0.01
+DATABASE_INITIALIZE = 0.02
+
+
+class TestStartupAnalyzer:
+    def test_static_analysis(self):
+        report = StartupAnalyzer([PACKAGE]).run()
+        assert report.cost_unit == "components"
+        assert report.components[USER_SERVICE].dependencies == [DATABASE, SETTINGS]
+        assert report.components[DATABASE].construct_seconds is None
+        never_injected = {x["name"]: x["entrypoint"] for x in report.to_dict()["never_injected"]}
+        assert never_injected[AUDIT] is True
+        assert never_injected[UNUSED] is False
+        assert SETTINGS not in never_injected
+        assert "instantiate" not in report.timings
+
+    def test_measure_startup(self):
+        report = StartupAnalyzer([PACKAGE], initialize=True).run()
+        database = report.components[DATABASE]
+        assert database.construct_seconds >= DATABASE_CONSTRUCT
+        assert database.initialize_seconds >= DATABASE_INITIALIZE
+        # 依赖对象的构造耗时不计入依赖方
+        assert report.components[USER_SERVICE].construct_seconds < DATABASE_CONSTRUCT
+        assert report.cost_unit == "seconds"
+        assert report.critical_path_cost >= DATABASE_CONSTRUCT + DATABASE_INITIALIZE
+        assert {"scan", "registry", "instantiate", "initialize"} <= report.timings.keys()
+
+    def test_cli_critical_path(self):
+        # 在独立的进程中运行，避免其他测试中定义的组件参与分析
+        result = subprocess.run(
+            [sys.executable, "-m", "persica.inspect", PACKAGE, "--initialize"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        data = json.loads(result.stdout)
+        assert data["critical_path"]["components"] == [SETTINGS, DATABASE, USER_SERVICE, AUDIT]
+        assert data["critical_path"]["unit"] == "seconds"
+        assert data["import_costs"][0]["module"] == MODULE
+
+    def test_cli_output(self, tmp_path, capsys):
+        assert main([PACKAGE, "--format", "dot"]) == 0
+        dot = capsys.readouterr().out
+        assert dot.startswith("digraph dependencies {")
+        assert f'"{SETTINGS}" -> "{DATABASE}"' in dot
+        output = tmp_path / "report.json"
+        assert main([PACKAGE, "--top", "1", "-o", str(output)]) == 0
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["packages"] == [PACKAGE]
+        assert len(data["import_costs"]) <= 1
+        assert data["class_graph"]["classes"] > 0
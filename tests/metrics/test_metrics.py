@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from persica.application import Application
+from persica.context.application import ApplicationContext
+from persica.factory.abstract import AbstractAutowireCapableFactory
+from persica.factory.component import AsyncInitializingComponent, BaseComponent
+from persica.factory.definition import ObjectDefinition
+from persica.metrics.endpoint import MetricsEndpoint
+from persica.metrics.registry import MetricsRegistry
+
+POOL_SIZE = 2
+
+
+class TestMetricsRegistry:
+    def test_render_prometheus_text(self):
+        metrics = MetricsRegistry()
+        counter = metrics.counter("requests_total", "Handled requests", ["path"])
+        counter.inc(path="/a")
+        counter.inc(2, path='/"b"')
+        metrics.gauge("temperature", "Current\ntemperature").set(1.5)
+        histogram = metrics.histogram("latency_seconds", "Latency", buckets=[0.1, 1])
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        text = metrics.render()
+        assert "# TYPE requests_total counter\n" in text
+        assert 'requests_total{path="/a"} 1.0\n' in text
+        assert 'requests_total{path="/\\"b\\""} 2.0\n' in text
+        assert "# HELP temperature Current\\ntemperature\n" in text
+        assert 'latency_seconds_bucket{le="0.1"} 1.0\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 2.0\n' in text
+        assert "latency_seconds_count 2.0\n" in text
+
+    def test_metric_validation(self):
+        metrics = MetricsRegistry(namespace="app")
+        counter = metrics.counter("events_total", "Events", ["topic"])
+        assert counter.name == "app_events_total"
+        assert metrics.counter("events_total", "Events", ["topic"]) is counter
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc(kind="x")
+        with pytest.raises(ValueError, match="already registered"):
+            metrics.gauge("events_total", "Events")
+
+
+class TestContainerMetrics:
+    async def test_lifecycle_metrics(self):
+        class Healthy(AsyncInitializingComponent):
+            pass
+
+        class Broken(AsyncInitializingComponent):
+            async def initialize(self):
+                raise RuntimeError("broken")
+
+        class Connection(BaseComponent, pool_size=POOL_SIZE):
+            pass
+
+        factory = AbstractAutowireCapableFactory()
+        factory.object_definitions = {cls: ObjectDefinition(class_object=cls) for cls in (Healthy, Broken, Connection)}
+        metrics = MetricsRegistry()
+        application = Application(
+            factory=factory, class_scanner=None, registry=None, context_class=ApplicationContext, metrics=metrics
+        )
+        factory.instantiate_all_objects()
+        await application.initialize()
+        await application.shutdown()
+        container_metrics = application.container_metrics
+        assert container_metrics.object_creation.get_count(component="Healthy") == 1
+        assert container_metrics.component_failures.get(component="Broken", phase="initialize") == 1
+        assert container_metrics.startup.get() > 0
+        text = metrics.render()
+        assert "persica_singletons 2.0\n" in text
+        assert f'persica_pool_size{{pool="Connection"}} {float(POOL_SIZE)}\n' in text
+        assert 'persica_component_shutdown_seconds{component="Healthy",status="completed"}' in text
+        assert factory.get_object(MetricsRegistry) is None
+        assert factory.external_objects[MetricsRegistry] is metrics
+
+
+class TestMetricsEndpoint:
+    async def test_serves_metrics(self):
+        class Metrics(MetricsEndpoint):
+            port = 0
+
+        metrics = MetricsRegistry()
+        metrics.counter("hits_total", "Hits").inc()
+        endpoint = Metrics(metrics)
+        await endpoint.initialize()
+        try:
+            reader, writer = await asyncio.open_connection(endpoint.host, endpoint.bound_port)
+            writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        finally:
+            await endpoint.shutdown()
+        assert response.startswith(b"HTTP/1.1 200 OK\r\n")
+        assert response.endswith(b"hits_total 1.0\n")
@@ -0,0 +1,426 @@
+"""
+扫描器的差分测试工具：随机生成包结构，将 ClassPathScanner 静态得到的 ClassGraph
+与导入后通过 __subclasses__() 得到的实际继承关系进行比较，并记录每种配置的扫描吞吐量。
+
+生成的包覆盖以下写法：别名导入、属性形式的父类、泛型、相对导入、条件定义的类和较深的继承链。
+同一个包可以分别以源码、只有字节码和 zip 归档三种形式扫描，优化后的扫描器可以通过 scanner_class 替换，
+与基准结果比较：
+
+    python -m tests.scanner.harness --seeds 5 --modules 200
+"""
+
+import argparse
+import importlib
+import py_compile
+import random
+import sys
+import tempfile
+import time
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+from persica.scanner.path import ClassPathScanner
+
+LAYOUTS = ("source", "bytecode", "zip")
+# 引用其他模块中的父类的方式
+REFERENCE_STYLES = ("from", "alias", "module_alias", "attribute", "relative", "relative_module")
+# 祖先数量达到该值的类计为较深的继承链
+DEEP_INHERITANCE = 5
+
+
+class GeneratorConfig:
+    def __init__(
+        self,
+        seed: int = 0,
+        modules: int = 20,
+        classes_per_module: int = 4,
+        max_package_depth: int = 3,
+        package_ratio: float = 0.2,
+        root_ratio: float = 0.15,
+        chain_ratio: float = 0.5,
+        generic_ratio: float = 0.2,
+        multiple_ratio: float = 0.1,
+        conditional_ratio: float = 0.1,
+        styles: tuple[str, ...] = REFERENCE_STYLES,
+    ):
+        self.seed = seed
+        self.modules = modules
+        self.classes_per_module = classes_per_module
+        self.max_package_depth = max_package_depth
+        # 新模块作为子包的概率
+        self.package_ratio = package_ratio
+        # 类没有包内父类的概率
+        self.root_ratio = root_ratio
+        # 父类选择最近定义的类的概率，用于生成较深的继承链
+        self.chain_ratio = chain_ratio
+        self.generic_ratio = generic_ratio
+        self.multiple_ratio = multiple_ratio
+        self.conditional_ratio = conditional_ratio
+        self.styles = styles
+
+
+class GeneratedClass:
+    def __init__(self, name: str, module: str, parents: list["GeneratedClass"], generic: bool):
+        self.name = name
+        self.module = module
+        # 导入后实际生效的父类
+        self.parents = parents
+        self.generic = generic
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.module}.{self.name}"
+
+    def get_ancestors(self) -> set[str]:
+        result: set[str] = set()
+        stack = list(self.parents)
+        while stack:
+            parent = stack.pop()
+            if parent.full_name not in result:
+                result.add(parent.full_name)
+                stack.extend(parent.parents)
+        return result
+
+
+class GeneratedModule:
+    def __init__(self, name: str, is_package: bool):
+        self.name = name
+        self.is_package = is_package
+        self.imports: list[str] = []
+        self.body: list[str] = []
+        # 模块中的局部名称，key 为引用的目标，避免重复导入
+        self.references: dict[tuple[str, str], str] = {}
+
+    @property
+    def package(self) -> str:
+        return self.name if self.is_package else self.name.rpartition(".")[0]
+
+    @property
+    def path(self) -> str:
+        parts = self.name.split(".")
+        if self.is_package:
+            return "/".join([*parts, "__init__.py"])
+        return "/".join(parts) + ".py"
+
+    def render(self) -> str:
+        header = ["from typing import Generic, TypeVar", *self.imports, "", 'T = TypeVar("T")', ""]
+        return "\n".join(header + self.body) + "\n"
+
+
+class GeneratedPackage:
+    def __init__(self, root: str):
+        self.root = root
+        # 按导入顺序排列，模块只会导入排在它之前的模块
+        self.modules: list[GeneratedModule] = []
+        self.classes: dict[str, GeneratedClass] = {}
+        # 条件定义中没有生效的分支产生的继承关系，静态扫描无法区分，允许出现
+        self.conditional_edges: set[tuple[str, str]] = set()
+        # 每种写法生成的次数
+        self.features: Counter[str] = Counter()
+
+    def get_files(self) -> dict[str, str]:
+        return {module.path: module.render() for module in self.modules}
+
+
+class PackageGenerator:
+    """
+    根据配置和随机种子生成包结构，相同的配置总是生成相同的包。
+    """
+
+    def __init__(self, root: str, config: GeneratorConfig):
+        self.root = root
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.package = GeneratedPackage(root)
+        self._counter = 0
+
+    def generate(self) -> GeneratedPackage:
+        config = self.config
+        packages = [self._add_module(self.root, True)]
+        for index in range(1, config.modules):
+            parent = self.random.choice(packages)
+            if self.random.random() < config.package_ratio and parent.name.count(".") + 1 < config.max_package_depth:
+                packages.append(self._add_module(f"{parent.name}.pkg{index}", True))
+            else:
+                self._add_module(f"{parent.name}.mod{index}", False)
+        for module in self.package.modules:
+            for _ in range(config.classes_per_module):
+                self._add_class(module)
+        return self.package
+
+    def _add_module(self, name: str, is_package: bool) -> GeneratedModule:
+        module = GeneratedModule(name, is_package)
+        self.package.modules.append(module)
+        return module
+
+    def _next_name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _choose_parent(self, candidates: list[GeneratedClass]) -> GeneratedClass:
+        if self.random.random() < self.config.chain_ratio:
+            return candidates[-1]
+        return self.random.choice(candidates)
+
+    def _add_class(self, module: GeneratedModule):
+        config = self.config
+        candidates = list(self.package.classes.values())
+        name = self._next_name("C")
+        if not candidates or self.random.random() < config.root_ratio:
+            generic = self.random.random() < config.generic_ratio
+            self._add_definition(module, name, [], ["Generic[T]"] if generic else [], generic)
+            return
+        if len(candidates) > 1 and self.random.random() < config.conditional_ratio:
+            self._add_conditional(module, name, candidates)
+            return
+        parents = [self._choose_parent(candidates)]
+        if self.random.random() < config.multiple_ratio:
+            # 父类之间没有共同祖先时 MRO 总是一致的
+            ancestors = parents[0].get_ancestors() | {parents[0].full_name}
+            unrelated = [x for x in candidates if not (x.get_ancestors() | {x.full_name}) & ancestors]
+            if unrelated:
+                parents.append(self.random.choice(unrelated))
+                self.package.features["multiple"] += 1
+        bases = []
+        generic = False
+        for parent in parents:
+            base, parameter = self._get_base(module, parent)
+            bases.append(base)
+            generic = generic or parameter == "T"
+        self._add_definition(module, name, parents, bases, generic)
+
+    def _add_conditional(self, module: GeneratedModule, name: str, candidates: list[GeneratedClass]):
+        first, second = self.random.sample(candidates, 2)
+        flag = self._next_name("FLAG")
+        taken = self.random.choice((True, False))
+        first_base, _ = self._get_base(module, first, generic=False)
+        second_base, _ = self._get_base(module, second, generic=False)
+        module.body.extend(
+            [
+                f"{flag} = {taken}",
+                f"if {flag}:",
+                f"    class {name}({first_base}):",
+                "        pass",
+                "else:",
+                f"    class {name}({second_base}):",
+                "        pass",
+                "",
+            ]
+        )
+        parent, skipped = (first, second) if taken else (second, first)
+        generated = GeneratedClass(name, module.name, [parent], False)
+        self.package.classes[generated.full_name] = generated
+        self.package.conditional_edges.add((skipped.full_name, generated.full_name))
+        self.package.features["conditional"] += 1
+
+    def _add_definition(
+        self, module: GeneratedModule, name: str, parents: list[GeneratedClass], bases: list[str], generic: bool
+    ):
+        module.body.extend([f"class {name}({', '.join(bases)}):", "    pass", ""])
+        generated = GeneratedClass(name, module.name, parents, generic)
+        self.package.classes[generated.full_name] = generated
+        if len(generated.get_ancestors()) >= DEEP_INHERITANCE:
+            self.package.features["deep"] += 1
+
+    def _get_base(self, module: GeneratedModule, parent: GeneratedClass, generic: bool = True) -> tuple[str, str]:
+        """
+        返回在 module 中引用 parent 的父类表达式及泛型参数。
+        """
+        reference = self._get_reference(module, parent)
+        if not parent.generic:
+            return reference, ""
+        parameter = self.random.choice(("int", "T")) if generic else "int"
+        self.package.features["generic"] += 1
+        return f"{reference}[{parameter}]", parameter
+
+    def _get_reference(self, module: GeneratedModule, parent: GeneratedClass) -> str:
+        if parent.module == module.name:
+            self.package.features["local"] += 1
+            return parent.name
+        styles = list(self.config.styles)
+        if parent.module == self._get_relative_common(module, parent.module) and "relative_module" in styles:
+            # 父类位于当前模块的上级包中，无法以子模块的形式相对导入
+            styles.remove("relative_module")
+        style = self.random.choice(styles) if styles else "from"
+        key = (style, parent.full_name if style in ("from", "alias", "relative") else parent.module)
+        local = module.references.get(key)
+        if local is None:
+            local = self._add_import(module, parent, style)
+            module.references[key] = local
+        self.package.features[style] += 1
+        if style in ("from", "alias", "relative"):
+            return local
+        return f"{local}.{parent.name}"
+
+    def _add_import(self, module: GeneratedModule, parent: GeneratedClass, style: str) -> str:
+        if style == "from":
+            module.imports.append(f"from {parent.module} import {parent.name}")
+            return parent.name
+        if style == "alias":
+            alias = self._next_name("Alias")
+            module.imports.append(f"from {parent.module} import {parent.name} as {alias}")
+            return alias
+        if style == "module_alias":
+            alias = self._next_name("m")
+            module.imports.append(f"import {parent.module} as {alias}")
+            return alias
+        if style == "attribute":
+            module.imports.append(f"import {parent.module}")
+            return parent.module
+        common = self._get_relative_common(module, parent.module)
+        level = module.package.count(".") - common.count(".") + 1
+        rest = parent.module[len(common) + 1 :] if parent.module != common else ""
+        if style == "relative":
+            module.imports.append(f"from {'.' * level}{rest} import {parent.name}")
+            return parent.name
+        package, _, leaf = rest.rpartition(".")
+        alias = self._next_name("r")
+        module.imports.append(f"from {'.' * level}{package} import {leaf} as {alias}")
+        return alias
+
+    @staticmethod
+    def _get_relative_common(module: GeneratedModule, target: str) -> str:
+        """
+        当前模块所在的包与目标模块的最长公共包。
+        """
+        common = []
+        for left, right in zip(module.package.split("."), target.split("."), strict=False):
+            if left != right:
+                break
+            common.append(left)
+        return ".".join(common)
+
+
+class HarnessResult:
+    def __init__(self, layout: str, config: GeneratorConfig, package: GeneratedPackage):
+        self.layout = layout
+        self.config = config
+        self.package = package
+        # 扫描耗时（秒），不包含生成和导入
+        self.seconds: float = 0.0
+        # 运行时存在但静态扫描缺失的类和继承关系
+        self.missing_classes: set[str] = set()
+        self.missing_edges: set[tuple[str, str]] = set()
+        # 静态扫描多出的继承关系，条件定义中没有生效的分支除外
+        self.unexpected_edges: set[tuple[str, str]] = set()
+
+    @property
+    def modules(self) -> int:
+        return len(self.package.modules)
+
+    @property
+    def throughput(self) -> float:
+        """每秒扫描的模块数量"""
+        return self.modules / self.seconds if self.seconds else float("inf")
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing_classes or self.missing_edges or self.unexpected_edges)
+
+
+def materialize(package: GeneratedPackage, layout: str, directory: Path) -> str:
+    """
+    将包写入 directory，返回需要加入 sys.path 的路径。
+    """
+    files = package.get_files()
+    if layout == "zip":
+        archive = directory / f"{package.root}.zip"
+        with zipfile.ZipFile(archive, "w") as file:
+            for path, source in files.items():
+                file.writestr(path, source)
+        return str(archive)
+    for path, source in files.items():
+        target = directory / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(source, encoding="utf-8")
+        if layout == "bytecode":
+            # 与源码放在同一目录的 pyc 在没有源码时可以被直接导入
+            py_compile.compile(str(target), cfile=str(target) + "c", doraise=True)
+            target.unlink()
+    return str(directory)
+
+
+def run_harness(
+    config: GeneratorConfig,
+    layout: str,
+    directory: Path,
+    scanner_class: type[ClassPathScanner] = ClassPathScanner,
+) -> HarnessResult:
+    """
+    生成包并扫描，导入所有模块后比较静态扫描结果与运行时的继承关系。
+    """
+    root = f"persica_harness_{layout}_{config.seed}"
+    package = PackageGenerator(root, config).generate()
+    result = HarnessResult(layout, config, package)
+    path = materialize(package, layout, directory)
+    sys.path.insert(0, path)
+    importlib.invalidate_caches()
+    try:
+        scanner = scanner_class([root])
+        start = time.perf_counter()
+        scanner.flash()
+        result.seconds = time.perf_counter() - start
+        _compare(result, scanner)
+    finally:
+        sys.path.remove(path)
+        sys.path_importer_cache.pop(path, None)
+        for name in [x for x in sys.modules if x == root or x.startswith(f"{root}.")]:
+            del sys.modules[name]
+    return result
+
+
+def _compare(result: HarnessResult, scanner: ClassPathScanner):
+    package = result.package
+    for module in package.modules:
+        importlib.import_module(module.name)
+    # 运行时的类，条件定义的类只有生效的分支
+    classes = {
+        getattr(sys.modules[generated.module], generated.name): name for name, generated in package.classes.items()
+    }
+    runtime = {
+        (name, classes[subclass])
+        for cls, name in classes.items()
+        for subclass in cls.__subclasses__()
+        if subclass in classes
+    }
+    graph = scanner.class_graph
+    names = set(package.classes)
+    static = {(parent, child) for parent, child in graph.graph.edges if parent in names and child in names}
+    result.missing_classes = names - graph.class_to_module.keys()
+    result.missing_edges = runtime - static
+    result.unexpected_edges = static - runtime - package.conditional_edges
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the static class graph with the runtime subclasses.")
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--modules", type=int, default=100)
+    parser.add_argument("--classes", type=int, default=4, help="classes per module")
+    parser.add_argument("--layout", choices=LAYOUTS, action="append", dest="layouts")
+    args = parser.parse_args(argv)
+    failed = False
+    print(f"{'layout':<10}{'seed':>6}{'modules':>9}{'classes':>9}{'ms':>10}{'modules/s':>12}  result")
+    for layout in args.layouts or LAYOUTS:
+        for seed in range(args.seeds):
+            config = GeneratorConfig(seed=seed, modules=args.modules, classes_per_module=args.classes)
+            with tempfile.TemporaryDirectory() as directory:
+                result = run_harness(config, layout, Path(directory))
+            status = (
+                "ok"
+                if result.ok
+                else (
+                    f"missing {len(result.missing_classes)} classes, {len(result.missing_edges)} edges, "
+                    f"unexpected {len(result.unexpected_edges)} edges"
+                )
+            )
+            failed = failed or not result.ok
+            print(
+                f"{layout:<10}{seed:>6}{result.modules:>9}{len(result.package.classes):>9}"
+                f"{result.seconds * 1000:>10.1f}{result.throughput:>12.0f}  {status}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
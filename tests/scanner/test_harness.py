@@ -0,0 +1,25 @@
+import pytest
+
+from tests.scanner.harness import LAYOUTS, REFERENCE_STYLES, GeneratorConfig, PackageGenerator, run_harness
+
+SEEDS = (0, 1, 2)
+MODULES = 30
+
+
+class TestScannerHarness:
+    def test_generator_covers_all_features(self):
+        package = PackageGenerator("harness", GeneratorConfig(seed=SEEDS[0], modules=MODULES)).generate()
+        expected = {*REFERENCE_STYLES, "local", "generic", "multiple", "conditional", "deep"}
+        assert expected <= {name for name, count in package.features.items() if count}
+        # 相同的种子生成相同的包
+        again = PackageGenerator("harness", GeneratorConfig(seed=SEEDS[0], modules=MODULES)).generate()
+        assert again.get_files() == package.get_files()
+
+    @pytest.mark.parametrize("layout", LAYOUTS)
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_static_graph_matches_runtime(self, tmp_path, record_property, layout, seed):
+        result = run_harness(GeneratorConfig(seed=seed, modules=MODULES), layout, tmp_path)
+        record_property("modules_per_second", round(result.throughput))
+        assert result.missing_classes == set()
+        assert result.missing_edges == set()
+        assert result.unexpected_edges == set()
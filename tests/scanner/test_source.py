@@ -0,0 +1,102 @@
+import ast
+import marshal
+import sys
+import zipfile
+from importlib.util import MAGIC_NUMBER
+
+import pytest
+
+from persica.scanner.bytecode import code_to_module
+from persica.scanner.graph import ClassGraph
+from persica.scanner.path import ClassPathScanner
+from persica.scanner.visitor import ClassVisitor
+
+SAMPLE_SOURCE = """
+import a.b as c
+import x.y
+from typing import Generic
+from pkg import Base as B, Other
+
+class First(B, c.Mixin, Generic[T], order=1, profiles=["worker", "api"], env="KEY"):
+    def method(self):
+        return super().method()
+
+if flag:
+    class Second(x.y.Base):
+        class Inner(Other):
+            pass
+else:
+    class Second(Other):
+        pass
+
+def factory():
+    class Local(B):
+        pass
+    return Local
+
+class Third(make(B), Other):
+    pass
+"""
+
+
+def visit(tree: ast.Module) -> tuple[set, dict, dict, dict]:
+    graph = ClassGraph()
+    visitor = ClassVisitor(graph, "sample")
+    visitor.visit(tree)
+    conditions = {key: repr(value) for key, value in graph.class_to_condition.items()}
+    return set(graph.graph.edges), visitor.imports, conditions, dict(graph.class_to_order)
+
+
+def make_pyc(source: str) -> bytes:
+    code = compile(source, "<archive>", "exec")
+    return MAGIC_NUMBER + b"\0" * 12 + marshal.dumps(code)
+
+
+class TestBytecode:
+    def test_code_object_matches_source(self):
+        expected = visit(ast.parse(SAMPLE_SOURCE))
+        assert visit(code_to_module(compile(SAMPLE_SOURCE, "sample.py", "exec"))) == expected
+        edges = expected[0]
+        assert ("pkg.Base", "sample.First") in edges
+        assert ("x.y.Base", "sample.Second") in edges
+        assert ("pkg.Other", "sample.Third") in edges
+
+
+class TestArchiveScanning:
+    @pytest.fixture
+    def archive(self, tmp_path, monkeypatch):
+        path = tmp_path / "app.pyz"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("zipped_app/__init__.py", "")
+            archive.writestr("vendor/big.py", "class Vendored:\n    pass\n")
+            archive.writestr("zipped_app/base.py", "class Base:\n    pass\n")
+            archive.writestr(
+                "zipped_app/impl.py", "from zipped_app.base import Base\n\nclass Impl(Base, order=2):\n    pass\n"
+            )
+            archive.writestr(
+                "zipped_app/compiled.pyc",
+                make_pyc("from zipped_app import base\n\nclass Compiled(base.Base):\n    pass\n"),
+            )
+        monkeypatch.syspath_prepend(str(path))
+        yield path
+        for name in [name for name in sys.modules if name.startswith("zipped_app")]:
+            del sys.modules[name]
+
+    def test_scan_zip_archive(self, archive):
+        scanner = ClassPathScanner(default_base_packages=["zipped_app"])
+        scanner.flash()
+        edges = set(scanner.class_graph.graph.edges)
+        assert ("zipped_app.base.Base", "zipped_app.impl.Impl") in edges
+        assert ("zipped_app.base.Base", "zipped_app.compiled.Compiled") in edges
+        assert scanner.class_graph.class_to_order["zipped_app.impl.Impl"] == 2  # noqa: PLR2004
+        contents = scanner.source_reader._archives[str(archive)]
+        assert scanner.source_reader.archive_cache[contents.digest] is contents
+        # 只读取扫描的包目录下的成员
+        assert "zipped_app/impl" in contents._sources
+        assert "vendor/big" not in contents._sources
+        # 缓存属于每个扫描器，释放后清空
+        other = ClassPathScanner(default_base_packages=["zipped_app"])
+        other.flash()
+        assert other.source_reader._archives[str(archive)] is not contents
+        scanner.release()
+        assert scanner.source_reader.archive_cache == {}
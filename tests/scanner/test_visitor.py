@@ -32,6 +32,28 @@ class Derived(om.BaseClass):
     pass
 """
 
+test_extract_condition_source_code = """
+from persica.factory.component import BaseComponent
+
+class Worker(BaseComponent, profiles=["worker"], requires=("redis",), order=1):
+    pass
+
+class Dynamic(BaseComponent, profiles=get_profiles()):
+    pass
+"""
+
+test_relative_import_source_code = """
+from .base import BaseClass
+from .. import other
+from ....outside import Unknown
+
+class Derived(BaseClass):
+    pass
+
+class Attribute(other.OtherClass):
+    pass
+"""
+
 
 class TestClassVisitor:
     def test_visit_simple_class(self):
@@ -61,3 +83,32 @@ class TestClassVisitor:
         visitor = ClassVisitor(graph, "module.test")
         visitor.visit(tree)
         assert ("other.module.BaseClass", "module.test.Derived") in graph.graph.edges
+
+    def test_extract_condition(self):
+        tree = ast.parse(test_extract_condition_source_code)
+        graph = ClassGraph()
+        visitor = ClassVisitor(graph, "module.test")
+        visitor.visit(tree)
+        condition = graph.get_condition("module.test.Worker")
+        assert condition.profiles == {"worker"}
+        assert condition.requires == ("redis",)
+        # 无法静态求值的条件留到运行时判断
+        assert graph.get_condition("module.test.Dynamic") is None
+
+    def test_relative_import(self):
+        tree = ast.parse(test_relative_import_source_code)
+        graph = ClassGraph()
+        visitor = ClassVisitor(graph, "package.sub.module")
+        visitor.visit(tree)
+        assert ("package.sub.base.BaseClass", "package.sub.module.Derived") in graph.graph.edges
+        assert ("package.other.OtherClass", "package.sub.module.Attribute") in graph.graph.edges
+        # 超出顶层包的相对导入被忽略
+        assert "Unknown" not in visitor.imports
+
+    def test_relative_import_in_package(self):
+        tree = ast.parse(test_relative_import_source_code)
+        graph = ClassGraph()
+        visitor = ClassVisitor(graph, "package.sub", is_package=True)
+        visitor.visit(tree)
+        assert ("package.sub.base.BaseClass", "package.sub.Derived") in graph.graph.edges
+        assert ("package.other.OtherClass", "package.sub.Attribute") in graph.graph.edges
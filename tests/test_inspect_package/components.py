@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+from persica.context.bus import subscribe
+from persica.factory.component import AsyncInitializingComponent, BaseComponent
+
+
+class Settings(BaseComponent):
+    pass
+
+
+class Database(AsyncInitializingComponent):
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        time.sleep(0.01)
+
+    async def initialize(self):
+        await asyncio.sleep(0.02)
+
+
+class UserService(BaseComponent):
+    def __init__(self, database: Database, settings: Settings):
+        self.database = database
+        self.settings = settings
+
+
+class Audit(BaseComponent):
+    def __init__(self, users: UserService):
+        self.users = users
+
+    @subscribe("users")
+    async def on_user(self, event: object):
+        pass
+
+
+class Unused(BaseComponent):
+    pass
@@ -0,0 +1,45 @@
+import asyncio
+
+from persica.context.bus import subscribe
+from persica.context.supervisor import background_task
+from persica.factory.component import AsyncInitializingComponent, BaseComponent
+
+# 非字面量的加载顺序无法在扫描时静态提取
+WORKER_ORDER = 2
+
+
+class LazyListener(BaseComponent):
+    def __init__(self):
+        self.events = []
+
+    @subscribe("lazy")
+    async def handle(self, event):
+        self.events.append(event)
+
+
+class LazyWorker(AsyncInitializingComponent, order=WORKER_ORDER):
+    def __init__(self, listener: LazyListener):
+        self.listener = listener
+        self.initialized = False
+        self.events = []
+
+    async def initialize(self):
+        self.initialized = True
+
+    @subscribe("lazy")
+    async def handle(self, event):
+        self.events.append(event)
+
+    @background_task
+    async def run(self):
+        await asyncio.Event().wait()
+
+
+class LazyPoller(BaseComponent):
+    @background_task
+    async def poll(self):
+        await asyncio.Event().wait()
+
+
+class InactiveComponent(BaseComponent, env="PERSICA_TEST_LAZY_ACTIVE"):
+    pass
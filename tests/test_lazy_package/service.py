@@ -0,0 +1,10 @@
+from persica.factory.component import BaseComponent
+
+
+class LazyRepository(BaseComponent):
+    pass
+
+
+class LazyService(BaseComponent, order=1):
+    def __init__(self, repository: LazyRepository):
+        self.repository = repository
@@ -0,0 +1,6 @@
+class Storage:
+    pass
+
+
+class Plugin:
+    pass
@@ -0,0 +1,8 @@
+from persica.factory.component import BaseComponent
+from tests.test_lazy_plugin_package.base import Plugin, Storage
+
+
+class PluginHost(BaseComponent):
+    def __init__(self, storage: Storage, plugins: list[Plugin]):
+        self.storage = storage
+        self.plugins = plugins
@@ -0,0 +1,14 @@
+from persica.factory.component import BaseComponent
+from tests.test_lazy_plugin_package.base import Plugin, Storage
+
+
+class MemoryStorage(Storage, BaseComponent):
+    pass
+
+
+class FirstPlugin(Plugin, BaseComponent, order=2):
+    pass
+
+
+class SecondPlugin(Plugin, BaseComponent, order=1):
+    pass
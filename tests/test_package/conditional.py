@@ -0,0 +1,5 @@
+from persica.factory.component import BaseComponent
+
+
+class WorkerComponent(BaseComponent, profiles=["worker"]):
+    pass